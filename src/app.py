@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 from ui.ui_theme import setup_theme
-from core.db import init_db
+from core.db import init_db, close_pool
 from ui.login_view import LoginView
 from ui.main_view import MainView
 
@@ -26,6 +26,7 @@ def main():
     view = LoginView(root, on_success=lambda user: open_main(root, user))
     view.pack(fill="both", expand=True)
     root.mainloop()
+    close_pool()
 
 if __name__ == "__main__":
     main()
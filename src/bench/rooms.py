@@ -0,0 +1,66 @@
+# src/bench/rooms.py
+# Derslik atama karşılaştırması (DB'siz, sentetik):
+#   - eski döngü: her sınavda boş oda + sığan oda listelerini kurup sıralar, exam_start sırası
+#   - assign_rooms: slot başına sıralı boş-kapasite indeksi + bisect, slot içinde büyük sınav önce
+#   - assign_rooms_optimal: slot başına min-cost eşleme (numpy/scipy varsa)
+# Çalıştırma (src içinden):  python -m bench.rooms [--rooms 300] [--exams 20000] [--slots 60]
+
+import argparse
+import random
+import time
+
+from core.scheduler.room_match import assign_rooms_optimal, matching_available, room_summary
+from core.scheduler.rooms import assign_rooms
+
+
+def _legacy(exams, rooms):
+    used_by_ts = {}
+    assigned = 0
+    for _ex_id, ts, need in sorted(exams, key=lambda e: e[1]):
+        used = used_by_ts.get(ts, set())
+        candidates = [(rid, rcode, cap) for (rid, rcode, cap) in rooms if rid not in used]
+        fits = [(rid, rcode, cap) for (rid, rcode, cap) in candidates if cap >= need]
+        if not fits:
+            continue
+        fits.sort(key=lambda x: x[2])
+        rid = fits[0][0]
+        used_by_ts.setdefault(ts, set()).add(rid)
+        assigned += 1
+    return assigned
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Derslik atama süresi ve yerleşen sınav sayısı")
+    ap.add_argument("--rooms", type=int, default=300)
+    ap.add_argument("--exams", type=int, default=20_000)
+    ap.add_argument("--slots", type=int, default=60)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    rnd = random.Random(args.seed)
+    rooms = [(i, f"D{i:04d}", rnd.choice((30, 40, 60, 80, 120, 200))) for i in range(1, args.rooms + 1)]
+    exams = [(i, rnd.randrange(args.slots), int(rnd.paretovariate(1.5) * 25)) for i in range(args.exams)]
+
+    t0 = time.perf_counter()
+    n_legacy = _legacy(exams, rooms)
+    t_legacy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    done, _failed = assign_rooms(exams, rooms, split=False)
+    t_new = time.perf_counter() - t0
+
+    print(f"rooms={args.rooms}  exams={args.exams}  slots={args.slots}")
+    print(f"eski döngü   : {t_legacy * 1000:9.1f} ms  atanan {n_legacy}")
+    print(f"assign_rooms : {t_new * 1000:9.1f} ms  atanan {len(done)}  "
+          f"boş koltuk {room_summary(rooms, done, _failed)['wasted_seats']}")
+
+    if matching_available():
+        t0 = time.perf_counter()
+        opt, opt_failed = assign_rooms_optimal(exams, rooms, split=False)
+        t_opt = time.perf_counter() - t0
+        print(f"optimal      : {t_opt * 1000:9.1f} ms  atanan {len(opt)}  "
+              f"boş koltuk {room_summary(rooms, opt, opt_failed)['wasted_seats']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# src/bench/startup.py
+# Açılış (init_db) süresi ölçümü: 100k dersli bir veritabanında
+#   - tüm migration'ların koştuğu ilk açılış (eski her-açılışta-her-şey davranışı)
+#   - güncel şemada açılış (tek user_version okuması)
+# Çalıştırma (src içinden):  python -m bench.startup [--courses 100000] [--repeat 20]
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from core import db, migrations
+
+
+def _fill_courses(n_courses: int):
+    with db.get_conn() as con:
+        dept_ids = [r[0] for r in con.execute("SELECT id FROM departments ORDER BY id")]
+        rows = (
+            (dept_ids[i % len(dept_ids)], f"BNC{i:06d}", f"Ders {i}", "", (i % 4) + 1, 1)
+            for i in range(n_courses)
+        )
+        con.executemany("""
+            INSERT INTO courses(dept_id, code, name, instructor, class_year, is_compulsory)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, rows)
+
+
+def _timed_init(repeat: int):
+    samples = []
+    for _ in range(repeat):
+        db.close_pool()                # soğuk açılış: bağlantı kurma maliyeti dahil
+        t0 = time.perf_counter()
+        db.init_db()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main():
+    ap = argparse.ArgumentParser(description="init_db açılış süresi ölçümü")
+    ap.add_argument("--courses", type=int, default=100_000)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db.configure_pool(Path(tmp) / "bench.db")
+        db.init_db()
+        _fill_courses(args.courses)
+
+        # Eski davranış: user_version=0 → tüm migration'lar (100k satırda dedup dahil)
+        full = []
+        for _ in range(max(1, args.repeat // 4)):
+            with db.get_conn() as con:
+                con.execute("PRAGMA user_version = 0")
+            full.extend(_timed_init(1))
+
+        uptodate = _timed_init(args.repeat)
+        db.close_pool()
+
+    print(f"courses={args.courses}  latest_version={migrations.LATEST_VERSION}")
+    print(f"tam migration      : medyan {statistics.median(full) * 1000:9.2f} ms  (n={len(full)})")
+    print(f"güncel şema açılışı: medyan {statistics.median(uptodate) * 1000:9.2f} ms  (n={len(uptodate)})")
+
+
+if __name__ == "__main__":
+    main()
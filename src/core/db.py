@@ -1,7 +1,8 @@
 import sqlite3
+import threading
 from pathlib import Path
 import hashlib
-from . import models
+from . import migrations
 from contextlib import contextmanager
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -9,81 +10,159 @@ DATA_DIR = BASE_DIR / "data"
 DATA_DIR.mkdir(exist_ok=True)
 DB_PATH = BASE_DIR / "data" / "app.db"
 
+# --- bağlantı havuzu ayarları ---
+POOL_SIZE = 4                 # iç içe/ek kullanım için boşta tutulacak en fazla bağlantı
+CACHED_STATEMENTS = 256       # bağlantı başına hazırlanmış ifade önbelleği
+BUSY_TIMEOUT = 5.0            # kilitli DB için bekleme (sn)
+
 
 # --- basit sha256 şifreleme ---
 def _hash_pw(pw: str) -> str:
     return hashlib.sha256(pw.encode("utf-8")).hexdigest()
 
 
+class ConnectionPool:
+    """
+    SQLite bağlantılarını yeniden kullanır.
+    - Her thread kendi bağlantısını tutar; aynı thread'deki ardışık
+      get_conn() çağrıları connect + PRAGMA maliyetini tekrar ödemez.
+    - Aynı thread içinde iç içe get_conn() açılırsa ayrı bir bağlantı verilir
+      (eski davranış: her blok kendi transaction'ı). Bunlar paylaşılan boşta
+      listesinde en fazla pool_size adet tutulur, fazlası kapatılır.
+    """
+
+    def __init__(self, path: str, pool_size: int = POOL_SIZE,
+                 cached_statements: int = CACHED_STATEMENTS, timeout: float = BUSY_TIMEOUT):
+        self.path = path
+        self.pool_size = max(0, int(pool_size))
+        self.cached_statements = int(cached_statements)
+        self.timeout = float(timeout)
+        self._local = threading.local()
+        self._idle = []               # paylaşılan boşta bağlantılar (LIFO)
+        self._all = set()             # kapatma için açık bağlantıların kaydı
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        con = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,  # havuzdan başka thread'e geçebilir (aynı anda tek kullanıcı)
+        )
+        con.execute("PRAGMA foreign_keys = ON")
+        with self._lock:
+            self._all.add(con)
+        return con
+
+    def acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise sqlite3.ProgrammingError("Bağlantı havuzu kapatılmış.")
+        con = getattr(self._local, "con", None)
+        if con is not None:
+            self._local.con = None    # thread'in bağlantısı şu an kullanımda
+            return con
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self._connect()
+
+    def release(self, con: sqlite3.Connection, broken: bool = False):
+        try:
+            busy = con.in_transaction     # commit/rollback sonrası açık işlem kalmamalı
+        except sqlite3.Error:
+            broken = True
+        if broken or self._closed or busy:
+            self._discard(con)
+            return
+        if getattr(self._local, "con", None) is None:
+            self._local.con = con
+            return
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(con)
+                return
+        self._discard(con)
+
+    def _discard(self, con: sqlite3.Connection):
+        with self._lock:
+            self._all.discard(con)
+        try:
+            con.close()
+        except Exception:
+            pass
+
+    def close(self):
+        """Tüm bağlantıları kapatır (uygulama çıkışı / testler / DB değişimi)."""
+        with self._lock:
+            self._closed = True
+            conns = list(self._all)
+            self._all.clear()
+            self._idle.clear()
+        for con in conns:
+            try:
+                con.close()
+            except Exception:
+                pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_PATH.as_posix())
+    return _pool
+
+
+def configure_pool(path=None, pool_size: int = POOL_SIZE, cached_statements: int = CACHED_STATEMENTS,
+                   timeout: float = BUSY_TIMEOUT) -> ConnectionPool:
+    """Havuzu yeni ayarlarla kurar; eski havuzdaki bağlantılar kapatılır."""
+    global _pool
+    with _pool_lock:
+        old = _pool
+        _pool = ConnectionPool(Path(path or DB_PATH).as_posix(), pool_size=pool_size,
+                               cached_statements=cached_statements, timeout=timeout)
+    if old is not None:
+        old.close()
+    return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, None
+    if old is not None:
+        old.close()
+
+
 @contextmanager
 def get_conn():
-    """SQLite bağlantısı oluşturur, foreign key açık, otomatik commit/rollback yapar."""
-    con = sqlite3.connect(DB_PATH.as_posix())
-    con.execute("PRAGMA foreign_keys = ON")
+    """Havuzdan SQLite bağlantısı verir, foreign key açık, otomatik commit/rollback yapar."""
+    pool = get_pool()
+    con = pool.acquire()
+    broken = False
     try:
         yield con
         con.commit()
     except Exception:
-        con.rollback()
+        try:
+            con.rollback()
+        except sqlite3.Error:
+            broken = True
         raise
     finally:
-        con.close()
+        pool.release(con, broken=broken)
 
 
 def init_db():
-    """Tabloları oluşturur ve başlangıç verilerini ekler."""
-
-    with get_conn() as con:
-        cur = con.cursor()
-
-        # 1) Tablolar
-        cur.execute(models.DEPARTMENTS_SQL)
-        cur.execute(models.USERS_SQL)
-        cur.execute(models.CLASSROOMS_SQL)
-        cur.execute(models.CLASSROOMS_INDEX_SQL)
-        cur.executescript(models.STUDENTS_SQL)
-        cur.executescript(models.COURSES_SQL)
-        cur.executescript(models.ENROLLMENTS_SQL)
-        cur.executescript(models.EXAMS_SQL)
-
-        _ensure_unique_course_index(con)
-        con.commit()
-
-        _add_exam_type_column_if_missing(con)  # <-- BURAYA EKLE
-        con.commit()
-
+    """Şemayı güncel sürüme taşır (bkz. core.migrations); güncel DB'de tek user_version okuması yapar."""
     with get_conn() as con:
-        _add_capacity_pdf_column_if_missing(con)
-
-    # 2) Tek noktadan seed
-    seed_admin()
-    seed_demo_coordinator()  # ✅ yeni eklendi
-
-def _ensure_unique_course_index(conn):
-    cur = conn.cursor()
-    # 1) Aynı bölümde aynı koddan çoğul kayıt varsa fazlaları sil (ilk id kalsın)
-    cur.execute("""
-        WITH dups AS (
-            SELECT id
-            FROM (
-                SELECT id,
-                       ROW_NUMBER() OVER (
-                         PARTITION BY dept_id, UPPER(REPLACE(code,' ','')) 
-                         ORDER BY id
-                       ) AS rn
-                FROM courses
-            )
-            WHERE rn > 1
-        )
-        DELETE FROM courses WHERE id IN (SELECT id FROM dups)
-    """)
-    # 2) UNIQUE index
-    cur.execute("""
-        CREATE UNIQUE INDEX IF NOT EXISTS idx_courses_dept_code
-        ON courses(dept_id, code)
-    """)
-    conn.commit()
-
+        migrations.migrate(con)
 
 
 def verify_user(email: str, password: str):
@@ -100,8 +179,12 @@ def verify_user(email: str, password: str):
         return None
 
 
-def seed_admin():
+def seed_admin(con=None):
     """Bölümleri ve varsayılan admin kullanıcısını ekler."""
+    if con is None:
+        with get_conn() as con:
+            return seed_admin(con)
+
     departments = [
         "Bilgisayar Mühendisliği",
         "Yazılım Mühendisliği",
@@ -113,58 +196,40 @@ def seed_admin():
     admin_email = "admin@kocaeli.edu.tr"
     admin_password = "Admin123!"
 
-    with get_conn() as con:
-        cur = con.cursor()
-
-        # Bölümleri ekle (varsa atla)
-        for name in departments:
-            cur.execute("INSERT OR IGNORE INTO departments(name) VALUES(?)", (name,))
+    cur = con.cursor()
 
-        # Admin var mı kontrol et
-        cur.execute("SELECT 1 FROM users WHERE email=?", (admin_email,))
-        if not cur.fetchone():
-            cur.execute("""
-                INSERT INTO users(email, password_hash, role, department_id)
-                VALUES (?, ?, 'admin', NULL)
-            """, (admin_email, _hash_pw(admin_password)))
+    # Bölümleri ekle (varsa atla)
+    for name in departments:
+        cur.execute("INSERT OR IGNORE INTO departments(name) VALUES(?)", (name,))
 
-        con.commit()
+    # Admin var mı kontrol et
+    cur.execute("SELECT 1 FROM users WHERE email=?", (admin_email,))
+    if not cur.fetchone():
+        cur.execute("""
+            INSERT INTO users(email, password_hash, role, department_id)
+            VALUES (?, ?, 'admin', NULL)
+        """, (admin_email, _hash_pw(admin_password)))
 
 
-def seed_demo_coordinator():
+def seed_demo_coordinator(con=None):
     """Bölüm koordinatörü örneği ekler."""
+    if con is None:
+        with get_conn() as con:
+            return seed_demo_coordinator(con)
+
     email = "koor.bilgisayar@kocaeli.edu.tr"
     password = "Koor123!"
 
-    with get_conn() as con:
-        cur = con.cursor()
-        cur.execute("SELECT id FROM departments WHERE name=?", ("Bilgisayar Mühendisliği",))
-        row = cur.fetchone()
-        if not row:
-            return
-        dept_id = row[0]
-
-        cur.execute("SELECT 1 FROM users WHERE email=?", (email,))
-        if not cur.fetchone():
-            cur.execute("""
-                INSERT INTO users(email, password_hash, role, department_id)
-                VALUES (?, ?, 'koordinator', ?)
-            """, (email, _hash_pw(password), dept_id))
-
-        con.commit()
-
-def _add_exam_type_column_if_missing(conn):
-    cur = conn.cursor()
-    cur.execute("PRAGMA table_info(exams);")
-    cols = [row[1] for row in cur.fetchall()]  # sütun adları
-    if "exam_type" not in cols:
-        cur.execute("ALTER TABLE exams ADD COLUMN exam_type TEXT DEFAULT 'Vize';")
-        conn.commit()
-
-def _add_capacity_pdf_column_if_missing(conn):
-    cur = conn.cursor()
-    cur.execute("PRAGMA table_info(classrooms);")
-    cols = [row[1] for row in cur.fetchall()]
-    if "capacity_pdf" not in cols:
-        cur.execute("ALTER TABLE classrooms ADD COLUMN capacity_pdf INTEGER;")
-        conn.commit()
+    cur = con.cursor()
+    cur.execute("SELECT id FROM departments WHERE name=?", ("Bilgisayar Mühendisliği",))
+    row = cur.fetchone()
+    if not row:
+        return
+    dept_id = row[0]
+
+    cur.execute("SELECT 1 FROM users WHERE email=?", (email,))
+    if not cur.fetchone():
+        cur.execute("""
+            INSERT INTO users(email, password_hash, role, department_id)
+            VALUES (?, ?, 'koordinator', ?)
+        """, (email, _hash_pw(password), dept_id))
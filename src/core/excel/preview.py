@@ -1,19 +1,45 @@
 import re
 import pandas as pd
-from typing import Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
 
-def try_preview_xlsx(path: str, n: int = 10) -> Tuple[Optional["pandas.DataFrame"], Optional[str]]:
+# İki aşamalı yükleme: önizleme/sütun eşleme yalnız başlık + ilk n satırı okur (openpyxl satır
+# okumayı n'de bırakır); tam sayfa arka planda ayrıştırılır, Dry-Run geldiğinde genelde hazırdır.
+PREVIEW_ROWS = 200   # önizleme + başlık tespiti + sütun eşleme için okunan satır (ekranda ilk 10)
+_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xlsx-load")
+
+
+def try_preview_xlsx(path: str, n: int = PREVIEW_ROWS) -> Tuple[Optional["pandas.DataFrame"], Optional[str]]:
+    """İlk çalışma sayfasının başlığı + ilk n satırı (n=None: tam sayfa)."""
     try:
         xl = pd.ExcelFile(path)
         if not xl.sheet_names:
             return None, "Çalışma sayfası bulunamadı."
-        df = xl.parse(xl.sheet_names[0])          # TAM SAYFAYI AÇ
-        return df, None                            # <-- head() YOK
+        df = xl.parse(xl.sheet_names[0], nrows=n)
+        return df, None
     except ModuleNotFoundError:
         return None, "pandas/openpyxl yüklü değil. Kurulum: pip install pandas openpyxl"
     except Exception as e:
         return None, f"Hata: {e}"
 
+
+def load_full_xlsx(path: str) -> Tuple[Optional["pandas.DataFrame"], Optional[str]]:
+    """Tam ilk sayfa (import/doğrulama için)."""
+    return try_preview_xlsx(path, n=None)
+
+
+def start_full_load(path: str, prepare: Optional[Callable] = None) -> "Future":
+    """
+    Tam sayfayı arka planda ayrıştırır. Future sonucu: (df, hata) — prepare verilirse df ona uygulanmış olarak
+    (önizlemedeki normalize/başlık onarımı aynı şekilde tam veriye de uygulanır).
+    """
+    def _run():
+        df, err = load_full_xlsx(path)
+        if err or df is None or prepare is None:
+            return df, err
+        return prepare(df), None
+    return _loader.submit(_run)
+
 def normalize_courses_df(df_raw: pd.DataFrame) -> pd.DataFrame:
     """
     Çok bloklu 'Ders Listesi' sayfasını tek tabloya dönüştürür.
@@ -0,0 +1,174 @@
+# src/core/excel/stream.py
+# Büyük Excel dosyaları için akış modu: openpyxl read-only ile ilk sayfa satır satır okunur,
+# STREAM_CHUNK satırlık parçalar halinde doğrulanır (core.excel.validate) ve her parça kendi
+# transaction'ında yazılır. Bellekte aynı anda yalnız bir parça bulunur; dosya boyutundan bağımsızdır.
+# Dry-Run doğrulanmış parçaları geçici bir dosyaya (spool) yazabilir; DB'ye Aktar onu okuyup yazar.
+
+import pickle
+from typing import Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from core.excel.validate import error_lines, validate_students
+
+STREAM_CHUNK = 5000
+STREAM_MIN_BYTES = 5 * 1024 * 1024   # bu boyuttan büyük öğrenci dosyaları UI'da akış modunda aktarılır
+ERROR_SAMPLE = 3                     # raporda tutulan ilk hata satırı sayısı
+
+
+def _header_names(values) -> List[str]:
+    """pd.read_excel ile aynı adlandırma: boş başlık → 'Unnamed: i', tekrar eden → 'X.1', 'X.2'."""
+    names, seen = [], {}
+    for i, v in enumerate(values):
+        name = f"Unnamed: {i}" if v is None or str(v).strip() == "" else str(v)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def read_xlsx_header(path: str) -> List[str]:
+    """İlk sayfanın başlık satırı (yalnız ilk satır okunur)."""
+    it = iter_xlsx_chunks(path, header_only=True)
+    try:
+        return next(it, [])
+    finally:
+        it.close()
+
+
+def iter_xlsx_chunks(path: str, chunk_rows: int = STREAM_CHUNK, header_only: bool = False) -> Iterator:
+    """
+    İlk sayfayı chunk_rows satırlık DataFrame'ler halinde verir: (başlangıç, df).
+    başlangıç: parçanın ilk satırının 0 tabanlı veri satırı (Excel satırı = başlangıç + validate.ROW_OFFSET).
+    Ortadaki boş satırlar pandas'taki gibi korunur, sondaki boş satırlar atılır.
+    header_only: yalnız başlık listesini verip durur.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        cols = _header_names(header)
+        if header_only:
+            yield cols
+            return
+
+        width = len(cols)
+        chunk, start, line, blank = [], 0, 0, 0
+        for values in rows:
+            if values is None or all(v is None or (isinstance(v, str) and not v.strip()) for v in values):
+                blank += 1        # sonda mı ortada mı, sonraki dolu satır belirler
+                continue
+            values = tuple(values[:width]) + (None,) * (width - len(values))
+            while blank:
+                chunk.append((None,) * width)
+                blank -= 1
+                line += 1
+                if len(chunk) >= chunk_rows:
+                    yield start, pd.DataFrame(chunk, columns=cols)
+                    chunk, start = [], line
+            chunk.append(values)
+            line += 1
+            if len(chunk) >= chunk_rows:
+                yield start, pd.DataFrame(chunk, columns=cols)
+                chunk, start = [], line
+        if chunk:
+            yield start, pd.DataFrame(chunk, columns=cols)
+    finally:
+        wb.close()
+
+
+def _chunk_rows(students: pd.DataFrame, enrollments: pd.DataFrame):
+    return (list(students[["number", "full_name", "class_year"]].itertuples(index=False, name=None)),
+            list(enrollments[["number", "code"]].itertuples(index=False, name=None)))
+
+
+def _write_chunk(dept_id: int, students, enrollments, course_of):
+    """Bir parça = bir transaction (get_conn bloğu sonunda commit)."""
+    from core.db import get_conn
+    from core.importers import import_student_enrollments
+
+    with get_conn() as con:
+        return import_student_enrollments(con, dept_id, students, enrollments, course_of=course_of)
+
+
+def _course_map(dept_id: int):
+    from core.db import get_conn
+    from core.importers import course_ids_by_code
+
+    with get_conn() as con:
+        return course_ids_by_code(con, dept_id)
+
+
+def stream_student_import(path: str, colmap: Dict[str, str], dept_id: Optional[int] = None,
+                          chunk_rows: int = STREAM_CHUNK,
+                          progress: Optional[Callable[[int], None]] = None,
+                          spool: Optional[str] = None) -> Dict:
+    """
+    Öğrenci/kayıt dosyasını parça parça doğrular; dept_id verilirse her parçayı ayrı transaction'da
+    yazar (import_student_enrollments), verilmezse yalnız doğrular (Dry-Run).
+    spool: doğrulanmış parçaların sırayla yazılacağı dosya; import_spooled onu Excel'i yeniden
+    ayrıştırmadan/doğrulamadan DB'ye aktarır (bellekte yine tek parça).
+    progress: her parçadan sonra o ana kadar okunan satır sayısıyla çağrılır.
+    Dönen: {"total", "ok", "warn", "missing": eşleşmeyen ders kodları, "errors": hata sayısı,
+            "error_lines": ilk ERROR_SAMPLE hata}
+    """
+    out = {"total": 0, "ok": 0, "warn": 0, "missing": set(), "errors": 0, "error_lines": []}
+    course_of = _course_map(dept_id) if dept_id is not None else None   # ders haritası akış başına bir kez
+    spool_file = open(spool, "wb") if spool else None
+    try:
+        for start, df in iter_xlsx_chunks(path, chunk_rows):
+            students, enrollments, errors = validate_students(df, colmap)
+            out["total"] += len(df)
+            out["errors"] += len(errors)
+            if len(out["error_lines"]) < ERROR_SAMPLE and not errors.empty:
+                errors["row"] += start
+                out["error_lines"] += error_lines(errors, ERROR_SAMPLE - len(out["error_lines"]))
+            skipped = len(df) - len(students)
+            stu_rows, enr_rows = _chunk_rows(students, enrollments)
+            if spool_file is not None:
+                pickle.dump((skipped, stu_rows, enr_rows), spool_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            if dept_id is None:
+                ok, not_found = len(stu_rows), 0
+            else:
+                ok, not_found, missing = _write_chunk(dept_id, stu_rows, enr_rows, course_of)
+                out["missing"] |= missing
+            out["ok"] += ok
+            out["warn"] += skipped + not_found
+            if progress is not None:
+                progress(out["total"])
+    finally:
+        if spool_file is not None:
+            spool_file.close()
+    return out
+
+
+def import_spooled(spool: str, dept_id: int, progress: Optional[Callable[[int], None]] = None) -> Dict:
+    """
+    stream_student_import(spool=...) ile doğrulanmış parçaları yazar: Excel okunmaz, doğrulama tekrarlanmaz.
+    Her parça ayrı transaction. Dönen: {"ok", "warn", "missing"}
+    """
+    out = {"ok": 0, "warn": 0, "missing": set()}
+    course_of = _course_map(dept_id)
+    done = 0
+    with open(spool, "rb") as f:
+        while True:
+            try:
+                skipped, stu_rows, enr_rows = pickle.load(f)
+            except EOFError:
+                break
+            ok, not_found, missing = _write_chunk(dept_id, stu_rows, enr_rows, course_of)
+            out["ok"] += ok
+            out["warn"] += skipped + not_found
+            out["missing"] |= missing
+            done += skipped + len(stu_rows)
+            if progress is not None:
+                progress(done)
+    return out
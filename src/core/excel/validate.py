@@ -0,0 +1,193 @@
+# src/core/excel/validate.py
+# Excel içe aktarımı için sütun bazlı (vektörel) doğrulama: satır satır iterrows yerine
+# her alan tek seferde pandas str/vektör işlemleriyle normalize edilir.
+# Çıktı: tipli, geçerli satırlar + satır başına hata tablosu (row = Excel satır no, başlık 1. satır).
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+ROW_OFFSET = 2   # DataFrame index 0 → Excel 2. satır
+ERROR_COLUMNS = ["row", "field", "error"]
+
+
+def as_text(col: pd.Series) -> pd.Series:
+    """Hücreleri metne çevirir; boş (NaN/None) → ''."""
+    return col.astype(object).where(col.notna(), "").astype(str)
+
+
+def norm_code(col: pd.Series) -> pd.Series:
+    """Ders kodu karşılaştırma formu: 'mat 101' / 'MAT-101' → 'MAT101'."""
+    return as_text(col).str.strip().str.upper().str.replace(r"[\s\-_]+", "", regex=True)
+
+
+def clean_number(col: pd.Series) -> pd.Series:
+    """Öğrenci numarası: rakam dışı atılır; Excel'in sayıya çevirdiği '210059017.0' → '210059017'."""
+    return (as_text(col).str.strip()
+            .str.replace(r"\.0+$", "", regex=True)
+            .str.replace(r"\D", "", regex=True))
+
+
+def to_year(col: pd.Series) -> pd.Series:
+    """'5', '5.0', '5. Sınıf' → 5 (ilk 1–8 rakamı); bulunamazsa <NA>."""
+    return pd.to_numeric(as_text(col).str.extract(r"([1-8])", expand=False)).astype("Int64")
+
+
+def _compulsory_one(val: str) -> int:
+    """Zorunlu(E/H) tek değer: SEÇ… → 0, ZORUNLU/E/EVET/1 → 1, H/HAYIR/0 → 0; belirsiz → 1."""
+    tr_map = str.maketrans({
+        "Ç": "C", "Ş": "S", "Ğ": "G", "İ": "I", "Ü": "U", "Ö": "O",
+        "ç": "C", "ş": "S", "ğ": "G", "ı": "I", "i": "I", "ü": "U", "ö": "O",
+    })
+    norm = "".join(ch for ch in (val or "").strip().upper().translate(tr_map) if ch.isalnum())
+    if "SEC" in norm:
+        return 0
+    if "ZORUNLU" in norm:
+        return 1
+    if norm in {"E", "EVET", "1", "TRUE", "T", "YES", "Z"}:
+        return 1
+    if norm in {"H", "HAYIR", "0", "FALSE", "F", "NO", "S"}:
+        return 0
+    if norm.startswith("Z"):
+        return 1
+    if norm.startswith("S"):
+        return 0
+    return 1
+
+
+def to_compulsory(col: pd.Series) -> pd.Series:
+    """Zorunluluk sütunu → 1/0; yorum yalnız farklı değerler için bir kez yapılır."""
+    text = as_text(col)
+    return text.map({v: _compulsory_one(v) for v in text.unique()}).astype("int64")
+
+
+def split_codes(col: pd.Series) -> pd.Series:
+    """'MAT101, FIZ102; BLM103' → satır index'i korunarak ders başına bir satır (explode), normalize kod."""
+    codes = as_text(col).str.replace(r"[;/]", ",", regex=True).str.split(r"[,\s]+", regex=True).explode()
+    codes = norm_code(codes)
+    return codes[codes != ""]
+
+
+def _error_table(index: pd.Index, checks: List[Tuple[pd.Series, str, str]]) -> pd.DataFrame:
+    """checks: [(hatalı satır maskesi, alan, mesaj)] → row/field/error tablosu (satır sıralı)."""
+    parts = [
+        pd.DataFrame({"row": index[mask.to_numpy()] + ROW_OFFSET, "field": field, "error": msg})
+        for mask, field, msg in checks if mask.any()
+    ]
+    if not parts:
+        return pd.DataFrame(columns=ERROR_COLUMNS)
+    return pd.concat(parts, ignore_index=True).sort_values("row", kind="stable").reset_index(drop=True)
+
+
+def _bad(checks) -> pd.Series:
+    bad = checks[0][0].copy()
+    for mask, _, _ in checks[1:]:
+        bad |= mask
+    return bad
+
+
+def validate_courses(df: pd.DataFrame, colmap: Dict[str, str],
+                     fixed_year: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    colmap: {"Kod", "Ad", "Sınıf(Yıl)", "Zorunlu(E/H)", "Öğretim Üyesi"} → DataFrame sütunu
+    fixed_year: verilirse tüm satırların sınıfı (Excel'deki yok sayılır)
+    Dönen: (geçerli [row, code, name, class_year, is_compulsory, instructor], hatalar [row, field, error])
+    """
+    df = df.reset_index(drop=True)
+    code = norm_code(df[colmap["Kod"]])
+    name = as_text(df[colmap["Ad"]]).str.strip()
+    if fixed_year:
+        year = pd.Series(int(fixed_year), index=df.index, dtype="Int64")
+    else:
+        year = to_year(df[colmap["Sınıf(Yıl)"]])
+
+    checks = [
+        (code == "", "Kod", "Ders kodu boş"),
+        (name == "", "Ad", "Ders adı boş"),
+        (year.isna(), "Sınıf(Yıl)", "Sınıf 1–8 arasında olmalı"),
+    ]
+    ok = ~_bad(checks)
+
+    valid = pd.DataFrame({
+        "row": df.index[ok.to_numpy()] + ROW_OFFSET,
+        "code": code[ok].to_numpy(),
+        "name": name[ok].to_numpy(),
+        "class_year": year[ok].astype("int64").to_numpy(),
+        "is_compulsory": to_compulsory(df.loc[ok, colmap["Zorunlu(E/H)"]]).to_numpy(),
+        "instructor": as_text(df.loc[ok, colmap["Öğretim Üyesi"]]).str.strip().to_numpy(),
+    })
+    return valid, _error_table(df.index, checks)
+
+
+def validate_students(df: pd.DataFrame, colmap: Dict[str, str]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    colmap: {"Numara", "Ad Soyad", "Sınıf(Yıl)", "Dersler(virgülle kodlar)"} → DataFrame sütunu
+    Dönen: (öğrenciler [row, number, full_name, class_year],
+            kayıtlar [row, number, code] (geçerli öğrenci satırlarının dersleri, explode),
+            hatalar [row, field, error])
+    """
+    df = df.reset_index(drop=True)
+    number = clean_number(df[colmap["Numara"]])
+    name = as_text(df[colmap["Ad Soyad"]]).str.strip()
+    year = to_year(df[colmap["Sınıf(Yıl)"]])
+
+    checks = [
+        (number == "", "Numara", "Numara boş"),
+        (name == "", "Ad Soyad", "Ad soyad boş"),
+        (year.isna(), "Sınıf(Yıl)", "Sınıf 1–8 arasında olmalı"),
+    ]
+    ok = ~_bad(checks)
+
+    students = pd.DataFrame({
+        "row": df.index[ok.to_numpy()] + ROW_OFFSET,
+        "number": number[ok].to_numpy(),
+        "full_name": name[ok].to_numpy(),
+        "class_year": year[ok].astype("int64").to_numpy(),
+    })
+    codes = split_codes(df.loc[ok, colmap["Dersler(virgülle kodlar)"]])
+    enrollments = pd.DataFrame({
+        "row": codes.index.to_numpy() + ROW_OFFSET,
+        "number": number.loc[codes.index].to_numpy(),
+        "code": codes.to_numpy(),
+    })
+    return students, enrollments, _error_table(df.index, checks)
+
+
+def source_key(path: str) -> Tuple[str, int, int]:
+    """Dosya kimliği: (mutlak yol, mtime_ns, boyut) — dosya değişirse anahtar da değişir."""
+    st = os.stat(path)
+    return os.path.abspath(path), st.st_mtime_ns, st.st_size
+
+
+def batch_key(source, kind: str, colmap: Dict[str, str], fixed_year: Optional[int] = None) -> tuple:
+    """Parti anahtarı: dosya kimliği + tür + sütun eşlemesi (+ dersler için sabit yıl)."""
+    return source, kind, tuple(sorted(colmap.items())), (fixed_year if kind == "courses" else None)
+
+
+def validate_batch(df: pd.DataFrame, kind: str, colmap: Dict[str, str], fixed_year: Optional[int] = None,
+                   source=None) -> Dict:
+    """
+    Bir kez doğrulanmış içe aktarma partisi; Dry-Run üretir, DB'ye Aktar aynen tüketir.
+    Dönen: {"key": batch_key(...), "kind", "total": satır sayısı,
+            "rows": geçerli dersler / öğrenciler, "enrollments": öğrenci kayıtları (yalnız students),
+            "errors": hata tablosu}
+    """
+    if kind == "courses":
+        rows, errors = validate_courses(df, colmap, fixed_year)
+        enrollments = None
+    else:
+        rows, enrollments, errors = validate_students(df, colmap)
+    return {
+        "key": batch_key(source, kind, colmap, fixed_year),
+        "kind": kind,
+        "total": len(df),
+        "rows": rows,
+        "enrollments": enrollments,
+        "errors": errors,
+    }
+
+
+def error_lines(errors: pd.DataFrame, limit: int = 3) -> List[str]:
+    """Hata tablosunun ilk satırları: ['satır 5: Numara boş', ...]"""
+    return [f"satır {r}: {e}" for r, e in errors[["row", "error"]].head(limit).itertuples(index=False)]
@@ -1,14 +1,15 @@
 # src/core/importers.py
 from __future__ import annotations
 import pandas as pd
-from typing import List, Dict, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from core.db import get_conn
+from core.scheduler.graph_cache import bump_data_version
+from core.scheduler.store import mark_dirty_courses
+from core.excel.stream import iter_xlsx_chunks, read_xlsx_header
+from core.excel.validate import as_text
 
 REQUIRED_STU_COLS = {"numara", "ad", "sınıf"}
 
-def _norm(s: str) -> str:
-    return (s or "").strip()
-
 def read_students_xlsx(path: str) -> Tuple[List[Dict], List[str]]:
     """
     Excel'den öğrencileri okur.
@@ -20,8 +21,7 @@ def read_students_xlsx(path: str) -> Tuple[List[Dict], List[str]]:
       rows: [{number, full_name, class_year}]
       errors: ["satır 5: ...", ...]
     """
-    df = pd.read_excel(path)
-    cols = {c.strip().lower(): c for c in df.columns}
+    cols = {c.strip().lower(): c for c in read_xlsx_header(path)}
 
     # başlık eşleştirme
     num_col = cols.get("numara") or cols.get("ogrenci no") or cols.get("öğrenci no")
@@ -35,29 +35,34 @@ def read_students_xlsx(path: str) -> Tuple[List[Dict], List[str]]:
     if missing:
         raise ValueError("Eksik başlık(lar): " + ", ".join(missing))
 
+    # sayfa read-only akışla parça parça okunur (core.excel.stream); tüm sayfa DataFrame'e alınmaz
     rows, errors = [], []
-    for i, r in df.iterrows():
-        ln = i + 2  # başlık satırı 1
-        number = _norm(str(r[num_col]))
-        full_name = _norm(str(r[name_col]))
-        try:
-            class_year = int(str(r[year_col]).strip())
-        except Exception:
-            class_year = -1
-
-        if not number:
-            errors.append(f"satır {ln}: Numara boş")
-            continue
-        if not full_name:
-            errors.append(f"satır {ln}: Ad/Ad Soyad boş")
-            continue
-        if class_year not in range(1, 9):
-            errors.append(f"satır {ln}: Sınıf 1..8 arasında olmalı (gelen={class_year})")
-            continue
+    for start, df in iter_xlsx_chunks(path):
+        r, e = _check_students(df, num_col, name_col, year_col, first_line=start + 2)
+        rows += r
+        errors += e
+    return rows, errors
 
-        rows.append({"number": number, "full_name": full_name, "class_year": class_year})
+def _check_students(df: pd.DataFrame, num_col: str, name_col: str, year_col: str,
+                    first_line: int) -> Tuple[List[Dict], List[str]]:
+    """Sütun bazlı doğrulama; her satır için ilk hata raporlanır (önceki satır döngüsüyle aynı sıra)."""
+    number = as_text(df[num_col]).str.strip()
+    full_name = as_text(df[name_col]).str.strip()
+    year_txt = as_text(df[year_col]).str.strip()
+    class_year = pd.to_numeric(year_txt.where(year_txt.str.fullmatch(r"[+-]?\d+"), "-1")).astype("int64")
+    bad_year = ~class_year.between(1, 8)
+    lines = pd.Series(range(first_line, first_line + len(df)), index=df.index)   # başlık satırı 1
 
-    return rows, errors
+    err = pd.Series("", index=df.index)
+    err = err.mask(bad_year, "satır " + lines.astype(str) + ": Sınıf 1..8 arasında olmalı (gelen="
+                   + class_year.astype(str) + ")")
+    err = err.mask(full_name == "", "satır " + lines.astype(str) + ": Ad/Ad Soyad boş")
+    err = err.mask(number == "", "satır " + lines.astype(str) + ": Numara boş")
+
+    ok = err == ""
+    rows = pd.DataFrame({"number": number[ok], "full_name": full_name[ok],
+                         "class_year": class_year[ok]}).to_dict("records")
+    return rows, err[~ok].tolist()
 
 def import_students(rows: List[Dict], dept_id: int) -> Tuple[int, int]:
     """
@@ -92,3 +97,81 @@ def import_students(rows: List[Dict], dept_id: int) -> Tuple[int, int]:
                             (dept_id, number, full_name, class_year))
                 added_or_updated += 1
     return added_or_updated, skipped
+
+ENROLL_BATCH = 5000
+LOOKUP_CHUNK = 500   # IN (...) başına numara (SQLite değişken sınırının altında)
+
+def course_ids_by_code(con, dept_id: int) -> Dict[str, int]:
+    """Bölümün ders kodu → course_id haritası (akış modunda bir kez yüklenip parçalara verilir)."""
+    return dict(con.execute("SELECT code, id FROM courses WHERE dept_id=?", (dept_id,)).fetchall())
+
+def _student_ids(con, dept_id: int, numbers: Set[str]) -> Dict[str, int]:
+    """Yalnız verilen numaraların student_id'leri (bölümün tamamı okunmaz)."""
+    numbers = list(numbers)
+    out = {}
+    for i in range(0, len(numbers), LOOKUP_CHUNK):
+        chunk = numbers[i:i + LOOKUP_CHUNK]
+        q = ",".join("?" * len(chunk))
+        out.update(con.execute(f"SELECT number, id FROM students WHERE dept_id=? AND number IN ({q})",
+                               (dept_id, *chunk)).fetchall())
+    return out
+
+def _enrolled_pairs(con, student_ids: Set[int]) -> Set[Tuple[int, int]]:
+    """Verilen öğrencilerin mevcut (student_id, course_id) kayıtları (IN, LOOKUP_CHUNK'lık sorgular)."""
+    student_ids = list(student_ids)
+    out = set()
+    for i in range(0, len(student_ids), LOOKUP_CHUNK):
+        chunk = student_ids[i:i + LOOKUP_CHUNK]
+        q = ",".join("?" * len(chunk))
+        out.update(con.execute(f"SELECT student_id, course_id FROM enrollments WHERE student_id IN ({q})",
+                               chunk).fetchall())
+    return out
+
+def import_student_enrollments(con, dept_id: int, students: Iterable[Tuple[str, str, int]],
+                               enrollments: Iterable[Tuple[str, str]],
+                               batch_size: int = ENROLL_BATCH,
+                               course_of: Optional[Dict[str, int]] = None) -> Tuple[int, int, Set[str]]:
+    """
+    Doğrulanmış öğrenci satırlarını toplu yazar (satır başına sorgu yok):
+      1) bölümün kod → course_id haritası tek sorguda (course_of verilmişse o kullanılır)
+      2) öğrenciler executemany INSERT OR IGNORE (var olan numaraya dokunulmaz)
+      3) numara → student_id yalnız bu partideki numaralar için (IN, LOOKUP_CHUNK'lık sorgular)
+      4) yalnız yeni kayıtlar batch_size'lık executemany ile yazılır; dersleri dirty işaretlenir
+         (mark_dirty_courses → "Planı Onar" bu dersleri yeniden yerleştirir)
+      5) data_version bir kez artırılır (enrollments INSERT'te satır tetikleyicisi yok, migration 10)
+    students: [(numara, ad soyad, sınıf)], enrollments: [(numara, ders kodu)]
+    Maliyet ve bellek partinin boyutuyla orantılıdır; bölümdeki öğrenci sayısından bağımsızdır.
+    Commit çağırana aittir (get_conn bloğu).
+    Dönen: (işlenen öğrenci satırı, atlanan, eşleşmeyen ders kodları)
+    """
+    students = list(students)
+    enrollments = list(enrollments)
+    if course_of is None:
+        course_of = course_ids_by_code(con, dept_id)
+
+    con.executemany("""
+        INSERT OR IGNORE INTO students(dept_id, number, full_name, class_year)
+        VALUES (?, ?, ?, ?)
+    """, [(dept_id, num, name, cls) for num, name, cls in students])
+    student_of = _student_ids(con, dept_id, {num for num, _, _ in students} | {num for num, _ in enrollments})
+
+    ok = sum(1 for num, _, _ in students if num in student_of)
+    missing = set()
+    pairs = set()
+    for num, code in enrollments:
+        sid = student_of.get(num)
+        if sid is None:
+            continue
+        cid = course_of.get(code)
+        if cid is None:
+            missing.add(code)
+            continue
+        pairs.add((sid, cid))
+    pairs -= _enrolled_pairs(con, {sid for sid, _ in pairs})
+    pairs = list(pairs)
+    for i in range(0, len(pairs), batch_size):
+        con.executemany("INSERT OR IGNORE INTO enrollments(student_id, course_id) VALUES (?, ?)",
+                        pairs[i:i + batch_size])
+    mark_dirty_courses(con, {cid for _, cid in pairs})
+    bump_data_version(con)
+    return ok, len(students) - ok, missing
@@ -0,0 +1,180 @@
+# src/core/migrations.py
+# Şema sürümleri: PRAGMA user_version ile artımlı migration.
+# Güncel bir veritabanında açılış maliyeti tek bir user_version okumasıdır;
+# tam tablo işleri (dedup vb.) yalnızca ilgili migration ilk kez koşarken çalışır.
+
+import sqlite3
+from typing import Callable, List, Tuple
+from . import models
+
+
+def _create_tables(con: sqlite3.Connection):
+    cur = con.cursor()
+    cur.execute(models.DEPARTMENTS_SQL)
+    cur.execute(models.USERS_SQL)
+    cur.execute(models.CLASSROOMS_SQL)
+    cur.execute(models.CLASSROOMS_INDEX_SQL)
+    cur.executescript(models.STUDENTS_SQL)
+    cur.executescript(models.COURSES_SQL)
+    cur.executescript(models.ENROLLMENTS_SQL)
+    cur.executescript(models.EXAMS_SQL)
+
+
+def _ensure_unique_course_index(con: sqlite3.Connection):
+    cur = con.cursor()
+    # 1) Aynı bölümde aynı koddan çoğul kayıt varsa fazlaları sil (ilk id kalsın)
+    cur.execute("""
+        WITH dups AS (
+            SELECT id
+            FROM (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                         PARTITION BY dept_id, UPPER(REPLACE(code,' ',''))
+                         ORDER BY id
+                       ) AS rn
+                FROM courses
+            )
+            WHERE rn > 1
+        )
+        DELETE FROM courses WHERE id IN (SELECT id FROM dups)
+    """)
+    # 2) UNIQUE index
+    cur.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_courses_dept_code
+        ON courses(dept_id, code)
+    """)
+
+
+def _table_columns(con: sqlite3.Connection, table: str) -> set:
+    return {row[1] for row in con.execute(f"PRAGMA table_info({table});")}
+
+
+def _add_exam_type_column(con: sqlite3.Connection):
+    if "exam_type" not in _table_columns(con, "exams"):
+        con.execute("ALTER TABLE exams ADD COLUMN exam_type TEXT DEFAULT 'Vize';")
+
+
+def _add_capacity_pdf_column(con: sqlite3.Connection):
+    if "capacity_pdf" not in _table_columns(con, "classrooms"):
+        con.execute("ALTER TABLE classrooms ADD COLUMN capacity_pdf INTEGER;")
+
+
+def _create_exam_rooms(con: sqlite3.Connection):
+    con.executescript(models.EXAM_ROOMS_SQL)
+
+
+def normalize_exam_starts(con: sqlite3.Connection) -> int:
+    """
+    Tek seferlik düzeltme: exam_start'ı kanonik metne çevirir ('2025-01-15 09:00:00' → '2025-01-15 09:00')
+    ve start_min'i doldurur. Dönen: değişen satır sayısı.
+    """
+    text = models.EXAM_START_TEXT_EXPR.format(v="exam_start")
+    key = models.EXAM_START_KEY_EXPR.format(v="exam_start")
+    cur = con.execute(f"""
+        UPDATE exams
+        SET exam_start = {text}, start_min = {key}
+        WHERE exam_start IS NOT {text} OR start_min IS NOT {key}
+    """)
+    return cur.rowcount
+
+
+def _add_exam_start_key(con: sqlite3.Connection):
+    if "start_min" not in _table_columns(con, "exams"):
+        con.execute("ALTER TABLE exams ADD COLUMN start_min INTEGER;")
+    # önce mevcut satırlar (tetikleyiciler yokken tek UPDATE), sonra index + tetikleyiciler
+    normalize_exam_starts(con)
+    con.executescript(models.EXAM_START_KEY_SQL)
+
+
+def _create_data_version(con: sqlite3.Connection):
+    con.executescript(models.DATA_VERSION_SQL)
+
+
+def _add_database_id(con: sqlite3.Connection):
+    con.executescript(models.DATABASE_ID_SQL)
+
+
+def _drop_enrollment_insert_trigger(con: sqlite3.Connection):
+    con.executescript(models.DATA_VERSION_BULK_SQL)
+
+
+def _fix_legacy_durations(con: sqlite3.Connection):
+    con.executescript(models.LEGACY_DURATION_SQL)
+
+
+def _create_dirty_courses(con: sqlite3.Connection):
+    con.executescript(models.DIRTY_COURSES_SQL)
+
+
+def _set_exam_duration_default(con: sqlite3.Connection):
+    default = next((row[4] for row in con.execute("PRAGMA table_info(exams);") if row[1] == "duration_min"), None)
+    if default == "75":
+        return  # yeni kurulan DB (EXAMS_SQL) ya da yarıda kalmış adımın tekrarı
+    # DROP TABLE exams, yabancı anahtarlar açıkken exam_rooms'u CASCADE ile silerdi;
+    # PRAGMA yalnız transaction dışında etkili, betik kendi transaction'ını açar.
+    con.commit()
+    seq = con.execute("SELECT seq FROM sqlite_sequence WHERE name='exams'").fetchone()
+    fk = con.execute("PRAGMA foreign_keys").fetchone()[0]
+    con.execute("PRAGMA foreign_keys = OFF")
+    # silinmiş sınavların id'leri yeniden verilmesin: AUTOINCREMENT sayacı yeni tabloya taşınır
+    keep_seq = (f"DELETE FROM sqlite_sequence WHERE name='exams';"
+                f"INSERT INTO sqlite_sequence(name, seq) VALUES ('exams', {int(seq[0])});") if seq else ""
+    try:
+        con.executescript("BEGIN;" + models.EXAMS_DEFAULT_DURATION_SQL + keep_seq + "COMMIT;")
+    except sqlite3.Error:
+        con.rollback()
+        raise
+    finally:
+        con.execute(f"PRAGMA foreign_keys = {int(fk)}")
+
+
+def _seed(con: sqlite3.Connection):
+    # lazy import: db bu modülü içe aktarıyor
+    from .db import seed_admin, seed_demo_coordinator
+    seed_admin(con)
+    seed_demo_coordinator(con)
+
+
+# (sürüm, açıklama, adım) — sıra önemli, yalnızca SONA ekleyin.
+# Her adım idempotent yazılır: yarıda kesilen bir migration tekrar koşabilir.
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "temel tablolar", _create_tables),
+    (2, "courses(dept_id, code) tekilleştirme + UNIQUE index", _ensure_unique_course_index),
+    (3, "exams.exam_type", _add_exam_type_column),
+    (4, "classrooms.capacity_pdf", _add_capacity_pdf_column),
+    (5, "bölümler + varsayılan kullanıcılar", _seed),
+    (6, "exam_rooms (çok derslikli sınavlar)", _create_exam_rooms),
+    (7, "exams.start_min (kanonik zaman anahtarı) + exam_start normalleştirme", _add_exam_start_key),
+    (8, "data_version + courses/enrollments sayaç tetikleyicileri", _create_data_version),
+    (9, "data_version: veritabanı kimliği (db_id)", _add_database_id),
+    (10, "enrollments INSERT sayaç tetikleyicisi yerine toplu yazımda tek artış", _drop_enrollment_insert_trigger),
+    (11, "slot ızgarasındaki varsayılan 120 dk süreler → 75 dk", _fix_legacy_durations),
+    (12, "dirty_courses (içe aktarmayla kayıtları değişen dersler)", _create_dirty_courses),
+    (13, "exams.duration_min varsayılanı 120 → 75 (tablo yeniden kurulur)", _set_exam_duration_default),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_version(con: sqlite3.Connection) -> int:
+    return con.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(con: sqlite3.Connection) -> List[int]:
+    """
+    Eksik migration'ları sırayla uygular, her adımdan sonra user_version'ı yazar.
+    Dönen: uygulanan sürüm numaraları (güncel DB için boş liste).
+    """
+    current = get_version(con)
+    if current >= LATEST_VERSION:
+        return []
+
+    applied = []
+    for version, _desc, step in MIGRATIONS:
+        if version <= current:
+            continue
+        step(con)
+        con.execute(f"PRAGMA user_version = {int(version)}")
+        con.commit()
+        applied.append(version)
+    return applied
@@ -84,12 +84,14 @@ CREATE INDEX IF NOT EXISTS idx_enroll_student ON enrollments(student_id);
 CREATE INDEX IF NOT EXISTS idx_enroll_course  ON enrollments(course_id);
 """
 # exams – her ders için sınav kaydı (tarih/saat/yer)
+# duration_min varsayılanı planlayıcının süresidir (intervals.DEFAULT_DURATION_MIN); eski şemalarda 120'ydi,
+# bkz. EXAMS_DEFAULT_DURATION_SQL.
 EXAMS_SQL = """
 CREATE TABLE IF NOT EXISTS exams (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     course_id INTEGER NOT NULL,
     exam_start TEXT NOT NULL,    -- ISO: '2025-01-15 09:00'
-    duration_min INTEGER NOT NULL DEFAULT 120,
+    duration_min INTEGER NOT NULL DEFAULT 75,
     room_id INTEGER NULL,
     UNIQUE(course_id),
     FOREIGN KEY (course_id) REFERENCES courses(id),
@@ -97,3 +99,112 @@ CREATE TABLE IF NOT EXISTS exams (
 );
 CREATE INDEX IF NOT EXISTS idx_exams_start ON exams(exam_start);
 """
+# exams.start_min – exam_start'ın kanonik anahtarı (epoch dakika, UTC kabulüyle; tamsayı eşitlik/aralık sorguları).
+# Tetikleyiciler her yazımda exam_start'ı 'YYYY-MM-DD HH:MM' biçimine çevirir ve start_min'i doldurur;
+# okunamayan metin olduğu gibi kalır, start_min NULL olur.
+EXAM_START_KEY_EXPR = "CAST(strftime('%s', {v}) AS INTEGER) / 60"
+EXAM_START_TEXT_EXPR = "COALESCE(strftime('%Y-%m-%d %H:%M', {v}), {v})"
+EXAM_START_KEY_SQL = f"""
+CREATE INDEX IF NOT EXISTS idx_exams_start_min ON exams(start_min);
+CREATE TRIGGER IF NOT EXISTS trg_exams_start_ins AFTER INSERT ON exams
+BEGIN
+    UPDATE exams
+    SET exam_start = {EXAM_START_TEXT_EXPR.format(v="NEW.exam_start")},
+        start_min  = {EXAM_START_KEY_EXPR.format(v="NEW.exam_start")}
+    WHERE id = NEW.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_exams_start_upd AFTER UPDATE OF exam_start ON exams
+BEGIN
+    UPDATE exams
+    SET exam_start = {EXAM_START_TEXT_EXPR.format(v="NEW.exam_start")},
+        start_min  = {EXAM_START_KEY_EXPR.format(v="NEW.exam_start")}
+    WHERE id = NEW.id;
+END;
+"""
+# data_version – türetilmiş verinin (çakışma grafı) geçerlilik sayacı.
+# courses/enrollments'a dokunan her satır 'enrollments' sayacını artırır (enrollments INSERT hariç, bkz.
+# DATA_VERSION_BULK_SQL); önbellekler bu sayaçla anahtarlanır.
+DATA_VERSION_SQL = """
+CREATE TABLE IF NOT EXISTS data_version (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO data_version(name, value) VALUES ('enrollments', 0);
+""" + "".join(f"""
+CREATE TRIGGER IF NOT EXISTS trg_{table}_ver_{op[:3].lower()} AFTER {op} ON {table}
+BEGIN
+    UPDATE data_version SET value = value + 1 WHERE name = 'enrollments';
+END;
+""" for table in ("enrollments", "courses") for op in ("INSERT", "UPDATE", "DELETE"))
+# data_version 'db_id' – veritabanına özgü rastgele kimlik (oluşturma/migration'da bir kez yazılır).
+# Sayaç yeni kurulan DB'de 0'dan başlar, yedekten dönülünce geriler; önbellek anahtarı kimlik + sayaçtır.
+DATABASE_ID_SQL = """
+INSERT OR IGNORE INTO data_version(name, value) VALUES ('db_id', abs(random()));
+"""
+# Toplu kayıt eklemede satır başına sayaç UPDATE'i pahalı: enrollments INSERT tetikleyicisi kaldırılır,
+# toplu yazıcılar (core.importers.import_student_enrollments) transaction başına bir kez bump_data_version çağırır.
+# enrollments UPDATE/DELETE (ör. öğrenci/ders silinince CASCADE) ve courses tetikleyicileri kalır.
+DATA_VERSION_BULK_SQL = """
+DROP TRIGGER IF EXISTS trg_enrollments_ver_ins;
+"""
+# Seri öncesi (ve düzenleme penceresinden eklenen) sınavlar şema varsayılanı 120 dk ile yazıldı; slot
+# ızgarasında (09:00 … 19:00) bu süre 15:30 ile 17:00 sınavlarını sahte örtüştürür. Izgaradaki 120'lik
+# satırlar planlayıcı süresine (75) çekilir; ızgara dışı saatlerdeki elle girilmiş süreler korunur.
+# default_duration'ı bilerek 120 seçilmiş bir planın satırları varsayılandan ayırt edilemez: değişen her
+# satır eski süresiyle exam_duration_backfill'e yazılır ve Veri Durumu'nda listelenir.
+LEGACY_DURATION_SQL = """
+CREATE TABLE IF NOT EXISTS exam_duration_backfill (
+    exam_id INTEGER PRIMARY KEY,
+    old_duration INTEGER NOT NULL,
+    FOREIGN KEY (exam_id) REFERENCES exams(id) ON DELETE CASCADE
+);
+INSERT OR IGNORE INTO exam_duration_backfill(exam_id, old_duration)
+SELECT id, duration_min FROM exams
+WHERE duration_min = 120
+  AND strftime('%H:%M', exam_start) IN ('09:00', '11:00', '13:30', '15:30', '17:00', '19:00');
+UPDATE exams SET duration_min = 75
+WHERE duration_min = 120 AND id IN (SELECT exam_id FROM exam_duration_backfill);
+"""
+# SQLite sütun varsayılanını değiştiremez: exams, varsayılanı 75 olan (EXAMS_SQL) ve sonradan eklenen
+# sütunları (exam_type, start_min) içeren tabloyla yeniden kurulur; indeks ve tetikleyiciler yeniden
+# yaratılır. Yabancı anahtarlar kapalıyken koşar (bkz. migrations._set_exam_duration_default).
+EXAMS_DEFAULT_DURATION_SQL = """
+CREATE TABLE exams_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    course_id INTEGER NOT NULL,
+    exam_start TEXT NOT NULL,
+    duration_min INTEGER NOT NULL DEFAULT 75,
+    room_id INTEGER NULL,
+    exam_type TEXT DEFAULT 'Vize',
+    start_min INTEGER,
+    UNIQUE(course_id),
+    FOREIGN KEY (course_id) REFERENCES courses(id),
+    FOREIGN KEY (room_id) REFERENCES classrooms(id)
+);
+INSERT INTO exams_new(id, course_id, exam_start, duration_min, room_id, exam_type, start_min)
+SELECT id, course_id, exam_start, duration_min, room_id, exam_type, start_min FROM exams;
+DROP TABLE exams;
+ALTER TABLE exams_new RENAME TO exams;
+CREATE INDEX IF NOT EXISTS idx_exams_start ON exams(exam_start);
+""" + EXAM_START_KEY_SQL
+# dirty_courses – kayıtları içe aktarmayla değişen, sınavı henüz yeniden yerleşmemiş dersler.
+# import_student_enrollments yeni kayıt eklenen dersleri işaretler; "Planı Onar" bunları dirty olarak
+# yeniden yerleştirir, sınavı yazılan (save_plan/save_changes) dersin işareti kalkar.
+DIRTY_COURSES_SQL = """
+CREATE TABLE IF NOT EXISTS dirty_courses (
+    course_id INTEGER PRIMARY KEY,
+    FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
+);
+"""
+# exam_rooms – birden çok dersliğe bölünen sınavların parçaları (exams.room_id = ilk/ana derslik)
+EXAM_ROOMS_SQL = """
+CREATE TABLE IF NOT EXISTS exam_rooms (
+    exam_id INTEGER NOT NULL,
+    room_id INTEGER NOT NULL,
+    seats INTEGER NOT NULL CHECK (seats > 0),
+    PRIMARY KEY (exam_id, room_id),
+    FOREIGN KEY (exam_id) REFERENCES exams(id) ON DELETE CASCADE,
+    FOREIGN KEY (room_id) REFERENCES classrooms(id)
+);
+CREATE INDEX IF NOT EXISTS idx_exam_rooms_room ON exam_rooms(room_id);
+"""
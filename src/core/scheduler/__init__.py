@@ -0,0 +1,27 @@
+# src/core/scheduler/__init__.py
+# GUI'siz sınav planlama motoru.
+
+from .slots import DAILY_TIMES, generate_slots
+from .graph import build_conflict_graph, invert_enrollments, edge_weights
+from .local_search import DEFAULT_PENALTIES, improve_plan, soft_penalty
+from .planner import DEFAULT_CONSTRAINTS, STRATEGIES, plan_exams, plan_metrics
+from .multistart import plan_multistart, plan_score
+from .repair import conflicting_courses, repair_plan
+from .rooms import RoomPool, assign_rooms, split_rooms
+from .intervals import (
+    exam_interval, overlapping_pairs, room_overlaps, slot_overlaps, slot_room_busy,
+)
+from .conflicts import conflict_report
+from .graph_cache import bump_data_version, cached_conflict_graph, data_version, database_id
+from .preview import MovePreview
+from .global_plan import dept_partitions, plan_global
+from .room_match import SOLVERS, assign_rooms_optimal, compare_room_assignment, matching_available, room_summary
+from .store import (
+    EXAM_TYPES, normalize_exam_type, load_courses, load_enrollments, load_student_conflicts, load_room_conflicts,
+    load_conflict_report, load_move_preview,
+    load_busy_rooms, parse_exam_start, format_exam_start, slot_key, slot_from_key,
+    load_existing_plan, load_exam_durations, mark_dirty_courses, load_dirty_courses, clear_dirty_courses,
+    load_rooms, load_room_usage, load_exam_rooms, save_exam_rooms,
+    load_all_courses, load_all_enrollments, save_plan, save_changes,
+    plan_department, plan_all_departments, repair_department,
+)
@@ -0,0 +1,51 @@
+# src/core/scheduler/conflicts.py
+# Öğrenci çakışma raporu: Çakışma Hesapla ve Veri Durumu aynı tek geçişi kullanır.
+#   1) sınav aralıkları taranır → zamanı örtüşen ders çiftleri (aynı slot dahil)   O(n log n + p)
+#   2) her çift için iki dersin öğrenci kümeleri bir kez kesiştirilir              O(min(|A|, |B|))
+# Maliyet örtüşen çift ve gerçek çakışma sayısıyla orantılı; öğrenci başına ders çiftleri sayılmaz.
+
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, Optional
+
+from .graph import Enrollment
+from .intervals import Interval, overlapping_pairs
+
+
+def conflict_report(enrollments: Iterable[Enrollment], interval_of: Dict[int, Interval],
+                    slot_of: Optional[Dict[int, Hashable]] = None) -> Dict:
+    """
+    enrollments: (student_id, course_id) çiftleri
+    interval_of: {cid: (başlangıç, bitiş)} — yalnız bunlardaki dersler raporlanır
+    slot_of: per_slot gruplama anahtarı (yoksa başlangıç zamanı)
+    Dönen: {
+      "details":     [(student_id, önce başlayan ders, sonraki ders)],
+      "per_slot":    {önce başlayanın slotu: çakışma sayısı},
+      "per_student": {student_id: çakışma sayısı},
+      "per_pair":    {(a, b): ortak öğrenci sayısı},
+    }
+    """
+    students = {}
+    for sid, cid in enrollments:
+        if cid in interval_of:
+            students.setdefault(cid, set()).add(sid)
+
+    details = []
+    per_slot = defaultdict(int)
+    per_student = defaultdict(int)
+    per_pair = {}
+    items = [(cid, s, e) for cid, (s, e) in interval_of.items() if cid in students]
+    for a, b in overlapping_pairs(items):
+        common = students[a] & students[b]
+        if not common:
+            continue
+        per_pair[(a, b)] = len(common)
+        per_slot[slot_of[a] if slot_of is not None else interval_of[a][0]] += len(common)
+        for sid in common:
+            per_student[sid] += 1
+            details.append((sid, a, b))
+    return {
+        "details": details,
+        "per_slot": dict(per_slot),
+        "per_student": dict(per_student),
+        "per_pair": per_pair,
+    }
@@ -0,0 +1,72 @@
+# src/core/scheduler/cooldown.py
+# Öğrenci bekleme süresi (cooldown) kontrolü için slot indeksi.
+# Bir dersin öğrencilerinin diğer sınavları tam olarak çakışma grafındaki komşu
+# derslerin sınavlarıdır; bu yüzden her ders için "yerleşmiş komşu sınav aralıkları"
+# başlangıca göre sıralı tutulur ve kontrol bisect ile aday aralığın çevresine bakar:
+# O(log k + yakındaki sınav). Yakınlık intervals.too_close'dur: aralıklar örtüşüyorsa ya da
+# birinin bitişiyle ötekinin başlangıcı arası cooldown'dan kısaysa (cooldown=0: yalnız örtüşme).
+# Öncesine ve sonrasına bakıldığı için yerleştirme sırası ne olursa olsun doğrudur.
+
+from bisect import bisect_left, insort
+from datetime import timedelta
+from typing import Dict, Iterable, Optional, Set
+
+from .intervals import DEFAULT_DURATION_MIN, too_close
+
+
+class CooldownIndex:
+    def __init__(self, neighbors: Dict[int, Set[int]], cooldown_min: int,
+                 duration_min: Optional[int] = None):
+        """duration_min: süresi verilmeyen sınavların süresi (planlayıcının default_duration'ı)."""
+        self.neighbors = neighbors
+        self.gap = timedelta(minutes=max(0, int(cooldown_min or 0)))
+        self.duration = timedelta(minutes=int(duration_min or DEFAULT_DURATION_MIN))
+        self._times = {}     # cid -> sıralı [(başlangıç, bitiş)] komşu sınavları
+        self._placed = {}    # cid -> (başlangıç, bitiş)
+        self._span = self.duration   # yerleşmiş en uzun sınav: geriye doğru arama sınırı
+
+    def _interval(self, ts, duration_min: Optional[int]):
+        dur = timedelta(minutes=int(duration_min)) if duration_min else self.duration
+        return ts, ts + dur
+
+    def place(self, cid: int, ts, duration_min: Optional[int] = None):
+        iv = self._interval(ts, duration_min)
+        self._placed[cid] = iv
+        self._span = max(self._span, iv[1] - iv[0])
+        for nb in self.neighbors.get(cid, ()):
+            insort(self._times.setdefault(nb, []), iv)
+
+    def remove(self, cid: int):
+        iv = self._placed.pop(cid, None)
+        if iv is None:
+            return
+        for nb in self.neighbors.get(cid, ()):
+            lst = self._times.get(nb)
+            if lst:
+                i = bisect_left(lst, iv)
+                if i < len(lst) and lst[i] == iv:
+                    del lst[i]
+
+    def _close(self, cid: int, start, end) -> int:
+        lst = self._times.get(cid)
+        if not lst:
+            return 0
+        n = 0
+        i = bisect_left(lst, (start - self._span - self.gap,))
+        while i < len(lst) and lst[i][0] < end + self.gap:
+            s, e = lst[i]
+            i += 1
+            if too_close(start, end, s, e, self.gap):
+                n += 1
+        return n
+
+    def fits(self, cid: int, ts, duration_min: Optional[int] = None) -> bool:
+        """cid, ts'e konursa hiçbir öğrencisinin iki sınavı örtüşmez ve arası cooldown'dan kısa kalmaz mı?"""
+        return self._close(cid, *self._interval(ts, duration_min)) == 0
+
+    def violations(self, cid: int, ts, duration_min: Optional[int] = None) -> int:
+        """ts'de başlayan sınava cooldown mesafesinden yakın (örtüşen dahil) komşu sınav sayısı."""
+        return self._close(cid, *self._interval(ts, duration_min))
+
+    def placed(self) -> Iterable[int]:
+        return self._placed.keys()
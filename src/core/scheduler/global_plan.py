@@ -0,0 +1,164 @@
+# src/core/scheduler/global_plan.py
+# Fakülte geneli (tüm bölümler) planlama — admin.
+# Tek çakışma grafı tüm kayıtlardan kurulur; ortak öğrencisi olan bölümler aynı bölmeye (partition)
+# düşer (union-find). Birbirine hiç kenarla bağlı olmayan bölmeler süreç havuzunda paralel planlanır.
+# Derslikler tek havuzdur:
+#   joint_rooms=False — zamanlar bölmelerde paralel, derslikler sonra tüm sınavlara tek geçişte (assign_rooms)
+#   joint_rooms=True  — derslik doluluğu bölmeleri bağladığı için tek bir ortak (zaman+derslik) çözüm
+# Sınıf yılı tercihleri bölüm içinde kalsın diye yıl anahtarı (bölüm, yıl) olarak verilir.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .graph import build_conflict_graph
+from .intervals import exam_interval, slot_overlaps
+from .planner import DEFAULT_CONSTRAINTS, plan_exams
+from .rooms import Room, assign_rooms
+
+GlobalCourse = Tuple[int, str, int, int]   # (cid, code, class_year, dept_id)
+
+
+def dept_partitions(dept_of: Dict[int, int], neighbors: Dict[int, set]) -> List[List[int]]:
+    """Ortak öğrencili derslerle birbirine bağlanan bölüm grupları: [[dept_id, ...], ...] (sıralı)."""
+    parent = {d: d for d in set(dept_of.values())}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, nbs in neighbors.items():
+        da = dept_of.get(a)
+        if da is None:
+            continue
+        for b in nbs:
+            db = dept_of.get(b)
+            if db is not None and db != da:
+                ra, rb = find(da), find(db)
+                if ra != rb:
+                    parent[max(ra, rb)] = min(ra, rb)
+
+    groups = {}
+    for d in parent:
+        groups.setdefault(find(d), []).append(d)
+    return sorted((sorted(g) for g in groups.values()), key=lambda g: g[0])
+
+
+def _plan_part(job):
+    courses, enrollments, slots, constraints, graph, rooms, room_busy = job
+    res = plan_exams(courses, enrollments, slots, constraints, graph=graph, rooms=rooms, room_busy=room_busy)
+    res.pop("weights", None)
+    return res
+
+
+def plan_global(courses: List[GlobalCourse],
+                enrollments: Iterable[Tuple[int, int]],
+                slots: list,
+                constraints: Optional[Dict] = None,
+                rooms: Optional[List[Room]] = None,
+                room_busy: Optional[Dict] = None,
+                workers: Optional[int] = None,
+                graph=None) -> Dict:
+    """
+    courses: [(cid, code, class_year, dept_id)] — tüm bölümler
+    rooms: tüm derslikler (tek havuz); verilmezse yalnız zaman planlanır
+    graph: tüm derslerin hazır (neighbors, weights) grafı (ör. graph_cache); yoksa kurulur
+    Dönen:
+      {"placements": {cid: datetime}, "rooms": {cid: [(room_id, koltuk)]}, "unplaced": [cid],
+       "metrics": {"partitions": [[dept_id]], "parallel": bool, "workers", "graph_s", "elapsed_s",
+                   "placed", "unplaced", "conflicts", "cooldown_violations", "rooms_assigned", ...}}
+    """
+    c = dict(DEFAULT_CONSTRAINTS)
+    c.update(constraints or {})
+    t_start = time.perf_counter()
+
+    excluded = set(c.get("excluded_courses", set()) or set())
+    courses = [row for row in courses if row[0] not in excluded]
+    c["excluded_courses"] = set()
+    dept_of = {cid: dept for cid, _, _, dept in courses}
+    enrollments = [(s, cid) for s, cid in enrollments if cid in dept_of]
+
+    t0 = time.perf_counter()
+    if graph is None:
+        graph = build_conflict_graph(enrollments, dept_of)
+        neighbors, weights = graph
+    else:
+        # hazır graf hariç tutulan dersleri de içerebilir
+        neighbors = {cid: graph[0].get(cid, set()) & dept_of.keys() for cid in dept_of}
+        weights = {k: v for k, v in graph[1].items() if k[0] in dept_of and k[1] in dept_of}
+    graph_s = time.perf_counter() - t0
+    parts = dept_partitions(dept_of, neighbors)
+
+    def _part_courses(depts):
+        ds = set(depts)
+        # (bölüm, yıl): farklı bölümlerin aynı yılları birbirini "aynı gün" cezasına sokmaz
+        return [(cid, code, (dept, cy) if cy is not None else None, dept)
+                for cid, code, cy, dept in courses if dept in ds]
+
+    joint = bool(c.get("joint_rooms")) and bool(rooms)
+    if joint:
+        # derslik havuzu bölmeleri bağlar: tek ortak çözüm
+        groups = [[d for g in parts for d in g]]
+    else:
+        groups = parts
+
+    jobs = []
+    for depts in groups:
+        pc = _part_courses(depts)
+        cids = {row[0] for row in pc}
+        sub_nb = {cid: neighbors.get(cid, set()) for cid in cids}
+        sub_w = {k: v for k, v in weights.items() if k[0] in cids} if len(groups) > 1 else weights
+        sub_enr = [(s, cid) for s, cid in enrollments if cid in cids] if len(groups) > 1 else enrollments
+        jobs.append(([row[:3] for row in pc], sub_enr, slots, c, (sub_nb, sub_w),
+                     rooms if joint else None, room_busy if joint else None))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(jobs)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_plan_part, jobs))
+    else:
+        results = [_plan_part(j) for j in jobs]
+
+    placements, room_of, unplaced = {}, {}, []
+    for res in results:
+        placements.update(res["placements"])
+        room_of.update(res.get("rooms") or {})
+        unplaced.extend(res["unplaced"])
+
+    metrics = {
+        "courses": len(courses),
+        "departments": len(set(dept_of.values())),
+        "partitions": parts,
+        "parallel": workers > 1,
+        "workers": workers,
+        "graph_s": graph_s,
+        "edges": len(weights),
+        "placed": len(placements),
+        "unplaced": len(unplaced),
+    }
+    for key in ("conflicts", "cooldown_violations", "forced", "rooms_assigned", "room_unassigned"):
+        metrics[key] = sum(res["metrics"].get(key, 0) for res in results)
+
+    if rooms and not joint:
+        # zamanlar belli: tüm sınavlara tek derslik havuzundan atama
+        sizes = {}
+        for _s, cid in enrollments:
+            sizes[cid] = sizes.get(cid, 0) + 1
+        # default_duration slot aralığından uzunsa ardışık slotlar aynı derslikleri paylaşamaz
+        overlaps = slot_overlaps({ts: exam_interval(ts, c.get("default_duration"))
+                                  for ts in set(placements.values())})
+        room_of, failed = assign_rooms(
+            [(cid, ts, sizes.get(cid, 0)) for cid, ts in placements.items()], rooms, room_busy,
+            overlaps=overlaps
+        )
+        metrics["rooms_assigned"] = len(room_of)
+        metrics["room_unassigned"] = len(failed)
+
+    metrics["elapsed_s"] = time.perf_counter() - t_start
+    return {"placements": placements, "rooms": room_of, "unplaced": unplaced, "weights": weights,
+            "metrics": metrics}
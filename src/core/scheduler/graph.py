@@ -0,0 +1,60 @@
+# src/core/scheduler/graph.py
+# Ders çakışma grafı: ortak öğrencisi olan dersler komşudur.
+# Kayıtlar tek geçişte öğrenci → dersler ters indeksine çevrilir; yalnızca
+# gerçekten birlikte alınan ders çiftleri dolaşılır (C² kesişim yok).
+
+from collections import Counter
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+Enrollment = Tuple[int, int]             # (student_id, course_id)
+Weights = Dict[Tuple[int, int], int]     # (küçük cid, büyük cid) -> ortak öğrenci sayısı
+
+
+def invert_enrollments(enrollments: Iterable[Enrollment],
+                       course_ids: Optional[Iterable[int]] = None) -> Dict[int, List[int]]:
+    """(student_id, course_id) akışı → {student_id: [course_id, ...]} (course_ids dışındakiler atlanır)."""
+    keep = set(course_ids) if course_ids is not None else None
+    student_courses = {}
+    for sid, cid in enrollments:
+        if keep is not None and cid not in keep:
+            continue
+        student_courses.setdefault(sid, []).append(cid)
+    return student_courses
+
+
+def course_students_of(student_courses: Dict[int, List[int]]) -> Dict[int, Set[int]]:
+    course_students = {}
+    for sid, cids in student_courses.items():
+        for cid in cids:
+            course_students.setdefault(cid, set()).add(sid)
+    return course_students
+
+
+def edge_weights(student_courses: Dict[int, List[int]]) -> Weights:
+    """Her öğrencinin ders listesindeki çiftleri sayar: maliyet Σ k², k = öğrencinin ders sayısı."""
+    weights = Counter()
+    for cids in student_courses.values():
+        if len(cids) > 1:
+            weights.update(combinations(sorted(set(cids)), 2))
+    return dict(weights)
+
+
+def neighbors_of(weights: Weights, course_ids: Iterable[int] = ()) -> Dict[int, Set[int]]:
+    neighbors = {cid: set() for cid in course_ids}
+    for a, b in weights:
+        neighbors.setdefault(a, set()).add(b)
+        neighbors.setdefault(b, set()).add(a)
+    return neighbors
+
+
+def build_conflict_graph(enrollments: Iterable[Enrollment],
+                         course_ids: Optional[Iterable[int]] = None) -> Tuple[Dict[int, Set[int]], Weights]:
+    """
+    enrollments: (student_id, course_id) çiftleri (DB'den student_id sıralı tek tarama önerilir)
+    Dönen: (neighbors {cid: {cid}}, weights {(a, b): ortak öğrenci})
+    """
+    course_ids = list(course_ids) if course_ids is not None else None
+    student_courses = invert_enrollments(enrollments, course_ids)
+    weights = edge_weights(student_courses)
+    return neighbors_of(weights, course_ids or ()), weights
@@ -0,0 +1,102 @@
+# src/core/scheduler/graph_cache.py
+# Çakışma grafı önbelleği: veri değişmediyse graf yeniden kurulmaz.
+# Anahtar: (veritabanı dosyası, veritabanı kimliği, kapsam = bölüm ya da tümü, data_version).
+# data_version, courses/enrollments'a yazan her satırda tetikleyicilerle artar (bkz. models.DATA_VERSION_SQL);
+# eski sürümün kaydı böylece kendiliğinden geçersiz kalır. Sayaç yeniden kurulan DB'de 0'dan başladığından
+# anahtara DB'ye özgü rastgele kimlik de girer (models.DATABASE_ID_SQL): aynı yoldaki yeni DB eski grafı görmez.
+# Bellek: süreç içinde son MEMORY_ENTRIES graf. Disk (pickle): cache_dir verilirse, uygulama yeniden açılınca da.
+
+import hashlib
+import pickle
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from .graph import edge_weights, invert_enrollments, neighbors_of
+
+Graph = Tuple[Dict[int, Set[int]], Dict[Tuple[int, int], int]]
+
+MEMORY_ENTRIES = 8
+_memory: "OrderedDict[tuple, Graph]" = OrderedDict()
+stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+
+def data_version(con: sqlite3.Connection) -> int:
+    row = con.execute("SELECT value FROM data_version WHERE name='enrollments'").fetchone()
+    return row[0] if row else 0
+
+
+def database_id(con: sqlite3.Connection) -> int:
+    row = con.execute("SELECT value FROM data_version WHERE name='db_id'").fetchone()
+    return row[0] if row else 0
+
+
+def bump_data_version(con: sqlite3.Connection):
+    """Tetikleyicileri atlayan yazımlar (ör. toplu içe aktarım) sonrası önbelleği elle geçersiz kılar."""
+    con.execute("UPDATE data_version SET value = value + 1 WHERE name='enrollments'")
+
+
+def clear_memory():
+    _memory.clear()
+
+
+def _db_tag(con: sqlite3.Connection) -> str:
+    path = next((row[2] for row in con.execute("PRAGMA database_list") if row[1] == "main"), "") or ":memory:"
+    return hashlib.sha1(path.encode("utf-8")).hexdigest()[:12]
+
+
+def build_graph(enrollments, cids) -> Graph:
+    """plan_exams'ın kendi kurduğu grafın aynısı."""
+    weights = edge_weights(invert_enrollments(enrollments, cids))
+    return neighbors_of(weights, cids), weights
+
+
+def cached_conflict_graph(con: sqlite3.Connection, dept_id: Optional[int], cids, enrollments,
+                          cache_dir=None) -> Graph:
+    """
+    dept_id: kapsam (None: tüm bölümler); cids / enrollments: kapsamın dersleri ve kayıtları
+    (önbellek ıskalanırsa graf bunlardan kurulur; okunması zaten gereken veriler).
+    """
+    version = data_version(con)
+    tag = _db_tag(con)
+    db_id = f"{database_id(con):x}"
+    scope = "all" if dept_id is None else f"d{int(dept_id)}"
+    key = (tag, db_id, scope, version)
+
+    graph = _memory.get(key)
+    if graph is not None:
+        _memory.move_to_end(key)
+        stats["hits"] += 1
+        return graph
+
+    path = None
+    if cache_dir:
+        path = Path(cache_dir) / f"graph_{tag}_{db_id}_{scope}_{version}.pickle"
+        try:
+            with open(path, "rb") as f:
+                graph = pickle.load(f)
+            stats["disk_hits"] += 1
+        except (OSError, pickle.UnpicklingError, EOFError):
+            graph = None
+
+    if graph is None:
+        stats["misses"] += 1
+        graph = build_graph(enrollments, list(cids))
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # aynı dosya yolunun eski sürümleri (önceki DB kimlikleri ve eski backend'li adlar dahil)
+                for old in path.parent.glob(f"graph_{tag}_*_{scope}_*.pickle"):
+                    old.unlink()
+                tmp = path.with_suffix(".tmp")
+                with open(tmp, "wb") as f:
+                    pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+                tmp.replace(path)
+            except OSError:
+                pass  # disk önbelleği isteğe bağlı; yazılamazsa bellekteki yeter
+
+    _memory[key] = graph
+    while len(_memory) > MEMORY_ENTRIES:
+        _memory.popitem(last=False)
+    return graph
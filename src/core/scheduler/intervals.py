@@ -0,0 +1,109 @@
+# src/core/scheduler/intervals.py
+# Süreli çakışma tespiti: sınavlar [başlangıç, bitiş) aralıkları olarak ele alınır,
+# yalnız aynı exam_start değil kısmi örtüşmeler de yakalanır.
+# Tarama çizgisi (sweep line): aralıklar başlangıca göre sıralanır, etkin olanlar bitişe göre
+# bir yığında tutulur → O(n log n + örtüşen çift sayısı).
+
+import heapq
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Süre bilinmiyorsa kullanılan tek varsayılan (planlayıcının default_duration'ı da budur).
+# Şemadaki exams.duration_min varsayılanı da budur (eski şemalardaki 120 slot ızgarasına uymuyordu: 15:30 + 120 > 17:00).
+DEFAULT_DURATION_MIN = 75
+
+Interval = Tuple[datetime, datetime]
+
+
+def exam_interval(start: datetime, duration_min: Optional[int] = None) -> Interval:
+    return start, start + timedelta(minutes=int(duration_min or DEFAULT_DURATION_MIN))
+
+
+def too_close(s1, e1, s2, e2, gap=timedelta(0)) -> bool:
+    """
+    [s1, e1) ile [s2, e2) arasındaki boşluk gap'ten kısa mı (gap=0: örtüşme).
+    Planlayıcı, yerel arama, cooldown indeksi ve düzenleme önizlemesi aynı tanımı kullanır:
+    cooldown bir sınavın bitişinden ötekinin başlangıcına kadar geçen süredir.
+    Zamanlar datetime (gap timedelta) ya da dakika (gap int) olabilir.
+    """
+    return s1 < e2 + gap and s2 < e1 + gap
+
+
+def slots_near(slots: list, start: datetime, end: datetime, duration_min: int, gap_min: int = 0) -> range:
+    """
+    slots (sıralı) içinde, duration_min süreli bir sınavı [start, end) aralığına gap_min'den yakın
+    düşüren slot indeksleri (too_close); start slots dışında olabilir.
+    """
+    dur, gap = timedelta(minutes=int(duration_min)), timedelta(minutes=int(gap_min))
+    return range(bisect_right(slots, start - dur - gap), bisect_left(slots, end + gap))
+
+
+def near_slots(slots: list, duration_min: int, gap_min: int = 0) -> List[range]:
+    """near[i]: slots[i]'deki sınavla (duration_min) aynı süreli bir sınavın too_close olduğu slotlar (i dahil)."""
+    dur = timedelta(minutes=int(duration_min))
+    return [slots_near(slots, ts, ts + dur, duration_min, gap_min) for ts in slots]
+
+
+def overlapping_pairs(items: Iterable[Tuple[Hashable, datetime, datetime]]) -> List[Tuple[Hashable, Hashable]]:
+    """
+    items: [(anahtar, başlangıç, bitiş)] — bitiş hariç: [s, e)
+    Dönen: örtüşen (a, b) çiftleri, a daha önce (ya da aynı anda) başlayan
+    """
+    order = sorted(items, key=lambda it: (it[1], it[2], str(it[0])))
+    active = []            # (bitiş, sıra, anahtar) — en erken biten üstte
+    live = {}              # sıra -> anahtar (etkin olanlar)
+    pairs = []
+    for i, (key, start, end) in enumerate(order):
+        while active and active[0][0] <= start:
+            _, j, _ = heapq.heappop(active)
+            live.pop(j, None)
+        for other in live.values():
+            pairs.append((other, key))
+        heapq.heappush(active, (end, i, key))
+        live[i] = key
+    return pairs
+
+
+def room_overlaps(usages: Iterable[Tuple[Hashable, int, datetime, datetime]]) -> List[Tuple[int, Hashable, Hashable]]:
+    """
+    usages: [(sınav anahtarı, room_id, başlangıç, bitiş)] (bölünmüş sınavın her parçası ayrı satır)
+    Dönen: [(room_id, sınav a, sınav b)] aynı derslikte zamanı örtüşen sınavlar
+    """
+    by_room = {}
+    for key, rid, start, end in usages:
+        by_room.setdefault(rid, []).append((key, start, end))
+    out = []
+    for rid, items in by_room.items():
+        if len(items) > 1:
+            out.extend((rid, a, b) for a, b in overlapping_pairs(items) if a != b)
+    return out
+
+
+def slot_overlaps(slot_intervals: Dict[Hashable, Interval]) -> Dict[Hashable, set]:
+    """Farklı slotlardan zamanı örtüşenler: {slot: {örtüşen diğer slotlar}} (yalnız örtüşmesi olanlar)."""
+    out = {}
+    for a, b in overlapping_pairs((ts, s, e) for ts, (s, e) in slot_intervals.items()):
+        out.setdefault(a, set()).add(b)
+        out.setdefault(b, set()).add(a)
+    return out
+
+
+def slot_room_busy(slot_intervals: Dict[Hashable, Interval],
+                   usages: Iterable[Tuple[Hashable, int, datetime, datetime]]) -> Dict[Hashable, set]:
+    """
+    Her slot aralığıyla örtüşen mevcut derslik kullanımları: {slot: {room_id}}.
+    usages: [(sınav anahtarı, room_id, başlangıç, bitiş)]
+    """
+    items = [(("slot", ts), s, e) for ts, (s, e) in slot_intervals.items()]
+    room_of = {}
+    for i, (_key, rid, s, e) in enumerate(usages):
+        items.append((("use", i), s, e))
+        room_of[i] = rid
+    busy = {}
+    for a, b in overlapping_pairs(items):
+        if a[0] == b[0]:
+            continue
+        slot, use = (a, b) if a[0] == "slot" else (b, a)
+        busy.setdefault(slot[1], set()).add(room_of[use[1]])
+    return busy
@@ -0,0 +1,207 @@
+# src/core/scheduler/local_search.py
+# Greedy/DSATUR sonrası süre sınırlı iyileştirme (simulated annealing, tek ders taşıma).
+# Sert kısıtlar korunur (komşu sınavlar too_close değil: örtüşme + cooldown, tek sınav modu);
+# tüm sınavlar default_duration süreli ve slot ızgarasında olduğundan kapanan slotlar önceden hesaplanır.
+# yumuşak cezalar düşürülür:
+#   same_day_year — aynı sınıf yılının aynı gündeki sınav çiftleri
+#   back_to_back  — ortak öğrencili derslerin aynı gün art arda slotlarda olması (ortak öğrenci başına)
+#   slot_balance  — slot doluluk dengesizliği (Σ sınav_sayısı²)
+# Her hamle yalnızca taşınan dersin komşularını ve sayaçlarını yeniden puanlar: O(derece).
+
+import math
+import random
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Set, Tuple
+
+from .intervals import DEFAULT_DURATION_MIN, near_slots
+
+DEFAULT_PENALTIES = {
+    "same_day_year": 10.0,
+    "back_to_back": 1.0,
+    "slot_balance": 0.1,
+}
+
+
+def _slot_layout(slots: list):
+    """slots (sıralı) → her indeks için (gün, gün içi sıra)."""
+    day_of, pos_of = [], []
+    last_day, k = None, 0
+    for ts in slots:
+        d = ts.date()
+        k = k + 1 if d == last_day else 0
+        last_day = d
+        day_of.append(d)
+        pos_of.append(k)
+    return day_of, pos_of
+
+
+def soft_penalty(placements: Dict[int, object], neighbors: Dict[int, Set[int]],
+                 weights: Dict[Tuple[int, int], int], course_year: Dict[int, int],
+                 slots: list, penalties: Optional[Dict] = None) -> Dict:
+    """Yerleşimin yumuşak ceza bileşenleri ve ağırlıklı toplamı (tam hesap)."""
+    p = dict(DEFAULT_PENALTIES)
+    p.update(penalties or {})
+    day_of, pos_of = _slot_layout(slots)
+    idx = {ts: i for i, ts in enumerate(slots)}
+
+    per_year_day = defaultdict(int)
+    per_slot = defaultdict(int)
+    b2b = 0
+    for cid, ts in placements.items():
+        i = idx[ts]
+        per_slot[i] += 1
+        if course_year.get(cid) is not None:
+            per_year_day[(course_year[cid], day_of[i])] += 1
+        for nb in neighbors.get(cid, ()):
+            if nb > cid and nb in placements:
+                j = idx[placements[nb]]
+                if day_of[i] == day_of[j] and abs(pos_of[i] - pos_of[j]) == 1:
+                    b2b += weights.get((cid, nb), 1)
+
+    comp = {
+        "same_day_year": sum(n * (n - 1) // 2 for n in per_year_day.values()),
+        "back_to_back": b2b,
+        "slot_balance": sum(n * n for n in per_slot.values()),
+    }
+    comp["total"] = sum(p[k] * comp[k] for k in DEFAULT_PENALTIES)
+    return comp
+
+
+def improve_plan(placements: Dict[int, object], neighbors: Dict[int, Set[int]],
+                 weights: Dict[Tuple[int, int], int], course_year: Dict[int, int], slots: list,
+                 constraints: Optional[Dict] = None, time_budget: float = 1.0,
+                 seed: Optional[int] = None, penalties: Optional[Dict] = None,
+                 max_iterations: Optional[int] = None):
+    """
+    placements: {cid: slot}  (slots içinden)
+    max_iterations verilirse arama hamle sayısıyla biter ve sıcaklık ona göre düşer:
+    aynı seed ile sonuç makineden bağımsız tekrarlanabilir (time_budget > 0 ise yine üst sınırdır).
+    Dönen: (yeni placements, istatistik)
+      istatistikteki penalty_tracked hamle farklarıyla izlenen ceza, penalty_after sonucun tam
+      hesabıdır; ikisi eşit olmalıdır (artımlı puanlamanın doğrulaması).
+    """
+    c = constraints or {}
+    p = dict(DEFAULT_PENALTIES)
+    p.update(penalties or {})
+    w_day, w_b2b, w_bal = p["same_day_year"], p["back_to_back"], p["slot_balance"]
+    single = bool(c.get("single_exam_at_a_time", False))
+    cooldown = int(c.get("cooldown_min", 0) or 0)
+    duration = int(c.get("default_duration") or DEFAULT_DURATION_MIN)
+
+    before = soft_penalty(placements, neighbors, weights, course_year, slots, p)
+    stats = {"iterations": 0, "accepted": 0, "penalty_before": before["total"]}
+    cids = list(placements)
+    if (time_budget <= 0 and not max_iterations) or len(cids) < 2 or len(slots) < 2:
+        stats.update({"penalty_after": before["total"], "penalty_tracked": before["total"],
+                      "elapsed_s": 0.0, "moves_per_s": 0.0})
+        return dict(placements), stats
+
+    rnd = random.Random(seed)
+    day_of, pos_of = _slot_layout(slots)
+    idx = {ts: i for i, ts in enumerate(slots)}
+    n_slots = len(slots)
+
+    # Durum: slot indeksleri + sayaçlar
+    cur = {cid: idx[ts] for cid, ts in placements.items()}
+    slot_cnt = [0] * n_slots
+    year_day = defaultdict(int)
+    for cid, i in cur.items():
+        slot_cnt[i] += 1
+        if course_year.get(cid) is not None:
+            year_day[(course_year[cid], day_of[i])] += 1
+    near = [frozenset(r) for r in near_slots(slots, duration, cooldown)]   # komşusu i'deyken kapalı slotlar
+    clash = near_slots(slots, duration)                                    # i'deki sınavla örtüşen slotlar
+
+    def _w(a, b):
+        return weights.get((a, b) if a < b else (b, a), 1)
+
+    def _adj(i, j):
+        return day_of[i] == day_of[j] and abs(pos_of[i] - pos_of[j]) == 1
+
+    def _delta(cid, i, j):
+        """cid'i i → j taşımanın ceza farkı; sert kısıt ihlalinde None."""
+        if single and any(slot_cnt[k] - (k == i) for k in clash[j]):
+            return None
+        b2b = 0
+        for nb in neighbors.get(cid, ()):
+            k = cur.get(nb)
+            if k is None:
+                continue
+            if k in near[j]:
+                return None
+            if _adj(j, k):
+                b2b += _w(cid, nb)
+            if _adj(i, k):
+                b2b -= _w(cid, nb)
+        d = w_b2b * b2b + w_bal * (2 * (slot_cnt[j] - slot_cnt[i]) + 2)
+        cy = course_year.get(cid)
+        if cy is not None and day_of[i] != day_of[j]:
+            d += w_day * (year_day[(cy, day_of[j])] - (year_day[(cy, day_of[i])] - 1))
+        return d
+
+    def _apply(cid, i, j):
+        cur[cid] = j
+        slot_cnt[i] -= 1
+        slot_cnt[j] += 1
+        cy = course_year.get(cid)
+        if cy is not None:
+            year_day[(cy, day_of[i])] -= 1
+            year_day[(cy, day_of[j])] += 1
+
+    penalty = before["total"]
+    best_penalty = penalty
+    best = None              # en iyi durumun kopyası (yalnız kötüleşmeden önce alınır)
+    best_dirty = True        # mevcut durum en iyi ve henüz kopyalanmadı
+
+    temp0 = max(1.0, penalty / max(1, len(cids)))
+    t_start = time.perf_counter()
+    deadline = t_start + float(time_budget) if time_budget > 0 else None
+    temp = temp0
+    it = 0
+    while True:
+        if max_iterations:
+            if it >= max_iterations:
+                break
+            if (it & 255) == 0:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                temp = temp0 * max(1e-3, 1.0 - it / max_iterations)
+        elif (it & 255) == 0:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            temp = temp0 * max(1e-3, 1.0 - (now - t_start) / time_budget)
+        it += 1
+
+        cid = cids[rnd.randrange(len(cids))]
+        i = cur[cid]
+        j = rnd.randrange(n_slots - 1)
+        if j >= i:
+            j += 1
+        d = _delta(cid, i, j)
+        if d is None:
+            continue
+        if d > 0 and rnd.random() >= math.exp(-d / temp):
+            continue
+
+        if d > 0 and best_dirty:
+            best = dict(cur)
+            best_dirty = False
+        _apply(cid, i, j)
+        penalty += d
+        stats["accepted"] += 1
+        if penalty < best_penalty - 1e-9:
+            best_penalty = penalty
+            best_dirty = True
+
+    elapsed = time.perf_counter() - t_start
+    final = cur if best_dirty or best is None else best
+    result = {cid: slots[i] for cid, i in final.items()}
+
+    stats["iterations"] = it
+    stats["elapsed_s"] = elapsed
+    stats["moves_per_s"] = it / elapsed if elapsed > 0 else 0.0
+    stats["penalty_tracked"] = best_penalty
+    stats["penalty_after"] = soft_penalty(result, neighbors, weights, course_year, slots, p)["total"]
+    return result, stats
@@ -0,0 +1,110 @@
+# src/core/scheduler/multistart.py
+# Çok başlangıçlı planlama: aynı girdi farklı tohumlarla (seed) birden çok kez planlanır,
+# en iyi sonuç tutulur. Koşular birbirinden bağımsız olduğundan süreç havuzunda paralel çalışır.
+# Çakışma grafı ana süreçte bir kez kurulur ve her işçiye yalnız bir kez gönderilir (initializer).
+# Aynı base_seed + runs → aynı sonuç (yerel arama improve_iterations ile sınırlanmalı).
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .graph import build_conflict_graph
+from .local_search import soft_penalty
+from .planner import DEFAULT_CONSTRAINTS, plan_exams
+
+# İşçi sürecindeki ortak girdi (initializer doldurur)
+_SHARED: Dict = {}
+
+
+def run_seeds(base_seed: int, runs: int) -> List[int]:
+    """Koşu tohumları: base_seed, base_seed+1, ... (koşu sayısından bağımsız olarak aynı önek)."""
+    return [int(base_seed) + k for k in range(int(runs))]
+
+
+def plan_score(result: Dict, neighbors, course_year: Dict[int, int], slots: list) -> Tuple:
+    """
+    Sözlük sırasıyla karşılaştırılan puan (küçük daha iyi):
+    (yerleşmeyen, aynı slot çakışması, cooldown ihlali, aynı gün aynı sınıf yükü, kullanılan slot)
+    """
+    m = result["metrics"]
+    same_day = soft_penalty(result["placements"], neighbors, {}, course_year, slots)["same_day_year"]
+    return (m.get("unplaced", 0), m.get("conflicts", 0), m.get("cooldown_violations", 0),
+            same_day, m.get("slots_used", 0))
+
+
+def _init_worker(courses, enrollments, slots, constraints, graph, rooms=None, room_busy=None):
+    _SHARED.update(courses=courses, enrollments=enrollments, slots=slots, constraints=constraints,
+                   graph=graph, rooms=rooms, room_busy=room_busy,
+                   course_year={cid: cy for cid, _, cy in courses})
+
+
+def _run_one(seed: int) -> Tuple[Tuple, int, Dict]:
+    s = _SHARED
+    c = dict(s["constraints"])
+    c["seed"] = seed
+    # graf hazır: kayıtlar yalnız ders büyüklükleri (sıralama) için kullanılır
+    res = plan_exams(s["courses"], s["enrollments"], s["slots"], c, graph=s["graph"],
+                     rooms=s["rooms"], room_busy=s["room_busy"])
+    res.pop("weights", None)
+    score = plan_score(res, s["graph"][0], s["course_year"], s["slots"])
+    return score, seed, res
+
+
+def plan_multistart(courses: List[Tuple[int, str, int]],
+                    enrollments: Iterable[Tuple[int, int]],
+                    slots: list,
+                    constraints: Optional[Dict] = None,
+                    runs: int = 8,
+                    base_seed: int = 0,
+                    workers: Optional[int] = None,
+                    rooms=None,
+                    room_busy=None,
+                    graph=None) -> Dict:
+    """
+    plan_exams ile aynı dönüş biçimi; metrics'e "multistart" eklenir:
+      {"runs", "workers", "best_seed", "best_score", "scores": [(seed, score), ...], "elapsed_s"}
+    workers: süreç sayısı (None: CPU sayısı, 1: aynı süreçte sıralı)
+    rooms / room_busy: plan_exams'a aynen geçer (ortak zaman + derslik ataması)
+    graph: hazır (neighbors, weights) (ör. graph_cache); yoksa bir kez kurulur, tüm denemeler paylaşır
+    """
+    c = dict(DEFAULT_CONSTRAINTS)
+    c.update(constraints or {})
+    c.pop("seed", None)
+    excluded_ids = set(c.get("excluded_courses", set()) or set())
+    if excluded_ids:
+        courses = [row for row in courses if row[0] not in excluded_ids]
+        c["excluded_courses"] = set()
+
+    enrollments = list(enrollments)
+    seeds = run_seeds(base_seed, max(1, int(runs)))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(seeds)))
+
+    t0 = time.perf_counter()
+    cids = [cid for cid, _, _ in courses]
+    if graph is None:
+        graph = build_conflict_graph(enrollments, cids)
+    args = (courses, enrollments, slots, c, graph, rooms, room_busy)
+
+    if workers == 1:
+        _init_worker(*args)
+        outcomes = [_run_one(s) for s in seeds]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=args) as ex:
+            outcomes = list(ex.map(_run_one, seeds))
+
+    # eşit puanda küçük seed kazanır: tamamlanma sırasından bağımsız, tekrarlanabilir
+    best_score, best_seed, best = min(outcomes, key=lambda o: (o[0], o[1]))
+    best["weights"] = graph[1]
+    best["metrics"]["multistart"] = {
+        "runs": len(seeds),
+        "workers": workers,
+        "best_seed": best_seed,
+        "best_score": best_score,
+        "scores": [(seed, score) for score, seed, _ in outcomes],
+        "elapsed_s": time.perf_counter() - t0,
+    }
+    return best
+
@@ -0,0 +1,407 @@
+# src/core/scheduler/planner.py
+# Çakışma-farkında sınav yerleştirici (saf API: DB/GUI yok).
+# Stratejiler:
+#   greedy — (öğrenci sayısı, derece) sırasıyla ilk uygun slot; yer yoksa son slota zorlar
+#   dsatur — her adımda en çok farklı slotu bloklanmış dersi seçer; yer yoksa "unplaced" bildirir
+# improve_seconds > 0 ise ardından süre sınırlı yerel arama (local_search) yumuşak cezaları düşürür.
+# pinned verilirse o dersler yerinde kalır, yalnız kalanlar yerleştirilir (artımlı onarım: repair).
+# rooms verilirse zaman ve derslik birlikte seçilir: slot, sınavın öğrenci sayısı o slotta boş kalan
+# dersliklere (gerekirse bölünerek) sığıyorsa adaydır (sığan slot yoksa dersliksiz ilk uygun slota düşülür).
+# Sınavlar [başlangıç, başlangıç + süre) aralıklarıdır (süre: durations[cid], yoksa default_duration):
+# ortak öğrencili iki ders, aralıkları örtüşen ya da arası cooldown'dan kısa (intervals.too_close)
+# slotlara konmaz; süre slot aralığından uzunsa komşu slotlar da kapanır. Sabit (pinned) sınavlar
+# ızgara dışında ve uzun olabilir, kendi aralıklarıyla kapatırlar. Tek sınav modu ve derslikler de
+# örtüşen slotları dolu sayar.
+
+import heapq
+import random
+import time
+from collections import defaultdict
+from datetime import timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .cooldown import CooldownIndex
+from .graph import course_students_of, edge_weights, invert_enrollments, neighbors_of
+from .intervals import DEFAULT_DURATION_MIN, slots_near
+from .local_search import improve_plan
+from .rooms import Room, RoomPool
+
+# ScheduleView.constraints ile aynı anahtarlar
+DEFAULT_CONSTRAINTS = {
+    "date_start": None,
+    "date_end": None,
+    "exclude_days": set(),
+    "default_duration": DEFAULT_DURATION_MIN,
+    "cooldown_min": 15,
+    "single_exam_at_a_time": False,
+    "exam_type": "Vize",
+    "excluded_courses": set(),
+    "strategy": "greedy",           # yerleştirme: greedy | dsatur
+    "improve_seconds": 0,           # yerel arama süresi (sn), 0 = kapalı
+    "improve_iterations": None,     # verilirse yerel arama hamle sayısıyla sınırlanır (tekrarlanabilir)
+    "seed": None,                   # None: deterministik sıra; sayı: tohumlu rastgele sıra/eşitlik bozma
+    "multistart_runs": 1,           # >1: plan_department çok başlangıçlı paralel planlama yapar
+    "multistart_workers": None,     # süreç sayısı (None: CPU sayısı)
+    "joint_rooms": False,           # True: plan_department derslikleri zamanla birlikte atar
+    "graph_cache_dir": None,        # çakışma grafı disk önbelleği (None: yalnız süreç belleğinde)
+}
+
+STRATEGIES = ("greedy", "dsatur")
+
+
+def plan_exams(courses: List[Tuple[int, str, int]],
+               enrollments: Iterable[Tuple[int, int]],
+               slots: list,
+               constraints: Optional[Dict] = None,
+               graph: Optional[Tuple[Dict[int, Set[int]], Dict[Tuple[int, int], int]]] = None,
+               pinned: Optional[Dict[int, object]] = None,
+               rooms: Optional[List[Room]] = None,
+               room_busy: Optional[Dict[object, Set[int]]] = None,
+               durations: Optional[Dict[int, int]] = None) -> Dict:
+    """
+    courses: [(cid, code, class_year), ...]
+    enrollments: (student_id, course_id) çiftleri
+    slots: sıralı datetime listesi
+    graph: hazır (neighbors, weights) çakışma grafı (yoksa kayıtlardan kurulur)
+    pinned: {cid: datetime} sabit yerleşimler (slots dışında bir saat olabilir); yerel arama çalışmaz
+    durations: {cid: dk} dersin sınav süresi (sabit ya da yeniden yerleşen mevcut sınavlar; yoksa
+               default_duration); verilirse yerel arama çalışmaz
+    rooms: [(room_id, code, capacity)] verilirse derslik de atanır; room_busy: {slot: {room_id}} dolu olanlar
+    Dönen:
+      {"placements": {cid: datetime},
+       "rooms": {cid: [(room_id, koltuk), ...]},   (yalnız rooms verildiyse dolu; çok parça = bölünmüş)
+       "unplaced": [cid, ...],
+       "forced": [cid, ...],                        (greedy: uygun slot bulunamayıp son slota zorlananlar)
+       "weights": {(a, b): ortak öğrenci},
+       "metrics": {...}}
+    """
+    c = dict(DEFAULT_CONSTRAINTS)
+    c.update(constraints or {})
+    strategy = c.get("strategy") or "greedy"
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Bilinmeyen strateji: {strategy} (seçenekler: {', '.join(STRATEGIES)})")
+
+    excluded_ids = set(c.get("excluded_courses", set()) or set())
+    if excluded_ids:
+        courses = [row for row in courses if row[0] not in excluded_ids]
+
+    metrics = {"courses": len(courses), "slots": len(slots)}
+    if not courses or not slots:
+        metrics.update({"strategy": strategy, "placed": 0, "unplaced": len(courses), "forced": 0,
+                        "conflicts": 0, "cooldown_violations": 0, "slots_used": 0})
+        return {"placements": {}, "rooms": {}, "unplaced": [row[0] for row in courses], "forced": [],
+                "weights": {}, "metrics": metrics}
+
+    cids = [cid for cid, _, _ in courses]
+    course_year = {cid: cy for cid, _, cy in courses}
+    pinned = {cid: ts for cid, ts in (pinned or {}).items() if cid in course_year}
+    free = [cid for cid in cids if cid not in pinned]
+
+    # Ters indeks (öğrenci → dersler) + çakışma grafı
+    t0 = time.perf_counter()
+    enrollments = list(enrollments)
+    student_courses = invert_enrollments(enrollments, cids)
+    by_course = course_students_of(student_courses)
+    course_students = {cid: by_course.get(cid, set()) for cid in cids}
+    course_sizes = {cid: len(course_students[cid]) for cid in cids}
+    if graph is None:
+        weights = edge_weights(student_courses)
+        neighbors = neighbors_of(weights, cids)
+    else:
+        neighbors, weights = graph
+    metrics["graph_s"] = time.perf_counter() - t0
+    metrics["edges"] = sum(len(v) for v in neighbors.values()) // 2
+
+    single = bool(c.get("single_exam_at_a_time", False))
+    cooldown = int(c.get("cooldown_min", 0) or 0)
+    duration = int(c.get("default_duration") or DEFAULT_DURATION_MIN)
+    durations = {cid: int(d) for cid, d in (durations or {}).items() if cid in course_year and d}
+    dur_of = {cid: durations.get(cid, duration) for cid in cids}
+
+    seed = c.get("seed")
+    rnd = random.Random(seed) if seed is not None else None
+    pool = RoomPool(rooms, room_busy) if rooms else None
+    room_of = {}
+
+    t0 = time.perf_counter()
+    if strategy == "dsatur":
+        placed_time, unplaced = _place_dsatur(free, neighbors, course_sizes, course_year, slots, single, cooldown,
+                                              rnd, pinned, pool, room_of, dur_of)
+        forced = []
+    else:
+        placed_time, forced = _place_greedy(free, neighbors, course_sizes, course_year, slots, single, cooldown,
+                                            rnd, pinned, pool, room_of, dur_of)
+        unplaced = []
+    metrics["place_s"] = time.perf_counter() - t0
+
+    budget = float(c.get("improve_seconds", 0) or 0)
+    max_iter = c.get("improve_iterations")
+    # yerel arama derslik doluluğunu bilmez: ortak modda çalışmaz; tüm sınavları default_duration sayar
+    if (budget > 0 or max_iter) and placed_time and not pinned and not durations and pool is None:
+        placed_time, ls = improve_plan(placed_time, neighbors, weights, course_year, slots,
+                                       c, time_budget=budget, seed=seed, max_iterations=max_iter)
+        metrics["improve"] = ls
+
+    metrics["strategy"] = strategy
+    metrics["forced"] = len(forced)
+    metrics["pinned"] = len(pinned)
+    if pool is not None:
+        metrics["rooms_assigned"] = len(room_of)
+        metrics["room_unassigned"] = len(free) - len(unplaced) - len(room_of)
+    metrics.update(plan_metrics(placed_time, neighbors, cooldown, duration, durations))
+    metrics["unplaced"] = len(unplaced)
+    return {"placements": placed_time, "rooms": room_of, "unplaced": unplaced, "forced": forced,
+            "weights": weights, "metrics": metrics}
+
+
+def plan_metrics(placements: Dict[int, object], neighbors: Dict[int, Set[int]], cooldown: int = 0,
+                 duration_min: Optional[int] = None, durations: Optional[Dict[int, int]] = None) -> Dict:
+    """
+    Bir yerleşimin özet ölçüleri: yerleşen, kullanılan slot, zamanı örtüşen komşu çifti (conflicts),
+    cooldown'dan yakın komşu çifti (örtüşenler dahil).
+    Sınav süresi durations[cid], yoksa duration_min (default_duration).
+    """
+    durations = durations or {}
+
+    def _pairs(gap):
+        idx = CooldownIndex(neighbors, gap, duration_min)
+        for cid, ts in placements.items():
+            idx.place(cid, ts, durations.get(cid))
+        return sum(idx.violations(cid, ts, durations.get(cid)) for cid, ts in placements.items()) // 2
+
+    return {
+        "placed": len(placements),
+        "slots_used": len(set(placements.values())),
+        "conflicts": _pairs(0),
+        "cooldown_violations": _pairs(cooldown) if cooldown > 0 else 0,
+    }
+
+
+def _take_rooms(pool, slots, i, need, minutes, longest):
+    """
+    slots[i]'de (minutes süreli sınava) derslik ayırır; aynı derslikler, longest süreli bir sınavın
+    bu aralıkla örtüşeceği diğer slotlarda da dolu sayılır (süreler farklıysa temkinli).
+    """
+    parts = pool.take(slots[i], need)
+    rids = [rid for rid, _ in parts]
+    for j in slots_near(slots, slots[i], slots[i] + timedelta(minutes=minutes), longest):
+        if j != i:
+            pool.block(slots[j], rids)
+    return parts
+
+
+def _closer(slots: list, cooldown: int):
+    """
+    closes(ts, m, d): ts'de başlayan m dk'lık sınavın, d dk'lık komşusu için kapattığı slot indeksleri.
+    Izgarada az sayıda farklı (ts, m, d) olduğundan sonuçlar önbelleklenir.
+    """
+    @lru_cache(maxsize=None)
+    def closes(ts, minutes: int, other_minutes: int) -> range:
+        return slots_near(slots, ts, ts + timedelta(minutes=minutes), other_minutes, cooldown)
+    return closes
+
+
+class _Occupied:
+    """Tek sınav modu: yerleşmiş sınav aralıkları → süresi d olan bir sınavın örtüşeceği slotlar (d başına)."""
+
+    def __init__(self, slots: list):
+        self.slots = slots
+        self.spans = []
+        self._by_dur = {}
+
+    def add(self, start, minutes: int):
+        end = start + timedelta(minutes=minutes)
+        self.spans.append((start, end))
+        for d, taken in self._by_dur.items():
+            taken.update(slots_near(self.slots, start, end, d))
+
+    def taken(self, minutes: int) -> Set[int]:
+        taken = self._by_dur.get(minutes)
+        if taken is None:
+            taken = self._by_dur[minutes] = set()
+            for start, end in self.spans:
+                taken.update(slots_near(self.slots, start, end, minutes))
+        return taken
+
+
+def _place_greedy(cids, neighbors, course_sizes, course_year, slots, single, cooldown, rnd=None, pinned=None,
+                  pool=None, room_of=None, dur_of=None):
+    """
+    Sabit sıra + ilk uygun slot. Dönen: (placements, zorla son slota konan dersler)
+    Uygun slot: hiçbir yerleşmiş komşu sınavla too_close değil (süreler dur_of {cid: dk}); komşu başına
+    kapanan slotlar bisect ile bir aralık olarak bulunur (intervals.slots_near).
+    rnd verilirse öğrenci sayıları ±%10 oynatılır ve eşitlikler rastgele bozulur (multi-start çeşitliliği).
+    pinned: önceden yerleşmiş {cid: ts}; dönen placements bunları da içerir.
+    pool (RoomPool) verilirse sığan boş dersliği olan slotlar tercih edilir, derslik room_of'a yazılır.
+    """
+    if rnd is None:
+        order = sorted(cids, key=lambda x: (course_sizes[x], len(neighbors.get(x, ()))), reverse=True)
+    else:
+        jitter = {cid: (0.9 + 0.2 * rnd.random(), rnd.random()) for cid in cids}
+        order = sorted(cids, key=lambda x: (course_sizes[x] * jitter[x][0], len(neighbors.get(x, ())),
+                                            jitter[x][1]), reverse=True)
+
+    dur_of = dur_of if dur_of is not None else defaultdict(lambda: DEFAULT_DURATION_MIN)
+    longest = max(dur_of.values(), default=DEFAULT_DURATION_MIN)   # derslik: örtüşebilecek en uzun sınav
+    closes = _closer(slots, cooldown)
+    placed_time = {}                      # cid -> slot(datetime)
+    occupied = _Occupied(slots)           # tek sınav modu
+    used_days_by_year = defaultdict(set)  # class_year -> {date}
+    forced = []
+    for cid, ts in (pinned or {}).items():
+        placed_time[cid] = ts
+        occupied.add(ts, dur_of[cid])
+        if course_year.get(cid) is not None:
+            used_days_by_year[course_year[cid]].add(ts.date())
+
+    for cid in order:
+        need = course_sizes[cid]
+        need_room = pool is not None and pool.coverable(need)
+        minutes = dur_of[cid]
+        forbiddens = set()
+        for nb in neighbors.get(cid, ()):
+            if nb in placed_time:
+                forbiddens.update(closes(placed_time[nb], dur_of[nb], minutes))
+        busy = occupied.taken(minutes) if single else ()
+
+        def _can_place_at(i, with_room):
+            if i in forbiddens or i in busy:
+                return False
+            if with_room and not pool.can_host(slots[i], need):
+                return False
+            return True
+
+        chosen = None
+        cy = course_year.get(cid, None)
+
+        # Aşama 1: Aynı sınıf yılına farklı gün; Aşama 2: genel ilk uygun slot.
+        # Ortak derslik modunda önce derslikli, olmazsa dersliksiz denenir.
+        for with_room in ((True, False) if need_room else (False,)):
+            if cy is not None:
+                for i, ts in enumerate(slots):
+                    if ts.date() in used_days_by_year[cy]:
+                        continue
+                    if _can_place_at(i, with_room):
+                        chosen = i
+                        break
+            if chosen is None:
+                for i in range(len(slots)):
+                    if _can_place_at(i, with_room):
+                        chosen = i
+                        break
+            if chosen is not None:
+                if with_room:
+                    room_of[cid] = _take_rooms(pool, slots, chosen, need, minutes, longest)
+                break
+
+        if chosen is None:
+            chosen = len(slots) - 1
+            forced.append(cid)
+
+        ts = slots[chosen]
+        placed_time[cid] = ts
+        occupied.add(ts, minutes)
+        if cy is not None:
+            used_days_by_year[cy].add(ts.date())
+
+    return placed_time, forced
+
+
+def _place_dsatur(cids, neighbors, course_sizes, course_year, slots, single, cooldown, rnd=None, pinned=None,
+                  pool=None, room_of=None, dur_of=None):
+    """
+    DSATUR: doygunluk = yerleşmiş komşular yüzünden kapanan farklı slot sayısı
+    (komşu sınavla too_close olan her slot kapanır; süreler dur_of {cid: dk}).
+    Her adımda en doygun ders (eşitlikte derece, sonra öğrenci sayısı) ilk uygun slota konur.
+    Uygun slot yoksa ders zorlanmaz, "unplaced" listesine yazılır.
+    rnd verilirse kalan eşitlikler rastgele bozulur.
+    pinned: önceden yerleşmiş {cid: ts}; komşularının doygunluğuna baştan yazılır.
+    pool (RoomPool) verilirse sığan boş dersliği olan slotlar tercih edilir, derslik room_of'a yazılır.
+    Dönen: (placements, unplaced)
+    """
+    dur_of = dur_of if dur_of is not None else defaultdict(lambda: DEFAULT_DURATION_MIN)
+    longest = max(dur_of.values(), default=DEFAULT_DURATION_MIN)   # derslik: örtüşebilecek en uzun sınav
+    blocked = {cid: set() for cid in cids}     # cid -> kapalı slot indeksleri
+    degree = {cid: len(neighbors.get(cid, ())) for cid in cids}
+    occupied = _Occupied(slots)                 # single_exam_at_a_time için
+    used_days_by_year = defaultdict(set)
+    placed_time = {}
+    unplaced = []
+    done = set()
+
+    closes = _closer(slots, cooldown)
+
+    def _close_for_neighbors(pcid, ts):
+        """pcid ts'de: henüz yerleşmemiş komşuları için too_close slotları kapatır; değişenleri döner."""
+        changed = []
+        for nb in neighbors.get(pcid, ()):
+            if nb in done or nb not in blocked:
+                continue
+            before = len(blocked[nb])
+            blocked[nb].update(closes(ts, dur_of[pcid], dur_of[nb]))
+            if len(blocked[nb]) != before:
+                changed.append(nb)
+        return changed
+
+    for pcid, ts in (pinned or {}).items():
+        placed_time[pcid] = ts
+        occupied.add(ts, dur_of[pcid])
+        if course_year.get(pcid) is not None:
+            used_days_by_year[course_year[pcid]].add(ts.date())
+        _close_for_neighbors(pcid, ts)
+
+    tie = {cid: (rnd.random() if rnd is not None else 0.0) for cid in cids}
+    heap = [(-len(blocked[cid]), -degree[cid], -course_sizes[cid], tie[cid], cid) for cid in cids]
+    heapq.heapify(heap)
+
+    while heap:
+        neg_sat, _, _, _, cid = heapq.heappop(heap)
+        if cid in done or -neg_sat != len(blocked[cid]):
+            continue                            # eski (bayat) kayıt
+        done.add(cid)
+
+        closed = blocked[cid]
+        cy = course_year.get(cid, None)
+        need = course_sizes[cid]
+        minutes = dur_of[cid]
+        busy = occupied.taken(minutes) if single else ()
+        chosen = None
+        with_room = False
+        # Aşama 1: Aynı sınıf yılına farklı gün; Aşama 2: ilk uygun slot
+        # (ortak derslik modunda önce derslikli, olmazsa dersliksiz)
+        room_modes = (True, False) if pool is not None and pool.coverable(need) else (False,)
+        for with_room in room_modes:
+            for phase in (1, 2):
+                if phase == 1 and cy is None:
+                    continue
+                for i, ts in enumerate(slots):
+                    if i in closed or i in busy:
+                        continue
+                    if phase == 1 and ts.date() in used_days_by_year[cy]:
+                        continue
+                    if with_room and not pool.can_host(ts, need):
+                        continue
+                    chosen = i
+                    break
+                if chosen is not None:
+                    break
+            if chosen is not None:
+                break
+
+        if chosen is None:
+            unplaced.append(cid)
+            continue
+
+        ts = slots[chosen]
+        placed_time[cid] = ts
+        if with_room:
+            room_of[cid] = _take_rooms(pool, slots, chosen, need, minutes, longest)
+        occupied.add(ts, minutes)
+        if cy is not None:
+            used_days_by_year[cy].add(ts.date())
+
+        for nb in _close_for_neighbors(cid, ts):
+            heapq.heappush(heap, (-len(blocked[nb]), -degree[nb], -course_sizes[nb], tie[nb], nb))
+
+    return placed_time, unplaced
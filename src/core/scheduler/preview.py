@@ -0,0 +1,63 @@
+# src/core/scheduler/preview.py
+# Sınav düzenleme penceresi için anlık çakışma önizlemesi.
+# Pencere açılırken bir kez yüklenir (store.load_move_preview): düzenlenen dersle ortak öğrencisi olan
+# derslerin sınav aralıkları ve derslik doluluğu, başlangıca göre sıralı listeler halinde tutulur.
+# Her tuş vuruşunda yalnız aday zamanın çevresi bisect ile taranır: O(log n + yakındaki sınav), SQL yok.
+# Zamanlar epoch dakika (exams.start_min) olarak tutulur.
+# Örtüşme ve cooldown, planlayıcı ve CooldownIndex ile aynı tanımdır (intervals.too_close): cooldown bir
+# sınavın bitişiyle ötekinin başlangıcı arasındaki süredir; önizlemenin uyardığını planlayıcı da reddeder.
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from .intervals import too_close
+
+# (başlangıç dk, bitiş dk, ders kodu, ortak öğrenci)
+NeighborExam = Tuple[int, int, str, int]
+# (başlangıç dk, bitiş dk, ders kodu)
+RoomUse = Tuple[int, int, str]
+
+
+class MovePreview:
+    def __init__(self, neighbor_exams: List[NeighborExam], room_usage: Dict[int, List[RoomUse]],
+                 duration_min: int, cooldown_min: int = 0):
+        self.duration = int(duration_min)
+        self.cooldown = max(0, int(cooldown_min or 0))
+        self._nb = sorted(neighbor_exams)
+        self._nb_starts = [n[0] for n in self._nb]
+        self._nb_span = max((e - s for s, e, _, _ in self._nb), default=0)
+        self._rooms = {rid: sorted(uses) for rid, uses in room_usage.items()}
+        self._room_starts = {rid: [u[0] for u in uses] for rid, uses in self._rooms.items()}
+        self._room_span = {rid: max((e - s for s, e, _ in uses), default=0) for rid, uses in self._rooms.items()}
+
+    def evaluate(self, start_min: int, room_id: Optional[int] = None) -> Dict:
+        """
+        Sınav start_min'de (ve room_id'de) olsaydı:
+          {"students": zamanı örtüşen ortak öğrenci sayısı, "student_courses": [(kod, öğrenci)],
+           "cooldown": cooldown'dan yakın (örtüşmeyen) ortak öğrenci sayısı, "cooldown_courses": [(kod, öğrenci)],
+           "room": [aynı derslikte örtüşen ders kodları]}
+        """
+        s, e = start_min, start_min + self.duration
+        out = {"students": 0, "student_courses": [], "cooldown": 0, "cooldown_courses": [], "room": []}
+
+        # aday aralığa cooldown kadar yakın her komşu sınav; en uzun komşu kadar geriden başlanır
+        i = bisect_left(self._nb_starts, s - self._nb_span - self.cooldown)
+        while i < len(self._nb) and self._nb[i][0] < e + self.cooldown:
+            ns, ne, code, common = self._nb[i]
+            i += 1
+            if too_close(s, e, ns, ne, 0):
+                out["students"] += common
+                out["student_courses"].append((code, common))
+            elif self.cooldown and too_close(s, e, ns, ne, self.cooldown):
+                out["cooldown"] += common
+                out["cooldown_courses"].append((code, common))
+
+        if room_id is not None and room_id in self._rooms:
+            uses, starts = self._rooms[room_id], self._room_starts[room_id]
+            i = bisect_left(starts, s - self._room_span[room_id])
+            while i < len(uses) and uses[i][0] < e:
+                us, ue, code = uses[i]
+                i += 1
+                if too_close(s, e, us, ue, 0):
+                    out["room"].append(code)
+        return out
@@ -0,0 +1,118 @@
+# src/core/scheduler/repair.py
+# Artımlı onarım: mevcut yerleşimler (elle düzeltmeler dahil) sabitlenir, yalnızca
+#   - yeni / sınavı olmayan dersler,
+#   - açıkça kirli (dirty) işaretlenen dersler (ör. kayıtları yeniden içe aktarılan),
+#   - mevcut yerleşimde zamanı örtüşen (aynı slot ya da kısmi örtüşme) ortak öğrencili derslerden biri
+# yeniden yerleştirilir. Çakışma grafı yalnız bu derslerin öğrencileri üzerinden kurulur.
+# Yerleşimde sabit sınavlar kendi aralıklarıyla (başlangıç + kayıtlı süre; ızgara dışı/uzun olabilir),
+# taşınan mevcut sınavlar da kendi süreleriyle değerlendirilir: onarım, conflicting_courses'un
+# yeniden işaretleyeceği bir örtüşme üretmez.
+
+import time
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .conflicts import conflict_report
+from .graph import course_students_of, invert_enrollments, neighbors_of
+from .intervals import exam_interval
+from .planner import DEFAULT_CONSTRAINTS, plan_exams
+
+
+def conflicting_courses(enrollments: List[Tuple[int, int]], existing: Dict[int, object],
+                        course_sizes: Dict[int, int], duration_min: Optional[int] = None,
+                        durations: Optional[Dict[int, int]] = None) -> Set[int]:
+    """
+    Zamanı örtüşen ortak öğrencili çiftlerden taşınacak dersler (açgözlü tepe örtüsü):
+    çok çakışan önce, eşitlikte öğrencisi az olan (taşıması ucuz) seçilir.
+    Aralıklar: existing başlangıcı + durations[cid] (yoksa duration_min); çiftler Çakışma Hesapla ile aynı
+    tarama çizgisinden gelir (conflicts.conflict_report).
+    """
+    durations = durations or {}
+    interval_of = {cid: exam_interval(ts, durations.get(cid) or duration_min) for cid, ts in existing.items()}
+    pairs = conflict_report(enrollments, interval_of)["per_pair"]
+    if not pairs:
+        return set()
+    hits = {}
+    for a, b in pairs:
+        hits[a] = hits.get(a, 0) + 1
+        hits[b] = hits.get(b, 0) + 1
+    def _cost(x):
+        return -hits[x], course_sizes.get(x, 0), x
+
+    moved = set()
+    for a, b in sorted(pairs):
+        if a in moved or b in moved:
+            continue
+        moved.add(min((a, b), key=_cost))
+    return moved
+
+
+def _local_graph(student_courses: Dict[int, List[int]], free: Set[int]):
+    """Yalnız serbest dersleri içeren kenarlar (serbest–serbest ve serbest–sabit)."""
+    weights = {}
+    for cs in student_courses.values():
+        if len(cs) < 2 or free.isdisjoint(cs):
+            continue
+        for a, b in combinations(sorted(set(cs)), 2):
+            if a in free or b in free:
+                weights[(a, b)] = weights.get((a, b), 0) + 1
+    return weights
+
+
+def repair_plan(courses: List[Tuple[int, str, int]],
+                enrollments: Iterable[Tuple[int, int]],
+                slots: list,
+                existing: Dict[int, object],
+                constraints: Optional[Dict] = None,
+                dirty: Iterable[int] = (),
+                durations: Optional[Dict[int, int]] = None) -> Dict:
+    """
+    existing: mevcut yerleşim {cid: datetime}
+    dirty: sabit olsa da yeniden yerleştirilecek dersler
+    durations: mevcut sınavların süresi {cid: dk} (yoksa kısıtlardaki default_duration)
+    Dönen: plan_exams biçimi + "changed": {cid: yeni zaman} (yalnız değişen/yeni dersler)
+      metrics["repair"] = {"pinned", "new", "dirty", "conflicting", "replaced", "elapsed_s"}
+    """
+    c = dict(DEFAULT_CONSTRAINTS)
+    c.update(constraints or {})
+    t0 = time.perf_counter()
+
+    excluded_ids = set(c.get("excluded_courses", set()) or set())
+    courses = [row for row in courses if row[0] not in excluded_ids]
+    cids = {cid for cid, _, _ in courses}
+    existing = {cid: ts for cid, ts in existing.items() if cid in cids}
+    enrollments = [(s, cid) for s, cid in enrollments if cid in cids]
+
+    student_courses = invert_enrollments(enrollments)
+    sizes = {cid: len(st) for cid, st in course_students_of(student_courses).items()}
+
+    new = cids - existing.keys()
+    dirty = set(dirty) & existing.keys()
+    conflicting = conflicting_courses(enrollments, existing, sizes, c.get("default_duration"), durations) - dirty
+    free = new | dirty | conflicting
+    pinned = {cid: ts for cid, ts in existing.items() if cid not in free}
+
+    weights = _local_graph(student_courses, free)
+    neighbors = neighbors_of(weights, cids)
+    c["excluded_courses"] = set()
+    result = plan_exams(courses, enrollments, slots, c, graph=(neighbors, weights), pinned=pinned,
+                        durations=durations)
+    # zorla son slota konan ders bir çakışma üretirdi: mevcut sınav yerinde kalır, yeni ders yerleşmemiş sayılır
+    for cid in set(result["forced"]) & free:
+        if cid in existing:
+            result["placements"][cid] = existing[cid]
+        else:
+            del result["placements"][cid]
+            result["unplaced"].append(cid)
+
+    result["changed"] = {cid: result["placements"][cid] for cid in free
+                         if cid in result["placements"] and result["placements"][cid] != existing.get(cid)}
+    result["metrics"]["repair"] = {
+        "pinned": len(pinned),
+        "new": len(new),
+        "dirty": len(dirty),
+        "conflicting": len(conflicting),
+        "replaced": len(result["changed"]),
+        "elapsed_s": time.perf_counter() - t0,
+    }
+    return result
@@ -0,0 +1,174 @@
+# src/core/scheduler/room_match.py
+# İsteğe bağlı en iyi (optimal) derslik ataması: her slot, sınavlar × boş derslikler arasında
+# minimum maliyetli iki parçalı eşleme olarak çözülür (scipy.optimize.linear_sum_assignment).
+#   maliyet(sınav, derslik) = boş kalan koltuk (kapasite yetmiyorsa yasak)
+#   her sınav için bir "atanamadı" sütunu: maliyeti tüm boş koltuklardan büyük → önce atanan sayısı
+#   en çoklanır, sonra boş koltuk en aza iner.
+# Slotlar birbirinden bağımsızdır; süreç havuzunda paralel çözülür. Hiçbir dersliğe tek başına sığmayan
+# sınavlar greedy'deki gibi eşlemeden önce bölünür (split_rooms), eşleme kalan dersliklerle yapılır;
+# eşlemede yer bulamayanlar da kalanlara bölünmeye çalışılır. Bir slotta greedy (assign_rooms) daha az
+# sınavı dışarıda bırakıyorsa o slot için greedy sonucu kullanılır: optimal hiçbir slotta greedy'den
+# çok sınavı atanmamış bırakmaz.
+
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from .rooms import Room, assign_rooms, split_rooms
+
+SOLVERS = ("greedy", "optimal")
+# Bundan az slotta süreç havuzu kurmak kazançtan pahalı
+PARALLEL_MIN_SLOTS = 16
+
+
+def matching_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+        import scipy.optimize  # noqa: F401
+        return True
+    except ModuleNotFoundError:
+        return False
+
+
+def _solve_slot(job):
+    """job: (slot, [(exam_id, need)], [Room] boş derslikler, split) → (slot, {exam_id: parts}, [kalan exam])"""
+    import numpy as np
+    from scipy.optimize import linear_sum_assignment
+
+    ts, exams, free, split = job
+    assigned = {}
+    rest = free
+    largest = max((r[2] for r in free), default=0)
+    single = [e for e in exams if (e[1] or 0) <= largest]
+    if split:
+        # tek dersliğe sığmayanlar önce: eşleme bölünmenin muhtaç olduğu derslikleri küçük sınavlara vermesin
+        for exam_id, need_i in sorted(exams, key=lambda e: (-(e[1] or 0), e[0])):
+            if (need_i or 0) <= largest:
+                break
+            parts = split_rooms(rest, need_i)
+            if parts is None:
+                continue
+            assigned[exam_id] = parts
+            taken = {rid for rid, _ in parts}
+            rest = [r for r in rest if r[0] not in taken]
+
+    n, m = len(single), len(rest)
+    if n and m:
+        need = np.array([e[1] or 0 for e in single], dtype=np.int64)
+        cap = np.array([r[2] for r in rest], dtype=np.int64)
+        waste = cap[None, :] - need[:, None]                    # n × m
+        unassigned = int(cap.sum()) + 1                         # her boş koltuk toplamından pahalı
+        forbidden = unassigned * (n + 1)                        # hiçbir zaman seçilmez
+        cost = np.full((n, m + n), forbidden, dtype=np.int64)
+        cost[:, :m] = np.where(waste >= 0, waste, forbidden)
+        cost[np.arange(n), m + np.arange(n)] = unassigned       # sınava özel "atanamadı" sütunu
+        rows, cols = linear_sum_assignment(cost)
+        for r, c in zip(rows.tolist(), cols.tolist()):
+            if c < m and cost[r, c] < forbidden:
+                assigned[single[r][0]] = [(rest[c][0], int(need[r]))]
+
+    left = [e for e in exams if e[0] not in assigned]
+    if split and left:
+        used = {rid for parts in assigned.values() for rid, _ in parts}
+        rest = [r for r in free if r[0] not in used]
+        for exam_id, need_i in sorted(left, key=lambda e: (-(e[1] or 0), e[0])):
+            parts = split_rooms(rest, need_i or 0)
+            if parts is None:
+                continue
+            assigned[exam_id] = parts
+            taken = {rid for rid, _ in parts}
+            rest = [r for r in rest if r[0] not in taken]
+        left = [e for e in exams if e[0] not in assigned]
+    if left:
+        g_assigned, g_failed = assign_rooms([(exam_id, ts, need_i) for exam_id, need_i in exams], free, None, split)
+        if len(g_failed) < len(left):
+            return ts, g_assigned, [e for e in exams if e[0] not in g_assigned]
+    return ts, assigned, left
+
+
+def assign_rooms_optimal(exams: Iterable[Tuple[int, object, int]], rooms: Iterable[Room],
+                         busy: Optional[Dict[object, Set[int]]] = None, split: bool = True,
+                         workers: Optional[int] = None,
+                         overlaps: Optional[Dict[object, Set[object]]] = None):
+    """
+    assign_rooms ile aynı girdi/çıktı; slot başına min-cost eşleme.
+    workers: süreç sayısı (None: CPU sayısı; az slotta ya da 1 ise sıralı)
+    overlaps: {slot: {zamanı örtüşen slotlar}} — bunlar bağımsız değil; zaman sırasıyla
+              ardışık çözülür, öncekinin aldığı derslikler sonrakinde dolu sayılır
+    """
+    if not matching_available():
+        raise ModuleNotFoundError("numpy/scipy yüklü değil. Kurulum: pip install numpy scipy")
+    rooms = sorted(rooms, key=lambda r: (r[2], r[1]))
+    busy = busy or {}
+    by_ts = defaultdict(list)
+    for exam_id, ts, need in exams:
+        by_ts[ts].append((exam_id, need))
+
+    overlaps = overlaps or {}
+    jobs, linked = [], []
+    for ts in sorted(by_ts, key=str):
+        if overlaps.get(ts):
+            linked.append(ts)
+            continue
+        used = busy.get(ts, ())
+        jobs.append((ts, by_ts[ts], [r for r in rooms if r[0] not in used], split))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(jobs) >= PARALLEL_MIN_SLOTS:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_solve_slot, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    else:
+        results = [_solve_slot(j) for j in jobs]
+
+    free_of = {j[0]: j[2] for j in jobs}
+    taken_at = defaultdict(set)
+    for ts in linked:
+        used = set(busy.get(ts, ()))
+        for other in overlaps[ts]:
+            used |= taken_at[other]
+        job = (ts, by_ts[ts], [r for r in rooms if r[0] not in used], split)
+        free_of[ts] = job[2]
+        res = _solve_slot(job)
+        taken_at[ts] = {rid for parts in res[1].values() for rid, _ in parts}
+        results.append(res)
+
+    assigned, failed = {}, []
+    for ts, done, left in results:
+        assigned.update(done)
+        if left:
+            taken = {rid for parts in done.values() for rid, _ in parts}
+            free = [r for r in free_of[ts] if r[0] not in taken]
+            most = sum(r[2] for r in free) if split else max((r[2] for r in free), default=0)
+            failed.extend((exam_id, ts, need or 0, len(free), most) for exam_id, need in left)
+    return assigned, failed
+
+
+def room_summary(rooms: Iterable[Room], assigned: Dict[int, list], failed: list, elapsed: float = 0.0) -> Dict:
+    """Atama özeti: atanan, bölünen, atanamayan, boş kalan koltuk, süre."""
+    cap_of = {r[0]: r[2] for r in rooms}
+    waste = sum(cap_of[rid] - seats for parts in assigned.values() for rid, seats in parts)
+    return {
+        "assigned": len(assigned),
+        "split": sum(1 for parts in assigned.values() if len(parts) > 1),
+        "unassigned": len(failed),
+        "wasted_seats": waste,
+        "elapsed_s": elapsed,
+    }
+
+
+def compare_room_assignment(exams: Iterable[Tuple[int, object, int]], rooms: Iterable[Room],
+                            busy: Optional[Dict[object, Set[int]]] = None, split: bool = True,
+                            workers: Optional[int] = None) -> Dict[str, Dict]:
+    """Greedy (assign_rooms) ile optimal eşlemenin özetleri: {"greedy": {...}, "optimal": {...}}"""
+    exams, rooms = list(exams), list(rooms)
+    out = {}
+    t0 = time.perf_counter()
+    g = assign_rooms(exams, rooms, busy, split)
+    out["greedy"] = room_summary(rooms, *g, time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    o = assign_rooms_optimal(exams, rooms, busy, split, workers)
+    out["optimal"] = room_summary(rooms, *o, time.perf_counter() - t0)
+    return out
@@ -0,0 +1,176 @@
+# src/core/scheduler/rooms.py
+# Slot başına derslik doluluğu: planlayıcı zamanı seçerken sınavın öğrenci sayısının
+# o slotta boş kalan dersliklere sığıp sığmadığına bakar ve yeri ayırır.
+# Tek dersliğe sığan sınav sığdığı en küçük dersliğe konur (best-fit); hiçbir dersliğe tek başına
+# sığmayan sınav (split=True ise) birden çok dersliğe bölünür (split_rooms).
+# Her slotun boş derslikleri kapasiteye göre sıralı bir listede tutulur: best-fit arama bisect ile
+# O(log R); silme/ekleme konumu bisect ile bulunur ama liste kaydırması O(R). Bölüm başına derslik
+# sayısı onlarla sınırlı olduğundan kaydırma bir memmove'dur; sıralı ağaç yapısı bağımlılığa değmez.
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from itertools import combinations
+from math import comb
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+Room = Tuple[int, str, int]   # (room_id, code, capacity)
+Parts = List[Tuple[int, int]]  # [(room_id, koltuk), ...] — ilk eleman ana derslik
+
+# Bu sayıdan az k'lı derslik kombinasyonu varsa tam arama yapılır
+EXACT_SPLIT_LIMIT = 2000
+
+
+def split_rooms(free: List[Room], need: int, exact_limit: int = EXACT_SPLIT_LIMIT) -> Optional[Parts]:
+    """
+    need öğrenciyi free derslikler arasında paylaştırır (bin packing):
+    önce derslik sayısı, sonra boş kalan koltuk en aza indirilir.
+    Tek derslik yetiyorsa sığan en küçük derslik seçilir.
+    Dönen: [(room_id, koltuk)] büyük derslikten küçüğe (koltuklar sırayla doldurulur); sığmazsa None.
+    """
+    if not free:
+        return None
+    asc = sorted(free, key=lambda r: (r[2], r[1]))
+    for rid, _code, cap in asc:
+        if cap >= need:
+            return [(rid, need)]
+
+    desc = asc[::-1]
+    total, k = 0, 0
+    for _rid, _code, cap in desc:
+        total += cap
+        k += 1
+        if total >= need:
+            break
+    if total < need:
+        return None
+
+    if comb(len(desc), k) <= exact_limit:
+        best = None
+        for combo in combinations(desc, k):
+            s = sum(r[2] for r in combo)
+            if s >= need and (best is None or s < best[0]):
+                best = (s, combo)
+                if s == need:
+                    break
+        chosen = list(best[1])
+    else:
+        # en büyük k-1 derslik + kalan ihtiyaca yeten en küçük derslik
+        chosen = desc[:k - 1]
+        rest = need - sum(r[2] for r in chosen)
+        chosen.append(next(r for r in asc if r[2] >= rest and r not in chosen))
+
+    chosen.sort(key=lambda r: (-r[2], r[1]))
+    parts, left = [], need
+    for rid, _code, cap in chosen:
+        seats = min(cap, left)
+        parts.append((rid, seats))
+        left -= seats
+    return parts
+
+
+class RoomPool:
+    def __init__(self, rooms: Iterable[Room], busy: Optional[Dict[object, Set[int]]] = None,
+                 split: bool = True):
+        """
+        rooms: [(room_id, code, capacity), ...]
+        busy: {slot: {room_id}} başka bölümlerin / sabit sınavların kullandığı derslikler
+        split: tek dersliğe sığmayan sınavı birden çok dersliğe böl
+        """
+        self.rooms: List[Room] = sorted(rooms, key=lambda r: (r[2], r[1]))   # kapasite artan
+        self.split = split
+        self.max_capacity = self.rooms[-1][2] if self.rooms else 0
+        self.total_capacity = sum(r[2] for r in self.rooms)
+        self._key = {rid: (cap, code, rid) for rid, code, cap in self.rooms}
+        self._busy = busy or {}
+        self._free: Dict[object, list] = {}   # slot -> sıralı [(capacity, code, room_id)] (ilk erişimde kurulur)
+
+    def _free_list(self, ts) -> list:
+        lst = self._free.get(ts)
+        if lst is None:
+            used = self._busy.get(ts, ())
+            lst = [self._key[rid] for rid, _code, _cap in self.rooms if rid not in used]
+            self._free[ts] = lst
+        return lst
+
+    def coverable(self, need: int) -> bool:
+        """Boş bir slotta yer bulunabilir mi."""
+        if not self.rooms:
+            return False
+        return need <= (self.total_capacity if self.split else self.max_capacity)
+
+    def free_rooms(self, ts) -> List[Room]:
+        return [(rid, code, cap) for cap, code, rid in self._free_list(ts)]
+
+    def pick(self, ts, need: int) -> Optional[Parts]:
+        """ts'de boş dersliklerden need'e yer: [(room_id, koltuk)] (yoksa None)."""
+        lst = self._free_list(ts)
+        i = bisect_left(lst, (need,))          # need'e yeten en küçük boş derslik
+        if i < len(lst):
+            return [(lst[i][2], need)]
+        if not self.split or not lst:
+            return None
+        return split_rooms(self.free_rooms(ts), need)
+
+    def can_host(self, ts, need: int) -> bool:
+        return self.pick(ts, need) is not None
+
+    def take(self, ts, need: int) -> Optional[Parts]:
+        parts = self.pick(ts, need)
+        if parts is not None:
+            lst = self._free_list(ts)
+            for rid, _ in parts:
+                del lst[bisect_left(lst, self._key[rid])]   # konum O(log R), kaydırma O(R)
+        return parts
+
+    def block(self, ts, rids: Iterable[int]):
+        """Derslikleri ts'de dolu işaretle (örtüşen başka bir slotta kullanıldılar)."""
+        lst = self._free.get(ts)
+        if lst is None:
+            self._busy = dict(self._busy)
+            self._busy[ts] = set(self._busy.get(ts, ())) | set(rids)
+            return
+        for rid in rids:
+            key = self._key[rid]
+            j = bisect_left(lst, key)
+            if j < len(lst) and lst[j] == key:
+                del lst[j]
+
+    def release(self, ts, rids: Iterable[int]):
+        lst = self._free_list(ts)
+        for rid in rids:
+            key = self._key[rid]
+            j = bisect_left(lst, key)
+            if j == len(lst) or lst[j] != key:
+                insort(lst, key)
+
+
+def assign_rooms(exams: Iterable[Tuple[int, object, int]], rooms: Iterable[Room],
+                 busy: Optional[Dict[object, Set[int]]] = None, split: bool = True,
+                 overlaps: Optional[Dict[object, Set[object]]] = None):
+    """
+    Zamanı belli sınavlara derslik atar (ScheduleView.auto_assign_rooms motoru).
+    Her slotta en kalabalık sınav önce yerleşir: küçük sınavlar büyük derslikleri kapmaz.
+    exams: [(exam_id, slot, öğrenci sayısı)]
+    overlaps: {slot: {zamanı örtüşen slotlar}} — bir slotta alınan derslik bunlarda da dolu sayılır
+    Dönen: (assigned {exam_id: [(room_id, koltuk)]},
+            failed [(exam_id, slot, ihtiyaç, boş derslik sayısı, bu slotta en fazla koltuk)])
+    """
+    pool = RoomPool(rooms, busy, split)
+    by_ts = defaultdict(list)
+    for ex in exams:
+        by_ts[ex[1]].append(ex)
+
+    assigned, failed = {}, []
+    for ts in sorted(by_ts, key=str):
+        for exam_id, _ts, need in sorted(by_ts[ts], key=lambda e: (-(e[2] or 0), e[0])):
+            need = need or 0
+            parts = pool.take(ts, need)
+            if parts is not None:
+                assigned[exam_id] = parts
+                for other in (overlaps or {}).get(ts, ()):
+                    pool.block(other, [rid for rid, _ in parts])
+                continue
+            free = pool.free_rooms(ts)
+            most = sum(r[2] for r in free) if split else (free[-1][2] if free else 0)
+            failed.append((exam_id, ts, need, len(free), most))
+    return assigned, failed
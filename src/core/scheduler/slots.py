@@ -0,0 +1,35 @@
+# src/core/scheduler/slots.py
+# Sınav slot havuzu üretimi (GUI'den bağımsız).
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+# Günlük sınav saatleri (saat, dakika)
+DAILY_TIMES: List[Tuple[int, int]] = [(9, 0), (11, 0), (13, 30), (15, 30), (17, 0), (19, 0)]
+DEFAULT_DAYS = 10
+
+
+def generate_slots(constraints: Optional[Dict] = None,
+                   daily_times: List[Tuple[int, int]] = DAILY_TIMES,
+                   now: Optional[datetime] = None) -> List[datetime]:
+    """
+    Kısıtlarda tarih aralığı varsa: aralıktaki (hariç günler dışındaki) her gün * daily_times.
+    Yoksa: bugünden itibaren DEFAULT_DAYS gün * daily_times.
+    """
+    c = constraints or {}
+    slots = []
+    if c.get("date_start") and c.get("date_end"):
+        cur_day = c["date_start"]
+        exclude = c.get("exclude_days", set()) or set()
+        while cur_day <= c["date_end"]:
+            if cur_day.weekday() not in exclude:
+                for h, m in daily_times:
+                    slots.append(datetime(cur_day.year, cur_day.month, cur_day.day, h, m))
+            cur_day += timedelta(days=1)
+    else:
+        start_day = (now or datetime.now()).replace(hour=9, minute=0, second=0, microsecond=0)
+        for d in range(DEFAULT_DAYS):
+            day = start_day + timedelta(days=d)
+            for h, m in daily_times:
+                slots.append(day.replace(hour=h, minute=m))
+    return slots
@@ -0,0 +1,475 @@
+# src/core/scheduler/store.py
+# Planlayıcı için DB okuma/yazma + GUI'siz toplu çalıştırma.
+
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from core.db import get_conn
+from .conflicts import conflict_report
+from .global_plan import plan_global
+from .graph_cache import cached_conflict_graph
+from .intervals import DEFAULT_DURATION_MIN, exam_interval, room_overlaps, slot_room_busy
+from .multistart import plan_multistart
+from .planner import plan_exams
+from .preview import MovePreview
+from .repair import repair_plan
+from .slots import generate_slots
+
+EXAM_TYPES = ("Vize", "Final", "Bütünleme")
+# exams.start_min sıfır noktası (SQLite strftime('%s') ile aynı: saat dilimsiz metin UTC sayılır)
+EPOCH = datetime(1970, 1, 1)
+
+
+def normalize_exam_type(exam_type: Optional[str]) -> str:
+    return exam_type if exam_type in EXAM_TYPES else "Vize"
+
+
+def load_courses(con: sqlite3.Connection, dept_id: int) -> List[Tuple[int, str, int]]:
+    cur = con.execute("""
+        SELECT id, code, class_year
+        FROM courses
+        WHERE dept_id=?
+        ORDER BY code
+    """, (dept_id,))
+    return cur.fetchall()  # [(cid, code, class_year), ...]
+
+
+def load_enrollments(con: sqlite3.Connection, dept_id: int) -> List[Tuple[int, int]]:
+    """Bölüm derslerinin kayıtları, tek sorgu, student_id sıralı: [(student_id, course_id), ...]"""
+    cur = con.execute("""
+        SELECT en.student_id, en.course_id
+        FROM enrollments en
+        JOIN courses c ON c.id = en.course_id
+        WHERE c.dept_id=?
+        ORDER BY en.student_id
+    """, (dept_id,))
+    return cur.fetchall()
+
+
+def load_all_courses(con: sqlite3.Connection) -> List[Tuple[int, str, int, int]]:
+    """Tüm bölümlerin dersleri: [(cid, code, class_year, dept_id), ...]"""
+    return con.execute("""
+        SELECT id, code, class_year, dept_id
+        FROM courses
+        ORDER BY dept_id, code
+    """).fetchall()
+
+
+def load_all_enrollments(con: sqlite3.Connection) -> List[Tuple[int, int]]:
+    """Tüm kayıtlar, student_id sıralı: [(student_id, course_id), ...]"""
+    return con.execute("SELECT student_id, course_id FROM enrollments ORDER BY student_id").fetchall()
+
+
+def _load_exam_intervals(con: sqlite3.Connection, dept_id: int):
+    """Bölümün sınavları: ({cid: code}, {cid: exam_start metni}, {cid: (başlangıç, bitiş)})"""
+    cur = con.execute("""
+        SELECT c.id, c.code, e.exam_start, e.start_min, e.duration_min
+        FROM exams e
+        JOIN courses c ON c.id = e.course_id
+        WHERE c.dept_id=? AND e.start_min IS NOT NULL
+    """, (dept_id,))
+    code_of, start_of, interval_of = {}, {}, {}
+    for cid, code, ts, key, dur in cur.fetchall():
+        code_of[cid] = code
+        start_of[cid] = ts
+        interval_of[cid] = exam_interval(slot_from_key(key), dur)
+    return code_of, start_of, interval_of
+
+
+def load_conflict_report(con: sqlite3.Connection, dept_id: int) -> Dict:
+    """
+    Bölümün öğrenci çakışma raporu, tek geçiş (bkz. conflicts.conflict_report):
+    zamanı örtüşen iki sınavı olan öğrenciler (exam_start + duration_min aralıkları).
+    Dönen: {
+      "rows":        [(numara, ad soyad, ders1 kodu, ders2 kodu, exam_start), ...]  (zaman, numara sıralı)
+                     ders1 önce başlayan; exam_start onun başlangıcı
+      "per_slot":    [(exam_start, çakışma sayısı), ...]  (zaman sıralı)
+      "per_student": [(numara, ad soyad, çakışma sayısı), ...]  (çoktan aza)
+    }
+    """
+    empty = {"rows": [], "per_slot": [], "per_student": []}
+    code_of, start_of, interval_of = _load_exam_intervals(con, dept_id)
+    if len(interval_of) < 2:
+        return empty
+
+    report = conflict_report(load_enrollments(con, dept_id), interval_of, start_of)
+    if not report["details"]:
+        return empty
+
+    sids = sorted(report["per_student"])
+    info = {}
+    for i in range(0, len(sids), 500):
+        chunk = sids[i:i + 500]
+        q = ",".join("?" * len(chunk))
+        for sid, num, name in con.execute(f"SELECT id, number, full_name FROM students WHERE id IN ({q})", chunk):
+            info[sid] = (num, name)
+
+    rows = [(info[sid][0], info[sid][1], code_of[a], code_of[b], start_of[a])
+            for sid, a, b in report["details"] if sid in info]
+    rows.sort(key=lambda r: (str(r[4]), str(r[0]), str(r[2]), str(r[3])))
+    per_student = [(*info[sid], n) for sid, n in report["per_student"].items() if sid in info]
+    per_student.sort(key=lambda r: (-r[2], str(r[0])))
+    return {
+        "rows": rows,
+        "per_slot": sorted(report["per_slot"].items(), key=lambda x: str(x[0])),
+        "per_student": per_student,
+    }
+
+
+def load_student_conflicts(con: sqlite3.Connection, dept_id: int):
+    """load_conflict_report'un (rows, per_slot) kısmı."""
+    report = load_conflict_report(con, dept_id)
+    return report["rows"], report["per_slot"]
+
+
+def _load_room_intervals(con: sqlite3.Connection):
+    """Tüm derslik kullanımları: ({exam_id: (kod, bölüm, exam_start)}, [(exam_id, room_id, başlangıç, bitiş)])"""
+    cur = con.execute("""
+        SELECT e.id, c.code, c.dept_id, e.exam_start, e.start_min, e.duration_min, e.room_id
+        FROM exams e
+        JOIN courses c ON c.id = e.course_id
+        WHERE e.room_id IS NOT NULL AND e.start_min IS NOT NULL
+        UNION
+        SELECT e.id, c.code, c.dept_id, e.exam_start, e.start_min, e.duration_min, er.room_id
+        FROM exam_rooms er
+        JOIN exams e ON e.id = er.exam_id
+        JOIN courses c ON c.id = e.course_id
+        WHERE e.start_min IS NOT NULL
+    """)
+    info, usages = {}, []
+    for exam_id, code, dept, ts, key, dur, rid in cur.fetchall():
+        info[exam_id] = (code, dept, ts)
+        usages.append((exam_id, rid, *exam_interval(slot_from_key(key), dur)))
+    return info, usages
+
+
+def load_room_conflicts(con: sqlite3.Connection, dept_id: int) -> List[Tuple[str, str, str, str]]:
+    """
+    Aynı derslikte zamanı örtüşen sınavlar (bölünmüş parçalar ve diğer bölümlerin sınavları dahil;
+    en az biri bu bölümün olan çiftler). Dönen: [(derslik kodu, ders1, ders2, exam_start), ...]
+    """
+    info, usages = _load_room_intervals(con)
+    pairs = [(rid, a, b) for rid, a, b in room_overlaps(usages) if dept_id in (info[a][1], info[b][1])]
+    if not pairs:
+        return []
+    room_code = dict(con.execute(
+        f"SELECT id, code FROM classrooms WHERE id IN ({','.join('?' * len({p[0] for p in pairs}))})",
+        sorted({p[0] for p in pairs})
+    ).fetchall())
+    rows = [(room_code.get(rid, str(rid)), info[a][0], info[b][0], info[a][2]) for rid, a, b in pairs]
+    rows.sort(key=lambda r: (str(r[3]), str(r[0]), r[1], r[2]))
+    return rows
+
+
+def load_busy_rooms(con: sqlite3.Connection, slot_intervals: Dict) -> Dict:
+    """Her slot aralığında (kısmen de olsa) dolu derslikler: {slot: {room_id}} (tüm bölümler)."""
+    _info, usages = _load_room_intervals(con)
+    return slot_room_busy(slot_intervals, usages)
+
+
+def load_move_preview(con: sqlite3.Connection, course_id: int, exam_id: Optional[int] = None,
+                      cooldown_min: int = 0, duration_min: Optional[int] = None) -> MovePreview:
+    """
+    Sınav düzenleme önizlemesi için tek seferlik yükleme (bkz. preview.MovePreview):
+    dersle ortak öğrencisi olan derslerin sınavları (tüm bölümler) + düzenlenen sınav dışındaki derslik doluluğu.
+    duration_min: henüz sınavı olmayan dersin yazılacağı süre (kısıtlardaki default_duration).
+    """
+    neighbor_exams = [
+        (key, key + int(dur or DEFAULT_DURATION_MIN), code, n)
+        for code, key, dur, n in con.execute("""
+            SELECT c.code, e.start_min, e.duration_min, COUNT(*) AS n
+            FROM enrollments en1
+            JOIN enrollments en2 ON en2.student_id = en1.student_id AND en2.course_id <> en1.course_id
+            JOIN exams e ON e.course_id = en2.course_id
+            JOIN courses c ON c.id = en2.course_id
+            WHERE en1.course_id = ? AND e.start_min IS NOT NULL
+            GROUP BY en2.course_id
+        """, (course_id,))
+    ]
+    room_usage = {}
+    for rid, key, dur, code in con.execute("""
+        SELECT e.room_id, e.start_min, e.duration_min, c.code
+        FROM exams e JOIN courses c ON c.id = e.course_id
+        WHERE e.room_id IS NOT NULL AND e.start_min IS NOT NULL AND e.id IS NOT ?
+        UNION
+        SELECT er.room_id, e.start_min, e.duration_min, c.code
+        FROM exam_rooms er JOIN exams e ON e.id = er.exam_id JOIN courses c ON c.id = e.course_id
+        WHERE e.start_min IS NOT NULL AND e.id IS NOT ?
+    """, (exam_id, exam_id)):
+        room_usage.setdefault(rid, []).append((key, key + int(dur or DEFAULT_DURATION_MIN), code))
+    row = con.execute("SELECT duration_min FROM exams WHERE id IS ?", (exam_id,)).fetchone() if exam_id else None
+    duration = int(row[0]) if row and row[0] else int(duration_min or DEFAULT_DURATION_MIN)
+    return MovePreview(neighbor_exams, room_usage, duration, cooldown_min)
+
+
+def parse_exam_start(value) -> Optional[datetime]:
+    """exams.exam_start / kullanıcı girdisi → datetime ('YYYY-MM-DD HH:MM', saniyeli ya da 'T'li ISO da olur)."""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value).strip())
+    except ValueError:
+        return None
+
+
+def format_exam_start(dt: datetime) -> str:
+    """Kanonik exam_start metni: 'YYYY-MM-DD HH:MM' (tetikleyicilerin yazdığıyla aynı)."""
+    return dt.strftime("%Y-%m-%d %H:%M")
+
+
+def slot_key(dt: datetime) -> int:
+    """datetime → exams.start_min (epoch dakika); aynı dakikadaki zamanlar aynı anahtarı alır."""
+    return int((dt.replace(tzinfo=None, second=0, microsecond=0) - EPOCH).total_seconds()) // 60
+
+
+def slot_from_key(key: int) -> datetime:
+    """exams.start_min → datetime"""
+    return EPOCH + timedelta(minutes=int(key))
+
+
+def load_exam_durations(con: sqlite3.Connection, dept_id: int) -> Dict[int, int]:
+    """Bölümün mevcut sınav süreleri: {course_id: duration_min}"""
+    return dict(con.execute("""
+        SELECT e.course_id, e.duration_min
+        FROM exams e
+        JOIN courses c ON c.id = e.course_id
+        WHERE c.dept_id=? AND e.duration_min IS NOT NULL
+    """, (dept_id,)).fetchall())
+
+
+def mark_dirty_courses(con: sqlite3.Connection, course_ids: Iterable[int]):
+    """Kayıtları değişen dersleri işaretler; bir sonraki "Planı Onar" bunları yeniden yerleştirir."""
+    con.executemany("INSERT OR IGNORE INTO dirty_courses(course_id) VALUES (?)", [(cid,) for cid in course_ids])
+
+
+def load_dirty_courses(con: sqlite3.Connection, dept_id: int) -> Set[int]:
+    """Bölümün işaretli (son içe aktarmalarda kaydı değişen) dersleri."""
+    return {cid for cid, in con.execute("""
+        SELECT d.course_id FROM dirty_courses d
+        JOIN courses c ON c.id = d.course_id
+        WHERE c.dept_id=?
+    """, (dept_id,)).fetchall()}
+
+
+def clear_dirty_courses(con: sqlite3.Connection, course_ids: Iterable[int]):
+    con.executemany("DELETE FROM dirty_courses WHERE course_id=?", [(cid,) for cid in course_ids])
+
+
+def load_existing_plan(con: sqlite3.Connection, dept_id: int) -> Dict[int, datetime]:
+    """Bölümün mevcut sınav zamanları: {course_id: datetime} (okunamayan zamanlar atlanır)."""
+    cur = con.execute("""
+        SELECT e.course_id, e.start_min
+        FROM exams e
+        JOIN courses c ON c.id = e.course_id
+        WHERE c.dept_id=? AND e.start_min IS NOT NULL
+    """, (dept_id,))
+    return {cid: slot_from_key(key) for cid, key in cur.fetchall()}
+
+
+def load_rooms(con: sqlite3.Connection, dept_id: int) -> List[Tuple[int, str, int]]:
+    """Bölüm derslikleri: [(room_id, code, capacity)]; PDF kapasitesi varsa o kullanılır."""
+    cur = con.execute("""
+        SELECT id, code, COALESCE(capacity_pdf, capacity) AS capacity
+        FROM classrooms
+        WHERE dept_id=?
+        ORDER BY capacity DESC, code ASC
+    """, (dept_id,))
+    return cur.fetchall()
+
+
+def load_room_usage(con: sqlite3.Connection, exclude_dept_id: Optional[int] = None) -> Dict[datetime, set]:
+    """Derslikli sınavların doluluğu {datetime: {room_id}} (bölünmüş sınav parçaları dahil)."""
+    cur = con.execute("""
+        SELECT e.start_min, e.room_id
+        FROM exams e
+        JOIN courses c ON c.id = e.course_id
+        WHERE e.room_id IS NOT NULL AND e.start_min IS NOT NULL AND c.dept_id IS NOT ?
+        UNION
+        SELECT e.start_min, er.room_id
+        FROM exam_rooms er
+        JOIN exams e ON e.id = er.exam_id
+        JOIN courses c ON c.id = e.course_id
+        WHERE e.start_min IS NOT NULL AND c.dept_id IS NOT ?
+    """, (exclude_dept_id, exclude_dept_id))
+    by_key = {}
+    for key, rid in cur.fetchall():
+        by_key.setdefault(key, set()).add(rid)
+    return {slot_from_key(key): rids for key, rids in by_key.items()}
+
+
+def load_exam_rooms(con: sqlite3.Connection, exam_id: int) -> List[Tuple[int, int]]:
+    """Sınavın derslik parçaları [(room_id, koltuk)], ana derslik önce; bölünmemişse exams.room_id tek parça."""
+    rows = con.execute("""
+        SELECT er.room_id, er.seats
+        FROM exam_rooms er
+        JOIN exams e ON e.id = er.exam_id
+        WHERE er.exam_id=?
+        ORDER BY (er.room_id = e.room_id) DESC, er.seats DESC, er.room_id
+    """, (exam_id,)).fetchall()
+    if rows:
+        return rows
+    row = con.execute("SELECT room_id FROM exams WHERE id=?", (exam_id,)).fetchone()
+    return [(row[0], 0)] if row and row[0] is not None else []
+
+
+def save_exam_rooms(con: sqlite3.Connection, exam_id: int, parts: List[Tuple[int, int]]):
+    """exams.room_id = ilk parça; birden çok parça varsa exam_rooms'a yazılır (eskiler silinir)."""
+    con.execute("DELETE FROM exam_rooms WHERE exam_id=?", (exam_id,))
+    con.execute("UPDATE exams SET room_id=? WHERE id=?", (parts[0][0] if parts else None, exam_id))
+    if len(parts) > 1:
+        con.executemany("INSERT INTO exam_rooms(exam_id, room_id, seats) VALUES (?, ?, ?)",
+                        [(exam_id, rid, seats) for rid, seats in parts])
+
+
+def _duration(constraints: Dict) -> int:
+    """Planlayıcının kullandığı sınav süresi (kısıtta yoksa planlayıcı varsayılanı, slot ızgarasıyla uyumlu)."""
+    return int(constraints.get("default_duration") or DEFAULT_DURATION_MIN)
+
+
+def save_plan(con: sqlite3.Connection, dept_id: int, placements: Dict[int, object], exam_type: str = "Vize",
+              rooms: Optional[Dict[int, List[Tuple[int, int]]]] = None, duration_min: Optional[int] = None):
+    """
+    Bölümün sınavlarını silip yerleşimi yazar (rooms: {cid: [(room_id, koltuk)]}, ortak derslik modunda).
+    duration_min: sınav süresi (kısıtlardaki default_duration; yoksa şema varsayılanı).
+    Yazılan derslerin dirty işareti kalkar.
+    """
+    cur = con.cursor()
+    cur.execute("""
+        DELETE FROM exams
+        WHERE course_id IN (SELECT id FROM courses WHERE dept_id=?)
+    """, (dept_id,))
+    exam_type = normalize_exam_type(exam_type)
+    rooms = rooms or {}
+    duration = int(duration_min or DEFAULT_DURATION_MIN)
+    cur.executemany(
+        "INSERT INTO exams(course_id, exam_start, exam_type, room_id, duration_min) VALUES (?, ?, ?, ?, ?)",
+        [(cid, format_exam_start(ts), exam_type, rooms[cid][0][0] if rooms.get(cid) else None, duration)
+         for cid, ts in placements.items()]
+    )
+    clear_dirty_courses(con, placements)
+    split = {cid: parts for cid, parts in rooms.items() if len(parts) > 1 and cid in placements}
+    if split:
+        exam_of = dict(con.execute(f"""
+            SELECT course_id, id FROM exams WHERE course_id IN ({",".join("?" * len(split))})
+        """, list(split)).fetchall())
+        cur.executemany("INSERT INTO exam_rooms(exam_id, room_id, seats) VALUES (?, ?, ?)",
+                        [(exam_of[cid], rid, seats) for cid, parts in split.items() for rid, seats in parts])
+
+
+def save_changes(con: sqlite3.Connection, changed: Dict[int, object], exam_type: str = "Vize",
+                 duration_min: Optional[int] = None):
+    """
+    Yalnız değişen dersleri yazar (upsert); diğer sınavlar, odaları ve süreleri korunur.
+    Saati değişen sınavın odası (ve bölünmüş parçaları) artık geçerli olmayabileceği için boşaltılır.
+    """
+    exam_type = normalize_exam_type(exam_type)
+    con.executemany("DELETE FROM exam_rooms WHERE exam_id IN (SELECT id FROM exams WHERE course_id=?)",
+                    [(cid,) for cid in changed])
+    con.executemany("""
+        INSERT INTO exams(course_id, exam_start, exam_type, duration_min) VALUES (?, ?, ?, ?)
+        ON CONFLICT(course_id) DO UPDATE SET exam_start=excluded.exam_start, room_id=NULL
+    """, [(cid, format_exam_start(ts), exam_type, int(duration_min or DEFAULT_DURATION_MIN))
+          for cid, ts in changed.items()])
+
+
+def plan_department(dept_id: int, constraints: Optional[Dict] = None, slots: Optional[list] = None,
+                    save: bool = True) -> Dict:
+    """
+    Bir bölüm için uçtan uca plan: yükle → planla → (save=True ise) yaz.
+    Programlanacak ders yoksa mevcut sınavlara dokunmaz.
+    multistart_runs > 1 ise farklı tohumlarla paralel planlanır (seed verilmezse 0'dan başlar).
+    joint_rooms ise derslikler de aynı geçişte atanır (diğer bölümlerin derslikli sınavları dolu sayılır).
+    Çakışma grafı veri sürümü değişmedikçe önbellekten gelir (graph_cache).
+    """
+    constraints = constraints or {}
+    if slots is None:
+        slots = generate_slots(constraints)
+
+    with get_conn() as con:
+        courses = load_courses(con, dept_id)
+        enrollments = load_enrollments(con, dept_id)
+        graph = cached_conflict_graph(con, dept_id, [cid for cid, _, _ in courses], enrollments,
+                                      cache_dir=constraints.get("graph_cache_dir"))
+        rooms = room_busy = None
+        if constraints.get("joint_rooms"):
+            rooms = load_rooms(con, dept_id)
+            room_busy = load_room_usage(con, exclude_dept_id=dept_id)
+        runs = int(constraints.get("multistart_runs", 1) or 1)
+        if runs > 1:
+            result = plan_multistart(courses, enrollments, slots, constraints, runs=runs,
+                                     base_seed=constraints.get("seed") or 0,
+                                     workers=constraints.get("multistart_workers"),
+                                     rooms=rooms, room_busy=room_busy, graph=graph)
+        else:
+            result = plan_exams(courses, enrollments, slots, constraints, graph=graph,
+                                rooms=rooms, room_busy=room_busy)
+        code_of = {cid: code for cid, code, _ in courses}
+        result["unplaced_codes"] = [code_of[cid] for cid in result["unplaced"]]
+        if save and result["placements"]:
+            save_plan(con, dept_id, result["placements"], constraints.get("exam_type", "Vize"),
+                      rooms=result.get("rooms"), duration_min=_duration(constraints))
+    return result
+
+
+def plan_all_departments(constraints: Optional[Dict] = None, slots: Optional[list] = None,
+                         with_rooms: bool = True, save: bool = True) -> Dict:
+    """
+    Admin: tüm bölümler tek çakışma grafı ve tek derslik havuzuyla birlikte planlanır (plan_global).
+    save=True ise her bölümün sınavları silinip yeniden yazılır (derslikler dahil).
+    """
+    constraints = constraints or {}
+    if slots is None:
+        slots = generate_slots(constraints)
+
+    with get_conn() as con:
+        courses = load_all_courses(con)
+        enrollments = load_all_enrollments(con)
+        rooms = None
+        if with_rooms:
+            rooms = con.execute("""
+                SELECT id, code, COALESCE(capacity_pdf, capacity) FROM classrooms
+            """).fetchall() or None
+        graph = cached_conflict_graph(con, None, [row[0] for row in courses], enrollments,
+                                      cache_dir=constraints.get("graph_cache_dir"))
+        result = plan_global(courses, enrollments, slots, constraints, rooms=rooms,
+                             workers=constraints.get("multistart_workers"), graph=graph)
+        code_of = {cid: code for cid, code, _, _ in courses}
+        result["unplaced_codes"] = [code_of[cid] for cid in result["unplaced"]]
+        if save and result["placements"]:
+            by_dept = {}
+            for cid, _code, _cy, dept in courses:
+                if cid in result["placements"]:
+                    by_dept.setdefault(dept, {})[cid] = result["placements"][cid]
+            for dept, placements in by_dept.items():
+                save_plan(con, dept, placements, constraints.get("exam_type", "Vize"), rooms=result["rooms"],
+                          duration_min=_duration(constraints))
+    return result
+
+
+def repair_department(dept_id: int, constraints: Optional[Dict] = None, slots: Optional[list] = None,
+                      dirty=(), save: bool = True) -> Dict:
+    """
+    Artımlı plan: mevcut sınavlar sabit, yalnız yeni/sınavsız/dirty/çakışan dersler yeniden yerleşir.
+    Yalnız değişen sınavlar yazılır (result["changed"]).
+    dirty: yeniden yerleştirilecek dersler (UI: load_dirty_courses, son içe aktarmada kaydı değişenler);
+    kaydedilince yerleşen dirty derslerin işareti kalkar (yeri değişmemiş olsa da).
+    """
+    constraints = constraints or {}
+    if slots is None:
+        slots = generate_slots(constraints)
+
+    with get_conn() as con:
+        courses = load_courses(con, dept_id)
+        enrollments = load_enrollments(con, dept_id)
+        existing = load_existing_plan(con, dept_id)
+        result = repair_plan(courses, enrollments, slots, existing, constraints, dirty=dirty,
+                             durations=load_exam_durations(con, dept_id))
+        code_of = {cid: code for cid, code, _ in courses}
+        result["unplaced_codes"] = [code_of[cid] for cid in result["unplaced"]]
+        if save:
+            if result["changed"]:
+                save_changes(con, result["changed"], constraints.get("exam_type", "Vize"),
+                             duration_min=_duration(constraints))
+            clear_dirty_courses(con, set(dirty) & result["placements"].keys() - set(result["forced"]))
+    return result
@@ -4,6 +4,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from core.db import get_conn
+from core.scheduler import load_conflict_report, load_room_conflicts
 
 
 class DataStatusView(ttk.Frame):
@@ -34,10 +35,14 @@ class DataStatusView(ttk.Frame):
         self.tree_noexam = self._make_tree(self.tab_missing, ("code", "name", "year"), ("Kod", "Ad", "Sınıf"))
         self.tree_noroom = self._make_tree(self.tab_missing, ("code", "name", "start"),
                                            ("Kod", "Ad", "Başlangıç"))
+        self.tree_backfill = self._make_tree(self.tab_missing, ("code", "name", "start", "old", "new"),
+                                             ("Kod", "Ad", "Başlangıç", "Eski süre", "Süre"))
         ttk.Label(self.tab_missing, text="Sınavı olmayan dersler").pack(anchor="w", padx=4, pady=(6, 0))
         self.tree_noexam.pack(fill="both", expand=True, padx=4, pady=(0, 8))
         ttk.Label(self.tab_missing, text="Odasız sınavlar").pack(anchor="w", padx=4, pady=(6, 0))
         self.tree_noroom.pack(fill="both", expand=True, padx=4, pady=(0, 8))
+        ttk.Label(self.tab_missing, text="Süresi güncellemede 120 dk'dan düzeltilen eski sınavlar").pack(anchor="w", padx=4, pady=(6, 0))
+        self.tree_backfill.pack(fill="both", expand=True, padx=4, pady=(0, 8))
 
         # Çakışmalar sekmesi
         self.tree_stu_conf = self._make_tree(
@@ -48,9 +53,9 @@ class DataStatusView(ttk.Frame):
             self.tab_conflict,
             ("room", "course1", "course2", "start"),
             ("Derslik", "Ders 1", "Ders 2", "Zaman"))
-        ttk.Label(self.tab_conflict, text="Öğrenci çakışmaları (aynı saatte birden fazla sınav)").pack(anchor="w", padx=4, pady=(6, 0))
+        ttk.Label(self.tab_conflict, text="Öğrenci çakışmaları (zamanı örtüşen birden fazla sınav)").pack(anchor="w", padx=4, pady=(6, 0))
         self.tree_stu_conf.pack(fill="both", expand=True, padx=4, pady=(0, 8))
-        ttk.Label(self.tab_conflict, text="Derslik çakışmaları (aynı saatte aynı derslikte birden fazla sınav)").pack(anchor="w", padx=4, pady=(6, 0))
+        ttk.Label(self.tab_conflict, text="Derslik çakışmaları (aynı derslikte zamanı örtüşen sınavlar)").pack(anchor="w", padx=4, pady=(6, 0))
         self.tree_room_conf.pack(fill="both", expand=True, padx=4, pady=(0, 8))
 
         # Kapasite sekmesi
@@ -64,6 +69,7 @@ class DataStatusView(ttk.Frame):
         # Çift tık detay bilgi
         self.tree_noexam.bind("<Double-1>", lambda e: self._row_info(self.tree_noexam))
         self.tree_noroom.bind("<Double-1>", lambda e: self._row_info(self.tree_noroom))
+        self.tree_backfill.bind("<Double-1>", lambda e: self._row_info(self.tree_backfill))
         self.tree_stu_conf.bind("<Double-1>", lambda e: self._row_info(self.tree_stu_conf))
         self.tree_room_conf.bind("<Double-1>", lambda e: self._row_info(self.tree_room_conf))
         self.tree_capacity.bind("<Double-1>", lambda e: self._row_info(self.tree_capacity))
@@ -129,7 +135,7 @@ class DataStatusView(ttk.Frame):
         self._load_capacity()
 
     def _load_missing(self):
-        for t in (self.tree_noexam, self.tree_noroom):
+        for t in (self.tree_noexam, self.tree_noroom, self.tree_backfill):
             for i in t.get_children(): t.delete(i)
         with get_conn() as con:
             cur = con.cursor()
@@ -155,52 +161,28 @@ class DataStatusView(ttk.Frame):
             for r in cur.fetchall():
                 self.tree_noroom.insert("", "end", values=r)
 
+            # Güncellemede (migration 11) süresi 120 → 75 çekilen sınavlar: bilerek 120 verilmiş olanlar buradan görülür
+            cur.execute("""
+                SELECT c.code, c.name, e.exam_start, b.old_duration, e.duration_min
+                FROM exam_duration_backfill b
+                JOIN exams e ON e.id = b.exam_id
+                JOIN courses c ON c.id = e.course_id
+                WHERE c.dept_id=?
+                ORDER BY e.exam_start, c.code
+            """, (self.dept_id,))
+            for r in cur.fetchall():
+                self.tree_backfill.insert("", "end", values=r)
+
     def _load_conflicts(self):
         for t in (self.tree_stu_conf, self.tree_room_conf):
             for i in t.get_children(): t.delete(i)
         with get_conn() as con:
-            cur = con.cursor()
-            # Öğrenci çakışmaları (aynı anda iki dersin sınavı)
-            cur.execute("""
-                WITH enroll AS (
-                    SELECT DISTINCT student_id, course_id FROM enrollments
-                )
-                SELECT
-                    s.number AS student_no,
-                    s.full_name AS student_name,
-                    c1.code AS course1,
-                    c2.code AS course2,
-                    ex1.exam_start AS start
-                FROM enroll e1
-                JOIN enroll e2
-                     ON e1.student_id = e2.student_id
-                    AND e1.course_id  < e2.course_id
-                JOIN exams  ex1 ON ex1.course_id = e1.course_id
-                JOIN exams  ex2 ON ex2.course_id = e2.course_id
-                               AND ex1.exam_start = ex2.exam_start
-                JOIN courses c1 ON c1.id = e1.course_id AND c1.dept_id = ?
-                JOIN courses c2 ON c2.id = e2.course_id AND c2.dept_id = ?
-                JOIN students s ON s.id = e1.student_id
-                ORDER BY ex1.exam_start, s.number
-            """, (self.dept_id, self.dept_id))
-            for r in cur.fetchall():
+            # Öğrenci çakışmaları: zamanı örtüşen iki sınav (exam_start + duration_min)
+            for r in load_conflict_report(con, self.dept_id)["rows"]:
                 self.tree_stu_conf.insert("", "end", values=r)
 
-            # Derslik çakışmaları (aynı ts + aynı room_id, 1'den fazla sınav)
-            cur.execute("""
-                SELECT cl.code AS room,
-                       MIN(c.code) AS course1,
-                       MAX(c.code) AS course2,
-                       e.exam_start AS start
-                FROM exams e
-                JOIN courses c ON c.id = e.course_id
-                LEFT JOIN classrooms cl ON cl.id = e.room_id
-                WHERE c.dept_id=? AND e.room_id IS NOT NULL
-                GROUP BY e.exam_start, e.room_id
-                HAVING COUNT(*) > 1
-                ORDER BY e.exam_start, room
-            """, (self.dept_id,))
-            for r in cur.fetchall():
+            # Derslik çakışmaları: aynı derslikte zamanı örtüşen sınavlar (süre + bölünmüş parçalar dahil)
+            for r in load_room_conflicts(con, self.dept_id):
                 self.tree_room_conf.insert("", "end", values=r)
 
     def _load_capacity(self):
@@ -219,9 +201,13 @@ class DataStatusView(ttk.Frame):
                     GROUP BY e.id
                 )
                 SELECT c.code, c.name, e.exam_start,
-                       COALESCE(cl.code, '') AS room_code,
+                       COALESCE((SELECT GROUP_CONCAT(cl2.code, '+')
+                                 FROM exam_rooms er JOIN classrooms cl2 ON cl2.id = er.room_id
+                                 WHERE er.exam_id = e.id), cl.code, '') AS room_code,
                        n.n AS need,
-                       COALESCE(cl.capacity, 0) AS cap
+                       COALESCE((SELECT SUM(cl2.capacity)
+                                 FROM exam_rooms er JOIN classrooms cl2 ON cl2.id = er.room_id
+                                 WHERE er.exam_id = e.id), cl.capacity, 0) AS cap
                 FROM exams e
                 JOIN courses c ON c.id = e.course_id
                 LEFT JOIN classrooms cl ON cl.id = e.room_id
@@ -4,11 +4,16 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import List, Tuple, Optional, Dict
+import os
 import re
+import tempfile
 import traceback
 
 from core.db import get_conn
-from core.excel.preview import try_preview_xlsx, normalize_courses_df
+from core.excel.preview import PREVIEW_ROWS, normalize_courses_df, start_full_load, try_preview_xlsx
+from core.excel.stream import STREAM_MIN_BYTES, import_spooled, stream_student_import
+from core.excel.validate import batch_key, error_lines, source_key, validate_batch
+from core.importers import import_student_enrollments
 
 # --- PDF'teki alan isimleri (ekranda bu başlıklar görünecek) ---
 REQUIRED_COURSE_FIELDS  = ("Kod", "Ad", "Sınıf(Yıl)", "Zorunlu(E/H)", "Öğretim Üyesi")
@@ -20,7 +25,12 @@ class ImportView(ttk.Frame):
     def __init__(self, master, user, **kwargs):
         super().__init__(master, **kwargs)
         self.user = user
-        self._df_cache: Dict[str, object] = {"courses": None, "students": None}
+        self._df_cache: Dict[str, object] = {"courses": None, "students": None}   # tam sayfa (arka planda yüklenir)
+        self._full_load: Dict[str, object] = {"courses": None, "students": None}  # kind → Future[(df, hata)]
+        self._preview_cols: Dict[str, List[str]] = {}
+        self._stream_path: Dict[str, Optional[str]] = {}   # büyük öğrenci dosyası: akış modunda doğrula/aktar
+        self._src_key: Dict[str, object] = {"courses": None, "students": None}   # önizlenen dosyanın kimliği
+        self._batches: Dict[str, dict] = {}   # kind → doğrulanmış parti (Dry-Run ve DB'ye Aktar ortak)
         self._maps: Dict[str, Dict[str, tk.StringVar]] = {}
         self._fixed_year = tk.StringVar(value="")   # Ders importunda sabit sınıf/yıl (opsiyonel)
         self._top = self.winfo_toplevel()
@@ -98,24 +108,14 @@ class ImportView(ttk.Frame):
             if not path:
                 messagebox.showwarning("Uyarı", "Önce bir dosya seçin."); return
 
-            df, err = try_preview_xlsx(path)
+            # Yalnız başlık + ilk PREVIEW_ROWS satır; tam sayfa arka planda ayrıştırılır
+            df, err = try_preview_xlsx(path, n=PREVIEW_ROWS)
             if err:
                 messagebox.showerror("Hata", err); return
             if df is None or df.empty:
                 messagebox.showinfo("Bilgi", "Veri bulunamadı."); return
-
-            # Ders sayfasını normalize etmeyi dene (üst başlık bloklarını tek tabloya çevirir)
-            if kind == "courses":
-                try:
-                    df2 = normalize_courses_df(df)
-                    if df2 is not None and not df2.empty:
-                        df = df2
-                except Exception:
-                    pass
-
-            # Bazı Excel'lerde kolon isimleri üst satırlarda olabilir → basit başlık arama
-            if self._looks_like_misheaded(df):
-                df = self._repair_headers(df)
+            raw_cols = list(map(str, df.columns))
+            df = self._prepare_df(df, kind)
 
             # Önizlemeyi doldur
             tree: ttk.Treeview = getattr(parent, "tree")
@@ -129,22 +129,94 @@ class ImportView(ttk.Frame):
             for _, row in df.head(10).iterrows():
                 tree.insert("", "end", values=[row.get(c, "") for c in cols])
 
-            # Özet/dağılım bilgisi
             info = getattr(parent, "result_label")
-            year_col = self._find_year_col(df.columns)
-            if year_col:
-                dist = df[year_col].value_counts(dropna=False).to_dict()
-                info.config(text=f"Önizleme — {year_col} dağılımı: {dist}")
+            self._df_cache[kind] = None
+            self._preview_cols[kind] = cols
+            self._src_key[kind] = source_key(path)
+            self._drop_batch(kind)
+            self._full_load[kind] = None
+
+            # Büyük öğrenci dosyası (başlığı onarım gerektirmiyorsa): tam sayfa hiç yüklenmez,
+            # Dry-Run / DB'ye Aktar dosyayı parça parça okur (core.excel.stream)
+            if kind == "students" and cols == raw_cols and self._src_key[kind][2] >= STREAM_MIN_BYTES:
+                self._stream_path[kind] = path
+                info.config(text=f"Önizleme — Kolonlar: {cols}  (büyük dosya: akış modunda işlenecek)")
             else:
-                info.config(text=f"Önizleme — Kolonlar: {list(df.columns)}")
-
-            self._df_cache[kind] = df
+                self._stream_path[kind] = None
+                info.config(text=f"Önizleme — Kolonlar: {cols}  (tam sayfa yükleniyor…)")
+                fut = start_full_load(path, lambda d: self._prepare_df(d, kind))
+                self._full_load[kind] = fut
+                self.after(200, lambda: self._watch_full_load(parent, kind, fut))
             # Sütun eşleme varsayılanlarını akıllıca öner
             self._build_mapping(parent, cols, kind, suggest_from=cols)
 
         except Exception:
             messagebox.showerror("Önizleme Hatası", traceback.format_exc())
 
+    def _prepare_df(self, df, kind: str):
+        """Önizlemede ve tam yüklemede aynı dönüşüm (arka plan iş parçacığında da çalışır; Tk çağrısı yok)."""
+        # Ders sayfasını normalize etmeyi dene (üst başlık bloklarını tek tabloya çevirir)
+        if kind == "courses":
+            try:
+                df2 = normalize_courses_df(df)
+                if df2 is not None and not df2.empty:
+                    df = df2
+            except Exception:
+                pass
+
+        # Bazı Excel'lerde kolon isimleri üst satırlarda olabilir → basit başlık arama
+        if self._looks_like_misheaded(df):
+            df = self._repair_headers(df)
+        return df
+
+    def _watch_full_load(self, parent, kind: str, fut):
+        if fut is not self._full_load.get(kind):
+            return   # bu arada başka dosya önizlendi
+        if not fut.done():
+            self.after(200, lambda: self._watch_full_load(parent, kind, fut))
+            return
+        self._full_df(parent, kind)
+
+    def _full_df(self, parent, kind: str):
+        """Tam sayfa DataFrame'i; arka plan yüklemesi bitmediyse bekler. Hata/uyumsuzlukta None."""
+        if self._df_cache.get(kind) is not None:
+            return self._df_cache[kind]
+        fut = self._full_load.get(kind)
+        if fut is None:
+            return None
+        info = getattr(parent, "result_label")
+        if not fut.done():
+            info.config(text="Tam sayfa yükleniyor…")
+            self.update_idletasks()
+        try:
+            df, err = fut.result()
+        except Exception as e:
+            df, err = None, f"Hata: {e}"
+        if fut is not self._full_load.get(kind):
+            return self._df_cache.get(kind)
+        self._full_load[kind] = None
+        if err or df is None:
+            info.config(text=err or "Veri bulunamadı.")
+            return None
+
+        self._df_cache[kind] = df
+        cols = list(map(str, df.columns))
+        if cols != self._preview_cols.get(kind):
+            # tam sayfada başlık/normalize sonucu farklı çıktı → eşlemeyi yeni kolonlarla kur
+            self._preview_cols[kind] = cols
+            self._build_mapping(parent, cols, kind, suggest_from=cols)
+            info.config(text=f"⚠️ Tam sayfa kolonları önizlemeden farklı, sütun eşlemesini kontrol edin: {cols}")
+            return None
+
+        # Özet/dağılım bilgisi (tam veri üzerinden)
+        year_col = self._find_year_col(df.columns)
+        if year_col:
+            dist = df[year_col].value_counts(dropna=False).to_dict()
+            info.config(text=f"{len(df)} satır — {year_col} dağılımı: {dist}")
+        else:
+            info.config(text=f"{len(df)} satır — Kolonlar: {cols}")
+        return df
+
     @staticmethod
     def _looks_like_misheaded(df) -> bool:
         if len(df.columns) == 0: return False
@@ -230,65 +302,103 @@ class ImportView(ttk.Frame):
 
     def _dry_run(self, parent, kind: str):
         result: ttk.Label = getattr(parent, "result_label")
-        df = self._df_cache.get(kind)
-        if df is None:
+        stream_path = self._stream_path.get(kind)
+        if not stream_path and self._df_cache.get(kind) is None and self._full_load.get(kind) is None:
             result.config(text="Önce dosyayı önizleyin."); return
 
         colmap = {k: v.get() for k, v in self._maps.get(kind, {}).items()}
         if any(not v for v in colmap.values()):
             result.config(text="⚠️ Lütfen tüm alanlar için sütun seçin."); return
 
-        if kind == "courses":
-            ok, warn = self._validate_courses(df, colmap)
-        else:
-            ok, warn = self._validate_students(df, colmap)
+        if stream_path:
+            rep = self._stream_batch(parent, kind, stream_path, colmap)["summary"]
+            msg = f"✅ {rep['ok']} satır geçerli."
+            if rep["warn"]: msg += f"  ⚠️ {rep['warn']} satır atlandı (eksik/hatalı)."
+            if rep["error_lines"]: msg += "\n" + "\n".join(rep["error_lines"])
+            result.config(text=msg)
+            return
+
+        df = self._full_df(parent, kind)
+        if df is None:
+            return
+
+        batch = self._batch(kind, df, colmap)
+        ok = len(batch["rows"])
+        warn = batch["total"] - ok
+        errors = batch["errors"]
 
         if ok == 0:
             result.config(text="Hiç geçerli satır bulunamadı.")
         else:
             msg = f"✅ {ok} satır geçerli."
             if warn: msg += f"  ⚠️ {warn} satır atlandı (eksik/hatalı)."
+            if not errors.empty: msg += "\n" + "\n".join(error_lines(errors))
             result.config(text=msg)
 
-    def _validate_courses(self, df, colmap) -> Tuple[int, int]:
-        ok = warn = 0
-        for _, row in df.iterrows():
-            try:
-                code = self._norm_code(row[colmap["Kod"]])
-                name = str(row[colmap["Ad"]]).strip()
-                cls  = self._to_int(row[colmap["Sınıf(Yıl)"]])
-                if self._fixed_year.get():
-                    cls = int(self._fixed_year.get())
-                comp_raw = str(row[colmap["Zorunlu(E/H)"]]).strip().upper()
-                if not code or not name or cls is None or not (1 <= cls <= 8):
-                    warn += 1; continue
-                _ = self._to_compulsory(comp_raw)  # sadece doğrulama
-                ok += 1
-            except Exception:
-                warn += 1
-        return ok, warn
+    def _fixed_year_value(self) -> Optional[int]:
+        return int(self._fixed_year.get()) if self._fixed_year.get() else None
 
-    def _validate_students(self, df, colmap) -> Tuple[int, int]:
-        ok = warn = 0
-        for _, row in df.iterrows():
+    def _batch(self, kind: str, df, colmap) -> dict:
+        """
+        Doğrulanmış parti: aynı dosya + aynı sütun eşlemesi (+ sabit yıl) için bir kez hesaplanır.
+        Dry-Run sonrası DB'ye Aktar yeniden ayrıştırma/doğrulama yapmaz.
+        """
+        fixed_year = self._fixed_year_value()
+        key = batch_key(self._src_key.get(kind), kind, colmap, fixed_year)
+        batch = self._batches.get(kind)
+        if batch is None or batch["key"] != key:
+            self._drop_batch(kind)
+            batch = validate_batch(df, kind, colmap, fixed_year, source=self._src_key.get(kind))
+            self._batches[kind] = batch
+        return batch
+
+    def _stream_batch(self, parent, kind: str, path: str, colmap) -> dict:
+        """
+        Akış modu Dry-Run'ı: dosya parça parça doğrulanır, geçerli parçalar geçici dosyaya (spool) yazılır.
+        Aynı anahtarla DB'ye Aktar bu dosyayı kullanır (Excel yeniden okunmaz/doğrulanmaz); bellek düz kalır.
+        """
+        key = batch_key(self._src_key.get(kind), kind, colmap)
+        batch = self._batches.get(kind)
+        if batch is not None and batch["key"] == key:
+            return batch
+        self._drop_batch(kind)
+        fd, spool = tempfile.mkstemp(prefix="import_", suffix=".pickle")
+        os.close(fd)
+        try:
+            summary = stream_student_import(path, colmap, progress=self._progress(parent), spool=spool)
+        except Exception:
+            os.remove(spool)
+            raise
+        batch = {"key": key, "kind": kind, "summary": summary, "spool": spool}
+        self._batches[kind] = batch
+        return batch
+
+    def _drop_batch(self, kind: str):
+        batch = self._batches.pop(kind, None)
+        if batch and batch.get("spool"):
             try:
-                num = self._clean_number(row[colmap["Numara"]])
-                name = str(row[colmap["Ad Soyad"]]).strip()
-                cls  = self._to_int(row[colmap["Sınıf(Yıl)"]])
-                codes = [self._norm_code(c) for c in self._split_codes(str(row[colmap["Dersler(virgülle kodlar)"]]))]
-                if not num or not name or cls is None or not (1 <= cls <= 8):
-                    warn += 1; continue
-                _ = codes  # boş olabilir
-                ok += 1
-            except Exception:
-                warn += 1
-        return ok, warn
+                os.remove(batch["spool"])
+            except OSError:
+                pass
+
+    def destroy(self):
+        for kind in list(self._batches):
+            self._drop_batch(kind)
+        super().destroy()
+
+    def _progress(self, parent):
+        label: ttk.Label = getattr(parent, "result_label")
+
+        def progress(n):
+            label.config(text=f"İşleniyor… {n} satır")
+            self.update_idletasks()
+        return progress
 
     # ------------------ DB'ye Aktar ------------------
 
     def _import_to_db(self, parent, kind: str):
-        df = self._df_cache.get(kind)
-        if df is None:
+        stream_path = self._stream_path.get(kind)
+        if not stream_path and self._df_cache.get(kind) is None and self._full_load.get(kind) is None:
             messagebox.showwarning("Uyarı", "Önce dosyayı önizleyin."); return
 
         colmap = {k: v.get() for k, v in self._maps.get(kind, {}).items()}
@@ -296,186 +406,79 @@ class ImportView(ttk.Frame):
             messagebox.showwarning("Uyarı", "Tüm alanlar için sütun seçin."); return
 
         dept_id = self.user.get("department_id") or 1
+        if stream_path:
+            # Dry-Run aynı eşlemeyle yapıldıysa doğrulanmış parçalar spool'dan yazılır; yoksa tek geçişte
+            # oku + doğrula + yaz (her parça ayrı commit)
+            batch = self._batches.get(kind)
+            try:
+                if batch is not None and batch["key"] == batch_key(self._src_key.get(kind), kind, colmap):
+                    rep = import_spooled(batch["spool"], dept_id, progress=self._progress(parent))
+                else:
+                    rep = stream_student_import(stream_path, colmap, dept_id, progress=self._progress(parent))
+            except Exception as e:
+                messagebox.showerror("Hata", f"İçe aktarma başarısız (önceki parçalar kaydedildi): {e}")
+                return
+            self._show_student_result(parent, rep["ok"], rep["warn"], rep["missing"])
+            return
+
+        df = self._full_df(parent, kind)
+        if df is None:
+            return
+
         try:
             with get_conn() as con:
                 cur = con.cursor()
 
+                batch = self._batch(kind, df, colmap)
+
                 if kind == "courses":
-                    ok = warn = 0
-                    for _, row in df.iterrows():
-                        try:
-                            code = self._norm_code(row[colmap["Kod"]])
-                            name = str(row[colmap["Ad"]]).strip()
-                            cls  = self._to_int(row[colmap["Sınıf(Yıl)"]])
-                            if self._fixed_year.get():
-                                cls = int(self._fixed_year.get())
-                            comp = self._to_compulsory(str(row[colmap["Zorunlu(E/H)"]]).strip())
-                            instr = str(row[colmap["Öğretim Üyesi"]]).strip()
-
-                            if not code or not name or cls is None or not (1 <= cls <= 8):
-                                warn += 1; continue
-
-                            # UPSERT (öncelik: dept_id + code benzersizliği)
-                            try:
-                                cur.execute("""
-                                    INSERT INTO courses(dept_id, code, name, instructor, class_year, is_compulsory)
-                                    VALUES (?, ?, ?, ?, ?, ?)
-                                    ON CONFLICT(dept_id, code) DO UPDATE SET
-                                        name          = excluded.name,
-                                        instructor    = excluded.instructor,
-                                        class_year    = excluded.class_year,
-                                        is_compulsory = excluded.is_compulsory
-                                """, (dept_id, code, name, instr, cls, comp))
-                            except Exception:
-                                # Şemanızda UNIQUE yoksa graceful fallback:
-                                cur.execute("""
-                                    INSERT OR IGNORE INTO courses(dept_id, code, name, instructor, class_year, is_compulsory)
-                                    VALUES (?, ?, ?, ?, ?, ?)
-                                """, (dept_id, code, name, instr, cls, comp))
-                                # varsa güncelle
-                                cur.execute("""
-                                    UPDATE courses
-                                    SET name=?, instructor=?, class_year=?, is_compulsory=?
-                                    WHERE dept_id=? AND code=?
-                                """, (name, instr, cls, comp, dept_id, code))
-
-                            ok += 1
-                        except Exception:
-                            warn += 1
+                    rows = [(dept_id, code, name, instr, int(cls), int(comp))
+                            for code, name, cls, comp, instr in batch["rows"][
+                                ["code", "name", "class_year", "is_compulsory", "instructor"]
+                            ].itertuples(index=False)]
+                    # UPSERT (dept_id + code benzersizliği, migration 2)
+                    cur.executemany("""
+                        INSERT INTO courses(dept_id, code, name, instructor, class_year, is_compulsory)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(dept_id, code) DO UPDATE SET
+                            name          = excluded.name,
+                            instructor    = excluded.instructor,
+                            class_year    = excluded.class_year,
+                            is_compulsory = excluded.is_compulsory
+                    """, rows)
+                    ok, warn = len(rows), batch["total"] - len(rows)
                     messagebox.showinfo("Tamam", f"✅ Dersler işlendi. Başarılı: {ok}  ⚠️ Atlanan: {warn}")
                     getattr(parent, "result_label").config(text=f"Dersler: {ok} ok, {warn} atlandı")
                     return
 
                 # --- STUDENTS ---
-                ok = warn = 0
-                errors = []
-                missing_codes_global = set()
-
-                for _, row in df.iterrows():
-                    try:
-                        num = self._clean_number(row[colmap["Numara"]])
-                        name = str(row[colmap["Ad Soyad"]]).strip()
-                        cls  = self._to_int(row[colmap["Sınıf(Yıl)"]])
-                        codes = [self._norm_code(c) for c in self._split_codes(str(row[colmap["Dersler(virgülle kodlar)"]]))]
-
-                        if not num or not name or cls is None or not (1 <= cls <= 8):
-                            warn += 1; continue
-
-                        # Öğrenciyi ekle
-                        cur.execute("""
-                            INSERT OR IGNORE INTO students(dept_id, number, full_name, class_year)
-                            VALUES (?, ?, ?, ?)
-                        """, (dept_id, num, name, cls))
-
-                        # id al
-                        cur.execute("SELECT id FROM students WHERE dept_id=? AND number=?", (dept_id, num))
-                        r = cur.fetchone()
-                        if not r:
-                            warn += 1; continue
-                        sid = r[0]
-
-                        # Ders ilişkileri
-                        for code in codes:
-                            cur.execute("SELECT id FROM courses WHERE dept_id=? AND code=?", (dept_id, code))
-                            rc = cur.fetchone()
-                            if not rc:
-                                missing_codes_global.add(code)
-                                continue
-                            cid = rc[0]
-                            cur.execute("""
-                                INSERT OR IGNORE INTO enrollments(student_id, course_id)
-                                VALUES (?, ?)
-                            """, (sid, cid))
-
-                        ok += 1
-
-                    except Exception as e:
-                        warn += 1
-                        if len(errors) < 3:
-                            errors.append(str(e))
-
-                extra = ""
-                if missing_codes_global:
-                    sample = ", ".join(sorted(list(missing_codes_global))[:15])
-                    extra = f"\nEşleşmeyen ders kodu örnekleri ({min(len(missing_codes_global), 15)} / {len(missing_codes_global)}): {sample}"
-
-                msg = f"✅ DB güncellendi. Başarılı: {ok}"
-                if warn: msg += f"  ⚠️ Atlanan: {warn}"
-                if extra: msg += extra
-                messagebox.showinfo("Tamam", msg)
-                getattr(parent, "result_label").config(text=msg)
+                # doğrulanmış parti + toplu yazım (core.excel.validate, core.importers)
+                students, enrollments = batch["rows"], batch["enrollments"]
+                ok, not_found, missing_codes_global = import_student_enrollments(
+                    con, dept_id,
+                    students[["number", "full_name", "class_year"]].itertuples(index=False, name=None),
+                    enrollments[["number", "code"]].itertuples(index=False, name=None),
+                )
+                warn = batch["total"] - len(students) + not_found
 
         except Exception as e:
             messagebox.showerror("Hata", f"İçe aktarma başarısız: {e}")
+            return
+        self._show_student_result(parent, ok, warn, missing_codes_global)
 
-    # ------------------ Yardımcılar ------------------
-
-    @staticmethod
-    def _norm_code(text: str) -> str:
-        """Ders kodunu karşılaştırmaya uygun forma getirir (MAT 101 → MAT101)."""
-        return re.sub(r"[\s\-_]+", "", (str(text) if text is not None else "").strip().upper())
-
-    @staticmethod
-    def _clean_number(num) -> str:
-        """Öğrenci numarasından rakam dışını temizler (210059017 gibi)."""
-        return re.sub(r"\D", "", str(num or ""))
-
-    @staticmethod
-    def _to_int(val) -> Optional[int]:
-        """'5', '5.0', '5. Sınıf' gibi metinlerden 1–8'i yakalar."""
-        if val is None:
-            return None
-        m = re.search(r"[1-8]", str(val))
-        return int(m.group()) if m else None
+    def _show_student_result(self, parent, ok: int, warn: int, missing_codes_global):
+        extra = ""
+        if missing_codes_global:
+            sample = ", ".join(sorted(list(missing_codes_global))[:15])
+            extra = f"\nEşleşmeyen ders kodu örnekleri ({min(len(missing_codes_global), 15)} / {len(missing_codes_global)}): {sample}"
 
-    @staticmethod
-    def _to_compulsory(val: str) -> int:
-        """
-        Zorunluluk bilgisini çok daha esnek yorumlar.
-        Örnek kabul edilenler:
-          - Zorunlu:  E, EVET, 1, TRUE, YES, Z, ZORUNLU, ZORUNLU DERS
-          - Seçmeli:  H, HAYIR, 0, FALSE, NO, S, SEÇMELİ, SECMELI, SEÇMELİ DERS, SECMELI DERS
-        Ayrıca 'Seçmeli ders', 'Zorunlu ders', 'Secmeli', küçük/büyük/şapkalı-şapkasız hepsi desteklenir.
-        """
-        t = (val or "").strip().upper()
-
-        # TR normalize: ÇŞĞİÜÖ → C S G I U O, ayrıca boşluk/çizgi/alt çizgi sil
-        tr_map = str.maketrans({
-            "Ç": "C", "Ş": "S", "Ğ": "G", "İ": "I", "Ü": "U", "Ö": "O",
-            "ç": "C", "ş": "S", "ğ": "G", "ı": "I", "i": "I", "ü": "U", "ö": "O",
-        })
-        norm = t.translate(tr_map)
-        norm = "".join(ch for ch in norm if ch.isalnum())  # harf-rakam dışını at
-
-        # Bazı yaygın varyantları yakala (içerme veya baş harf)
-        # Önce 'SEC' geçen her şeyi seçmeli kabul et (SECMELI, SECMELIDERS vb.)
-        if "SEC" in norm:  # SEÇ.../SEC... gördüysek → seçmeli
-            return 0
-        if "ZORUNLU" in norm or "ZORUNLUDERS" in norm:
-            return 1
-
-        # Tek harfli/dijitli kısaltmalar
-        if norm in {"E", "EVET", "1", "TRUE", "T", "YES", "Z"}:
-            return 1
-        if norm in {"H", "HAYIR", "0", "FALSE", "F", "NO", "S"}:
-            return 0
-
-        # 'Z' ile başlıyorsa zorunlu, 'S' ile başlıyorsa seçmeli
-        if norm.startswith("Z"):
-            return 1
-        if norm.startswith("S"):
-            return 0
-
-        # Belirsizde default PDF uyumluluğu için 'zorunlu'ya düşürmeyelim; uyarı vermek daha güvenli
-        # Ancak mevcut akışa dokunmadan geriye 1 yerine 0 döndürmek istersen, aşağıyı 0 yap.
-        return 1
+        msg = f"✅ DB güncellendi. Başarılı: {ok}"
+        if warn: msg += f"  ⚠️ Atlanan: {warn}"
+        if extra: msg += extra
+        messagebox.showinfo("Tamam", msg)
+        getattr(parent, "result_label").config(text=msg)
 
-    @staticmethod
-    def _split_codes(text: str) -> List[str]:
-        """Ders kodlarını , ; / ve boşlukla ayırır, boşları atar."""
-        t = (text or "").replace(";", ",").replace("/", ",")
-        parts = re.split(r"[,\s]+", t)
-        return [p for p in parts if p and p.strip()]
+    # ------------------ Yardımcılar ------------------
 
     @staticmethod
     def _find_year_col(cols) -> Optional[str]:
@@ -3,13 +3,13 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 import pandas as pd
 from reportlab.lib.pagesizes import A4, landscape
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import cm
-from core.db import get_conn
+from core.db import DATA_DIR, get_conn
 
 
 class ScheduleView(ttk.Frame):
@@ -46,6 +46,9 @@ class ScheduleView(ttk.Frame):
         from ui.widgets import Toolbar
         tb = Toolbar(self)
         tb.add_left("Otomatik Planla", self.auto_plan)
+        tb.add_left("Planı Onar", self.repair_plan)
+        if self.is_admin:
+            tb.add_left("Tüm Bölümleri Planla", self.auto_plan_all)
         tb.add_left("Çakışma Hesapla", self.check_conflicts)
         tb.add_left("Otomatik Oda Ata", self.auto_assign_rooms)
         tb.add_left("Saat/Derslik Düzenle", self.edit_selected_exam)
@@ -81,6 +84,13 @@ class ScheduleView(ttk.Frame):
             "single_exam_at_a_time": False, # aynı anda yalnızca tek sınav
             "exam_type": "Vize",            # not: şimdilik kayıt amaçlı
             "excluded_courses": set(),
+            "strategy": "greedy",           # greedy | dsatur
+            "improve_seconds": 0,           # plan sonrası iyileştirme süresi (sn), 0 = kapalı
+            "improve_iterations": None,     # verilirse iyileştirme hamle sayısıyla biter (aynı sonuç, süre yok sayılır)
+            "multistart_runs": 1,           # >1: farklı tohumlarla paralel deneme, en iyisi tutulur
+            "joint_rooms": False,           # derslikleri zamanla birlikte ata (kapasite slotu belirler)
+            "room_solver": "greedy",        # Otomatik Oda Ata: greedy | optimal (slot başına min-cost eşleme)
+            "graph_cache_dir": (DATA_DIR / "cache").as_posix(),  # çakışma grafı disk önbelleği
         }
 
         # BİLGİ ETİKETİ
@@ -146,7 +156,14 @@ class ScheduleView(ttk.Frame):
         ts_s = self._fmt_hhmm(ts)
         return f"{code} için uygun boş derslik yok (ihtiyaç: {need}) — {ts_s}"
 
-    def _msg_conflicts_summary(self, total: int, per_slot_rows: list, examples: list) -> str:
+    def _msg_unplaced(self, codes: list) -> str:
+        sample = ", ".join(codes[:15])
+        return (f"⚠️ {len(codes)} ders çakışmasız yerleştirilemedi ve programa eklenmedi.\n"
+                f"Örnekler: {sample}\n"
+                "Tarih aralığını genişletin veya bekleme süresini azaltın.")
+
+    def _msg_conflicts_summary(self, total: int, per_slot_rows: list, examples: list,
+                               per_student_rows: list = ()) -> str:
         if total == 0:
             return "✅ Hiç çakışma bulunamadı."
         parts = [f"⚠️ {total} çakışma bulundu.", ""]
@@ -155,6 +172,11 @@ class ScheduleView(ttk.Frame):
             for ts, cnt in per_slot_rows:
                 parts.append(f"  {self._fmt_hhmm(ts)}: {cnt}")
             parts.append("")
+        if per_student_rows:
+            parts.append("— En çok çakışan öğrenciler (ilk 5) —")
+            for num, ad, cnt in per_student_rows[:5]:
+                parts.append(f"  {num} - {ad}: {cnt}")
+            parts.append("")
         if examples:
             parts.append("Örnekler (ilk 5):")
             for num, ad, c1, c2, ts in examples[:5]:
@@ -388,221 +410,99 @@ class ScheduleView(ttk.Frame):
     def check_conflicts(self):
         dept_id = self._active_dept_id()
 
-        with get_conn() as con:
-            cur = con.cursor()
-
-            cur.execute("""
-                WITH enroll AS (
-                    SELECT DISTINCT student_id, course_id
-                    FROM enrollments
-                )
-                SELECT
-                    s.number,
-                    s.full_name,
-                    c1.code AS course1,
-                    c2.code AS course2,
-                    ex1.exam_start
-                FROM enroll e1
-                JOIN enroll e2
-                     ON e1.student_id = e2.student_id
-                    AND e1.course_id  < e2.course_id
-                JOIN exams  ex1 ON ex1.course_id = e1.course_id
-                JOIN exams  ex2 ON ex2.course_id = e2.course_id
-                               AND ex1.exam_start = ex2.exam_start
-                JOIN courses c1 ON c1.id = e1.course_id AND c1.dept_id = ?
-                JOIN courses c2 ON c2.id = e2.course_id AND c2.dept_id = ?
-                JOIN students s ON s.id = e1.student_id
-                ORDER BY ex1.exam_start, s.number
-            """, (dept_id, dept_id))
-            rows = cur.fetchall()
+        from core.scheduler import load_conflict_report
 
-            cur.execute("""
-                WITH enroll AS (
-                    SELECT DISTINCT student_id, course_id
-                    FROM enrollments
-                ),
-                base AS (
-                    SELECT ex1.exam_start AS ts
-                    FROM enroll e1
-                    JOIN enroll e2
-                         ON e1.student_id = e2.student_id
-                        AND e1.course_id  < e2.course_id
-                    JOIN exams  ex1 ON ex1.course_id = e1.course_id
-                    JOIN exams  ex2 ON ex2.course_id = e2.course_id
-                                   AND ex1.exam_start = ex2.exam_start
-                    JOIN courses c1 ON c1.id = e1.course_id AND c1.dept_id = ?
-                    JOIN courses c2 ON c2.id = e2.course_id AND c2.dept_id = ?
-                )
-                SELECT ts, COUNT(*) AS cnt
-                FROM base
-                GROUP BY ts
-                ORDER BY ts
-            """, (dept_id, dept_id))
-            per_slot = cur.fetchall()
+        with get_conn() as con:
+            report = load_conflict_report(con, dept_id)
 
+        rows = report["rows"]
         if not rows:
             messagebox.showinfo("Çakışma Kontrolü", self._msg_conflicts_summary(0, [], []))
             return
 
         total = len(rows)
-        msg = self._msg_conflicts_summary(total, per_slot, rows)
+        msg = self._msg_conflicts_summary(total, report["per_slot"], rows, report["per_student"])
         messagebox.showwarning("Çakışma Detayı", msg)
 
     # ----------------- OTOMATİK PLAN -----------------
 
     def auto_plan(self):
         """
-        Çakışma-farkında basit yerleştirici:
-        - Slotlar: 10 gün * [09:00, 11:00, 13:30, 15:30, 17:00, 19:00]
+        Çakışma-farkında basit yerleştirici (motor: core.scheduler):
+        - Slotlar: 10 gün * [09:00, 11:00, 13:30, 15:30, 17:00, 19:00] ya da kısıtlardaki tarih aralığı
         - Dersler, öğrencisi ortak olduğu derslerle aynı anda olmadan yerleştirilir.
         """
+        from core.scheduler import plan_department
+
         dept_id = self._active_dept_id()
+        result = plan_department(dept_id, self.constraints)
 
-        # --- SLOT HAVUZU (Kısıtlar varsa onlara göre üret)
-        daily_times = [(9, 0), (11, 0), (13, 30), (15, 30), (17, 0), (19, 0)]
-        slots = []
-
-        c = getattr(self, "constraints", None)
-        if c and c.get("date_start") and c.get("date_end"):
-            cur_day = c["date_start"]
-            while cur_day <= c["date_end"]:
-                if cur_day.weekday() not in c.get("exclude_days", set()):
-                    for h, m in daily_times:
-                        slots.append(datetime(cur_day.year, cur_day.month, cur_day.day, h, m))
-                cur_day += timedelta(days=1)
-        else:
-            start_day = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
-            days = [start_day + timedelta(days=d) for d in range(10)]
-            for d in days:
-                for h, m in daily_times:
-                    slots.append(d.replace(hour=h, minute=m))
+        if not result["placements"]:
+            if result.get("unplaced"):
+                messagebox.showwarning("Otomatik Plan", self._msg_unplaced(result["unplaced_codes"]))
+            else:
+                messagebox.showinfo("Otomatik Plan", "Programlanacak ders kalmadı (tüm dersler çıkarılmış olabilir).")
+            return
 
-        with get_conn() as con:
-            cur = con.cursor()
-            cur.execute("""
-                SELECT id, code, class_year
-                FROM courses
-                WHERE dept_id=?
-                ORDER BY code
-            """, (dept_id,))
-            courses = cur.fetchall()  # [(cid, code, class_year), ...]
+        self.refresh()
+        no_room = result["metrics"].get("room_unassigned", 0)
+        room_note = f"\n\nDerslik atanamayan sınav: {no_room} (Otomatik Oda Ata ile tekrar deneyin)" if no_room else ""
+        if result.get("unplaced"):
+            messagebox.showwarning("Otomatik Plan", "Taslak plan oluşturuldu.\n\n"
+                                   + self._msg_unplaced(result["unplaced_codes"]) + room_note)
+            return
+        messagebox.showinfo("Tamam", "Çakışma-farkında taslak sınav planı oluşturuldu." + room_note)
 
-            excluded_ids = set(self.constraints.get("excluded_courses", set()) or set())
-            if excluded_ids:
-                courses = [row for row in courses if row[0] not in excluded_ids]
+    def auto_plan_all(self):
+        """
+        Admin: tüm bölümler birlikte planlanır (tek çakışma grafı + tek derslik havuzu).
+        Bölümler arası ortak öğrencisi olmayan gruplar paralel çözülür.
+        """
+        from core.scheduler import plan_all_departments
 
-            if not courses:
-                messagebox.showinfo("Otomatik Plan", "Programlanacak ders kalmadı (tüm dersler çıkarılmış olabilir).")
-                return
+        if not messagebox.askyesno("Tüm Bölümler",
+                                   "Tüm bölümlerin mevcut sınavları silinip yeniden planlanacak. Devam edilsin mi?"):
+            return
+        result = plan_all_departments(self.constraints)
+        m = result["metrics"]
+        self.refresh()
 
-            # Bu bölümün sınavlarını temizle
-            cur.execute("""
-                DELETE FROM exams
-                WHERE course_id IN (SELECT id FROM courses WHERE dept_id=?)
-            """, (dept_id,))
+        lines = [
+            f"Bölüm: {m.get('departments', 0)}  •  Bağımsız grup: {len(m.get('partitions', []))}"
+            f"{' (paralel)' if m.get('parallel') else ''}",
+            f"Yerleşen: {m.get('placed', 0)}  •  Çakışma: {m.get('conflicts', 0)}",
+            f"Derslik atanan: {m.get('rooms_assigned', 0)}  •  Atanamayan: {m.get('room_unassigned', 0)}",
+            f"Süre: {m.get('elapsed_s', 0):.2f} sn",
+        ]
+        if result.get("unplaced"):
+            messagebox.showwarning("Tüm Bölümler", "\n".join(lines) + "\n\n" + self._msg_unplaced(result["unplaced_codes"]))
+            return
+        messagebox.showinfo("Tüm Bölümler", "\n".join(lines))
 
-            # Her dersin öğrenci kümesi / boyutu / sınıf yılı
-            course_students = {}
-            course_sizes = {}
-            course_year = {}
-            for cid, _, cy in courses:
-                cur.execute("SELECT student_id FROM enrollments WHERE course_id=?", (cid,))
-                sids = {r[0] for r in cur.fetchall()}
-                course_students[cid] = sids
-                course_sizes[cid] = len(sids)
-                course_year[cid] = cy
-
-            # Çakışma grafı
-            neighbors = {cid: set() for cid, _, _ in courses}
-            cids = [cid for cid, _, _ in courses]
-            for i in range(len(cids)):
-                a = cids[i]
-                Sa = course_students[a]
-                for j in range(i + 1, len(cids)):
-                    b = cids[j]
-                    if not Sa or not course_students[b]:
-                        continue
-                    if Sa.intersection(course_students[b]):
-                        neighbors[a].add(b)
-                        neighbors[b].add(a)
-
-            # Yerleştirme sırası
-            order = sorted(cids, key=lambda x: (course_sizes[x], len(neighbors[x])), reverse=True)
-
-            # Greedy yerleştirme
-            placed_time = {}          # cid -> slot(datetime)
-            used_by_slot = {}         # slot -> set(cid)
-            last_exam = {}            # student_id -> datetime
-            from collections import defaultdict
-            used_days_by_year = defaultdict(set)  # class_year -> {date}
-
-            for cid in order:
-                forbiddens = set()
-                for nb in neighbors[cid]:
-                    if nb in placed_time:
-                        forbiddens.add(placed_time[nb])
-
-                chosen = None
-                cy = course_year.get(cid, None)
-
-                def _can_place_at(ts):
-                    if ts in forbiddens:
-                        return False
-                    if self.constraints.get("single_exam_at_a_time", False) and used_by_slot.get(ts):
-                        return False
-                    for other in used_by_slot.get(ts, set()):
-                        if course_students[cid] & course_students[other]:
-                            return False
-                    cooldown = int(self.constraints.get("cooldown_min", 0) or 0)
-                    if cooldown > 0:
-                        for sid in course_students[cid]:
-                            last = last_exam.get(sid)
-                            if last is not None:
-                                delta_min = abs((ts - last).total_seconds()) / 60.0
-                                if delta_min < cooldown:
-                                    return False
-                    return True
-
-                # Aşama 1: Aynı sınıf yılına farklı gün
-                if cy is not None:
-                    for ts in slots:
-                        if not _can_place_at(ts):
-                            continue
-                        day = ts.date()
-                        if day not in used_days_by_year[cy]:
-                            chosen = ts
-                            break
-
-                # Aşama 2: Genel ilk uygun slot
-                if chosen is None:
-                    for ts in slots:
-                        if _can_place_at(ts):
-                            chosen = ts
-                            break
-
-                if chosen is None:
-                    chosen = slots[-1]
-
-                placed_time[cid] = chosen
-                used_by_slot.setdefault(chosen, set()).add(cid)
-                for sid in course_students[cid]:
-                    last_exam[sid] = chosen
-                if cy is not None and chosen is not None:
-                    used_days_by_year[cy].add(chosen.date())
-
-            # Veritabanına yaz
-            exam_type = self.constraints.get("exam_type", "Vize")
-            if exam_type not in ("Vize", "Final", "Bütünleme"):
-                exam_type = "Vize"
-
-            for cid, ts in placed_time.items():
-                cur.execute(
-                    "INSERT INTO exams(course_id, exam_start, exam_type) VALUES (?, ?, ?)",
-                    (cid, ts, exam_type)
-                )
+    def repair_plan(self):
+        """
+        Artımlı plan: mevcut (elle düzeltilmiş dahil) sınavlar yerinde kalır;
+        yalnız yeni, sınavsız, kayıtları içe aktarmayla değişmiş (dirty) veya aynı saatte öğrenci
+        çakışması olan dersler yeniden yerleşir.
+        """
+        from core.scheduler import load_dirty_courses, repair_department
 
-        self.refresh()
-        messagebox.showinfo("Tamam", "Çakışma-farkında taslak sınav planı oluşturuldu.")
+        dept_id = self._active_dept_id()
+        with get_conn() as con:
+            dirty = load_dirty_courses(con, dept_id)   # son içe aktarmalarda kaydı değişen dersler
+        result = repair_department(dept_id, self.constraints, dirty=dirty)
+        rep = result["metrics"].get("repair", {})
+
+        if result["changed"]:
+            self.refresh()
+        msg = (f"Sabit kalan: {rep.get('pinned', 0)}\n"
+               f"Yeniden yerleşen: {rep.get('replaced', 0)} "
+               f"(yeni: {rep.get('new', 0)}, kaydı değişen: {rep.get('dirty', 0)}, "
+               f"çakışan: {rep.get('conflicting', 0)})")
+        if result.get("unplaced"):
+            messagebox.showwarning("Planı Onar", msg + "\n\n" + self._msg_unplaced(result["unplaced_codes"]))
+            return
+        messagebox.showinfo("Planı Onar", msg)
 
     # ----------------- ELLE DÜZENLEME (Çift tık) -----------------
 
@@ -659,10 +559,15 @@ class ScheduleView(ttk.Frame):
             """, (dept_id,))
             rooms = cur.fetchall()
 
+            # anlık çakışma önizlemesi: komşu sınavlar + derslik doluluğu bir kez belleğe
+            from core.scheduler import load_move_preview, parse_exam_start, slot_key
+            preview = load_move_preview(con, course_id, exam_id_val, self.constraints.get("cooldown_min", 0),
+                                        self.constraints.get("default_duration"))
+
         # Pencere
         win = tk.Toplevel(self)
         win.title(f"Sınav Düzenle — {code}")
-        win.geometry("420x200")
+        win.geometry("460x300")
         win.transient(self.winfo_toplevel())
         win.grab_set()
 
@@ -683,6 +588,41 @@ class ScheduleView(ttk.Frame):
         ttk.Combobox(frm, textvariable=v_room, values=room_disp_list, state="readonly", width=36) \
             .grid(row=1, column=1, sticky="w", padx=6, pady=6)
 
+        lbl_preview = ttk.Label(frm, text="", justify="left", wraplength=420)
+        lbl_preview.grid(row=2, column=0, columnspan=2, sticky="w", padx=6, pady=(8, 0))
+
+        def _room_id_of(sel_text):
+            if sel_text == "(boş bırak)":
+                return None
+            try:
+                return int(sel_text.split(" — ")[0])
+            except Exception:
+                return None
+
+        def _update_preview(*_):
+            dt = parse_exam_start(v_start.get())
+            if dt is None:
+                lbl_preview.config(text="Tarih okunamadı (YYYY-MM-DD HH:MM)", foreground="gray")
+                return
+            r = preview.evaluate(slot_key(dt), _room_id_of(v_room.get()))
+            lines = []
+            if r["students"]:
+                lines.append(f"⚠️ Öğrenci çakışması: {r['students']} ("
+                             + ", ".join(f"{c} {n}" for c, n in r["student_courses"][:4]) + ")")
+            if r["cooldown"]:
+                lines.append(f"⚠️ Bekleme süresi ihlali: {r['cooldown']} ("
+                             + ", ".join(f"{c} {n}" for c, n in r["cooldown_courses"][:4]) + ")")
+            if r["room"]:
+                lines.append("⚠️ Derslik dolu: " + ", ".join(r["room"][:4]))
+            if lines:
+                lbl_preview.config(text="\n".join(lines), foreground="firebrick")
+            else:
+                lbl_preview.config(text="✅ Çakışma yok", foreground="darkgreen")
+
+        v_start.trace_add("write", _update_preview)
+        v_room.trace_add("write", _update_preview)
+        _update_preview()
+
         btnf = ttk.Frame(win); btnf.pack(fill="x", padx=12, pady=(0, 12))
 
         def _save():
@@ -693,22 +633,20 @@ class ScheduleView(ttk.Frame):
                 messagebox.showerror("Hata", "Tarih formatı hatalı. Örn: 2025-01-15 13:30")
                 return
 
-            sel_text = v_room.get()
-            new_room_id = None
-            if sel_text != "(boş bırak)":
-                try:
-                    new_room_id = int(sel_text.split(" — ")[0])
-                except Exception:
-                    new_room_id = None
+            new_room_id = _room_id_of(v_room.get())
 
             with get_conn() as con2:
                 cur2 = con2.cursor()
                 if exam_id_val:
+                    if val_start != exam_start or new_room_id != exam_room:
+                        # elle değişen sınavın bölünmüş derslik parçaları geçersiz
+                        cur2.execute("DELETE FROM exam_rooms WHERE exam_id=?", (exam_id_val,))
                     cur2.execute("UPDATE exams SET exam_start=?, room_id=? WHERE id=?",
                                  (val_start, new_room_id, exam_id_val))
                 else:
-                    cur2.execute("INSERT INTO exams(course_id, exam_start, room_id) VALUES (?,?,?)",
-                                 (course_id, val_start, new_room_id))
+                    # süre planlayıcıyla aynı (şema varsayılanı 120 slot ızgarasında sahte örtüşme üretir)
+                    cur2.execute("INSERT INTO exams(course_id, exam_start, room_id, duration_min) VALUES (?,?,?,?)",
+                                 (course_id, val_start, new_room_id, preview.duration))
 
             self.refresh()
             win.destroy()
@@ -719,9 +657,25 @@ class ScheduleView(ttk.Frame):
     # ----------------- OTOMATİK ODA ATAMA -----------------
 
     def auto_assign_rooms(self):
-        """Her sınav için, aynı anda boş olan ve kapasitesi yeten bir derslik ata."""
+        """
+        Her sınav için, aynı anda boş olan ve kapasitesi yeten bir derslik ata (motor: core.scheduler.assign_rooms).
+        Her slotta kalabalık sınav önce; sığan en küçük boş derslik (best-fit).
+        Tek dersliğe sığmayan sınav boş dersliklere bölünür (en az derslik, en az boş koltuk).
+        Kısıtlarda "optimal" seçiliyse her slot min-cost eşleme ile çözülür ve greedy ile karşılaştırılır.
+        """
+        import time
+        from core.scheduler import (assign_rooms, assign_rooms_optimal, exam_interval, load_busy_rooms,
+                                    matching_available, room_summary, save_exam_rooms, slot_from_key,
+                                    slot_overlaps)
+
+        solver = self.constraints.get("room_solver", "greedy")
+        if solver == "optimal" and not matching_available():
+            messagebox.showwarning("Oda Atama", "Optimal eşleme için numpy/scipy gerekli (pip install numpy scipy).\n"
+                                                "Greedy atama kullanılacak.")
+            solver = "greedy"
+        compare_line = ""
+
         dept_id = self._active_dept_id()
-        assigned = 0
         skipped_no_room = 0
         skipped_capacity = 0
         examples_capacity = []  # (code, need, maxcap, ts)
@@ -746,48 +700,66 @@ class ScheduleView(ttk.Frame):
             # Oda atanmamış sınavlar + öğrenci sayısı + ders kodu
             cur.execute("""
                 SELECT e.id, e.course_id, e.exam_start, c.code,
-                       (SELECT COUNT(*) FROM enrollments en WHERE en.course_id=e.course_id) AS need
+                       (SELECT COUNT(*) FROM enrollments en WHERE en.course_id=e.course_id) AS need,
+                       e.duration_min, e.start_min
                 FROM exams e
                 JOIN courses c ON c.id = e.course_id
                 WHERE c.dept_id=? AND e.room_id IS NULL
-                ORDER BY e.exam_start, c.class_year, c.code
+                ORDER BY e.start_min, c.class_year, c.code
             """, (dept_id,))
             exams = cur.fetchall()
+            code_of = {ex_id: code for ex_id, _, _, code, _, _, _ in exams}
 
-            # aynı anda kullanılan odalar
-            cur.execute("SELECT exam_start, room_id FROM exams WHERE room_id IS NOT NULL")
-            used_by_ts = {}
-            for ts, rid in cur.fetchall():
-                used_by_ts.setdefault(ts, set()).add(rid)
-
-            for ex_id, course_id, ts, code, need in exams:
-                used = used_by_ts.get(ts, set())
-
-                # bu ts'te boş olan odalar
-                candidates = [(rid, rcode, cap) for (rid, rcode, cap) in rooms if rid not in used]
-                if not candidates:
-                    skipped_no_room += 1
-                    examples_noroom.append((code, need, ts))
+            # slot aralığı: başlangıç → o slottaki en uzun sınavın bitişi
+            span_of = {}
+            for _, _, ts, _, _, dur, key in exams:
+                if key is None:
                     continue
-
-                # kapasitesi yetenler
-                fits = [(rid, rcode, cap) for (rid, rcode, cap) in candidates if cap >= need]
-                if not fits:
-                    maxcap = max(c[2] for c in candidates) if candidates else 0
+                s_, e_ = exam_interval(slot_from_key(key), dur)
+                span_of[ts] = (s_, max(e_, span_of.get(ts, (s_, e_))[1]))
+
+            # zamanı örtüşen kullanımlar dolu (bölünmüş parçalar ve diğer bölümler dahil);
+            # farklı başlangıçlı ama örtüşen slotlar birbirinin aldığı dersliği kullanamaz
+            used_by_ts = load_busy_rooms(con, span_of)
+            overlaps = slot_overlaps(span_of)
+
+            jobs = [(ex_id, ts, need) for ex_id, _, ts, _, need, _, _ in exams if ts in span_of]
+            t0 = time.perf_counter()
+            done, failed = assign_rooms(jobs, rooms, used_by_ts, overlaps=overlaps)
+            if solver == "optimal":
+                greedy = room_summary(rooms, done, failed, time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                done, failed = assign_rooms_optimal(jobs, rooms, used_by_ts, overlaps=overlaps)
+                opt = room_summary(rooms, done, failed, time.perf_counter() - t0)
+                compare_line = (
+                    f"Optimal eşleme: {opt['assigned']} atandı, {opt['wasted_seats']} boş koltuk "
+                    f"({opt['elapsed_s'] * 1000:.0f} ms)\n"
+                    f"Greedy olsaydı: {greedy['assigned']} atanır, {greedy['wasted_seats']} boş koltuk "
+                    f"({greedy['elapsed_s'] * 1000:.0f} ms)"
+                )
+            cur.executemany("UPDATE exams SET room_id=? WHERE id=?",
+                            [(parts[0][0], ex_id) for ex_id, parts in done.items() if len(parts) == 1])
+            for ex_id, parts in done.items():
+                if len(parts) > 1:
+                    save_exam_rooms(con, ex_id, parts)
+
+            for ex_id, ts, need, n_free, most in failed:
+                if not n_free:
+                    skipped_no_room += 1
+                    examples_noroom.append((code_of[ex_id], need, ts))
+                else:
                     skipped_capacity += 1
-                    examples_capacity.append((code, need, maxcap, ts))
-                    continue
-
-                # en az kapasiteli uygun oda
-                fits.sort(key=lambda x: x[2])
-                rid, _, _ = fits[0]
-                cur.execute("UPDATE exams SET room_id=? WHERE id=?", (rid, ex_id))
-                used_by_ts.setdefault(ts, set()).add(rid)
-                assigned += 1
+                    examples_capacity.append((code_of[ex_id], need, most, ts))
 
             con.commit()
 
+        assigned = len(done)
+        assigned_split = sum(1 for parts in done.values() if len(parts) > 1)
         lines = [f"Atanan: {assigned}"]
+        if compare_line:
+            lines.append(compare_line)
+        if assigned_split:
+            lines.append(f"Birden çok dersliğe bölünen: {assigned_split}")
         if skipped_no_room or skipped_capacity:
             lines.append(f"Atlanan (boş oda yok): {skipped_no_room}")
             lines.append(f"Atlanan (kapasite yetersiz): {skipped_capacity}")
@@ -908,15 +880,23 @@ class ScheduleView(ttk.Frame):
     def open_constraints(self):
         top = tk.Toplevel(self)
         top.title("Kısıtlar")
-        top.geometry("620x560")  # liste için biraz daha yüksek
+        top.geometry("620x760")  # liste için biraz daha yüksek
 
         # --- Girdi değişkenleri
         v_start = tk.StringVar(value="")
         v_end = tk.StringVar(value="")
         v_cool = tk.StringVar(value=str(self.constraints.get("cooldown_min", 15)))
         v_defdur = tk.StringVar(value=str(self.constraints.get("default_duration", 75)))
+        v_improve = tk.StringVar(value=str(self.constraints.get("improve_seconds", 0)))
+        v_iters = tk.StringVar(value=str(self.constraints.get("improve_iterations") or 0))
+        v_runs = tk.StringVar(value=str(self.constraints.get("multistart_runs", 1)))
         v_single = tk.BooleanVar(value=self.constraints.get("single_exam_at_a_time", False))
+        v_joint = tk.BooleanVar(value=self.constraints.get("joint_rooms", False))
+        solver_labels = {"greedy": "Greedy (hızlı)", "optimal": "Optimal eşleme (numpy/scipy)"}
+        v_solver = tk.StringVar(value=solver_labels.get(self.constraints.get("room_solver", "greedy")))
         v_exam_type = tk.StringVar(value=self.constraints.get("exam_type", "Vize"))
+        strategy_labels = {"greedy": "Greedy (hızlı)", "dsatur": "DSATUR (daha az çakışma)"}
+        v_strategy = tk.StringVar(value=strategy_labels.get(self.constraints.get("strategy", "greedy")))
 
         # --- Tarih aralığı
         frm_dates = ttk.LabelFrame(top, text="Tarih Aralığı")
@@ -956,6 +936,31 @@ class ScheduleView(ttk.Frame):
             values=["Vize", "Final", "Bütünleme"],
             width=18
         ).grid(row=0, column=1, sticky="w", padx=6, pady=4)
+        ttk.Label(frm_type, text="Yerleştirme:").grid(row=1, column=0, sticky="e", padx=6, pady=4)
+        ttk.Combobox(
+            frm_type,
+            textvariable=v_strategy,
+            state="readonly",
+            values=list(strategy_labels.values()),
+            width=26
+        ).grid(row=1, column=1, sticky="w", padx=6, pady=4)
+        ttk.Label(frm_type, text="İyileştirme süresi (sn, 0=kapalı):").grid(row=2, column=0, sticky="e", padx=6, pady=4)
+        ttk.Entry(frm_type, textvariable=v_improve, width=8).grid(row=2, column=1, sticky="w", padx=6, pady=4)
+        ttk.Label(frm_type, text="İyileştirme hamlesi (0=süreye göre; tekrarlanabilir):").grid(
+            row=3, column=0, sticky="e", padx=6, pady=4)
+        ttk.Entry(frm_type, textvariable=v_iters, width=8).grid(row=3, column=1, sticky="w", padx=6, pady=4)
+        ttk.Label(frm_type, text="Paralel deneme sayısı (1=tek):").grid(row=4, column=0, sticky="e", padx=6, pady=4)
+        ttk.Entry(frm_type, textvariable=v_runs, width=8).grid(row=4, column=1, sticky="w", padx=6, pady=4)
+        ttk.Checkbutton(frm_type, text="Derslikleri planla birlikte ata (kapasiteye göre slot seç)",
+                        variable=v_joint).grid(row=5, column=0, columnspan=2, sticky="w", padx=6, pady=4)
+        ttk.Label(frm_type, text="Derslik atama:").grid(row=6, column=0, sticky="e", padx=6, pady=4)
+        ttk.Combobox(
+            frm_type,
+            textvariable=v_solver,
+            state="readonly",
+            values=list(solver_labels.values()),
+            width=26
+        ).grid(row=6, column=1, sticky="w", padx=6, pady=4)
 
         # --- Programdan çıkarılacak dersler
         frm_exclude = ttk.LabelFrame(top, text="Programdan çıkarılacak dersler")
@@ -1018,10 +1023,18 @@ class ScheduleView(ttk.Frame):
             try:
                 self.constraints["default_duration"] = int(v_defdur.get())
                 self.constraints["cooldown_min"] = int(v_cool.get())
+                improve_seconds = max(0.0, float(v_improve.get() or 0))
+                improve_iterations = max(0, int(v_iters.get() or 0))
+                self.constraints["multistart_runs"] = max(1, int(v_runs.get() or 1))
             except ValueError:
-                messagebox.showerror("Hata", "Süre/bekleme sayısal olmalı.")
+                messagebox.showerror("Hata", "Süre/bekleme/iyileştirme/deneme sayısal olmalı.")
                 return
 
+            # hamle sayısı verilirse süre sınırı kapatılır: aynı tohum + hamle → aynı plan (paralel denemeler dahil);
+            # süre sınırı makine yüküne bağlı olduğundan tekrarlanabilir değildir
+            self.constraints["improve_iterations"] = improve_iterations or None
+            self.constraints["improve_seconds"] = 0 if improve_iterations else improve_seconds
+
             selected_labels = [lb_exclude.get(i) for i in lb_exclude.curselection()]
             excluded_ids = {display_to_id[lbl] for lbl in selected_labels}
 
@@ -1029,7 +1042,14 @@ class ScheduleView(ttk.Frame):
             self.constraints["date_end"] = d_end
             self.constraints["exclude_days"] = excl
             self.constraints["single_exam_at_a_time"] = bool(v_single.get())
+            self.constraints["joint_rooms"] = bool(v_joint.get())
+            self.constraints["room_solver"] = next(
+                (k for k, lbl in solver_labels.items() if lbl == v_solver.get()), "greedy"
+            )
             self.constraints["exam_type"] = v_exam_type.get()
+            self.constraints["strategy"] = next(
+                (k for k, lbl in strategy_labels.items() if lbl == v_strategy.get()), "greedy"
+            )
             self.constraints["excluded_courses"] = excluded_ids
 
             messagebox.showinfo("Kısıtlar", "Kısıtlar kaydedildi. Otomatik planlamayı tekrar çalıştırın.")
@@ -5,6 +5,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
 from core.db import get_conn
+from core.scheduler import load_exam_rooms
 
 
 class SeatingView(ttk.Frame):
@@ -23,10 +24,10 @@ class SeatingView(ttk.Frame):
         self.info.pack(fill="x", padx=10, pady=(0,8))
 
         # Liste
-        cols = ("ogr_no","ad_soyad","sira","sutun","koltuk_no")
+        cols = ("ogr_no","ad_soyad","derslik","sira","sutun","koltuk_no")
         self.tree = ttk.Treeview(self, columns=cols, show="headings", height=18)
-        headers = ["Öğrenci No","Ad Soyad","Sıra","Sütun","Koltuk#"]
-        widths  = [120,            260,        80,    80,      80]
+        headers = ["Öğrenci No","Ad Soyad","Derslik","Sıra","Sütun","Koltuk#"]
+        widths  = [120,            260,       90,       80,    80,      80]
         for c, h, w in zip(cols, headers, widths):
             self.tree.heading(c, text=h)
             self.tree.column(c, width=w, stretch=(c in ("ogr_no","ad_soyad")))
@@ -40,33 +41,42 @@ class SeatingView(ttk.Frame):
         if not self.exam:
             return  # _fetch_exam hata mesajını gösteriyor
 
-        room_id = self.exam.get("room_id")
-        if room_id is None:
+        # Derslik parçaları: bölünmüş sınavda birden çok derslik (ana derslik önce)
+        with get_conn() as con:
+            parts = load_exam_rooms(con, self.exam["id"])
+        if not parts:
             messagebox.showwarning("Oturma Planı", "Bu sınava derslik atanmamış. Önce 'Otomatik Oda Ata' yapın veya derslik seçin.")
             return
 
-        self.classroom = self._fetch_classroom(room_id)
-        if not self.classroom:
-            messagebox.showerror("Oturma Planı", f"Derslik bulunamadı (id={room_id}).")
-            return
+        self.classrooms = []
+        for room_id, _seats in parts:
+            room = self._fetch_classroom(room_id)
+            if not room:
+                messagebox.showerror("Oturma Planı", f"Derslik bulunamadı (id={room_id}).")
+                return
+            self.classrooms.append(room)
+        self.classroom = self.classrooms[0]
 
         self.students = self._fetch_students_of_course(self.exam["course_id"])
-        self.assignments = self._assign_students(self.students, self.classroom)
+        self.assignments = self._assign_students_split(self.students, self.classrooms, [s for _, s in parts])
 
         # Listeyi doldur
         for i in self.tree.get_children():
             self.tree.delete(i)
         for seat in self.assignments["seated"]:
-            self.tree.insert("", "end", values=(seat["ogr_no"], seat["ad_soyad"], seat["row"], seat["col"], seat["seat_index"]))
+            self.tree.insert("", "end", values=(seat["ogr_no"], seat["ad_soyad"], seat["room"],
+                                                seat["row"], seat["col"], seat["seat_index"]))
 
         # Üst bilgi
         cap = self.assignments["capacity"]
         n = len(self.students)
         over = max(0, n - cap)
+        room_txt = " + ".join(
+            f"{r['code']} ({r['rows']}×{r['cols']}×{r['seats_per_desk']})" for r in self.classrooms
+        )
         header = (
             f"{self.exam['course_code']} - {self.exam['course_name']}  |  "
-            f"Derslik: {self.classroom['code']} "
-            f"({self.classroom['rows']}×{self.classroom['cols']}×{self.classroom['seats_per_desk']} = kapasite {cap})  |  "
+            f"Derslik: {room_txt} = kapasite {cap}  |  "
             f"Tarih-Saat: {self.exam.get('exam_dt_txt','')}"
         )
         if over > 0:
@@ -259,6 +269,31 @@ class SeatingView(ttk.Frame):
             "unseated": unseated
         }
 
+    def _assign_students_split(self, students, classrooms, seats):
+        """
+        Bölünmüş sınav: öğrenciler (numara sırasıyla) derslik parçalarına ayrılır, her parça
+        kendi dersliğinde _assign_students ile oturtulur. seats[i]: parçanın koltuk payı
+        (0 = bölünmemiş); son derslik kalan herkesi alır, sığmayanlar "overflow" olur.
+        Dönüş: {"capacity", "seated" (seat["room"] ile), "unseated", "overflow", "rooms": [(classroom, seated)]}
+        """
+        students = list(students)
+        out = {"capacity": 0, "seated": [], "unseated": 0, "overflow": [], "rooms": []}
+        start = 0
+        for i, room in enumerate(classrooms):
+            last = i == len(classrooms) - 1
+            take = len(students) - start if last or not seats[i] else seats[i]
+            chunk = students[start:start + take]
+            start += take
+            res = self._assign_students(chunk, room)
+            for seat in res["seated"]:
+                seat["room"] = room.get("code", "")
+            out["capacity"] += res["capacity"]
+            out["seated"].extend(res["seated"])
+            out["unseated"] += res["unseated"]
+            out["overflow"].extend(chunk[res["capacity"]:])
+            out["rooms"].append((room, res["seated"]))
+        return out
+
     # ----------------- PDF Dışa Aktarım -----------------
     def export_pdf(self):
 
@@ -276,8 +311,8 @@ class SeatingView(ttk.Frame):
             return
 
         exam = self.exam
-        room = self.classroom
-        seated = list(self.assignments["seated"])
+        room_pages = self.assignments.get("rooms") or [(self.classroom, self.assignments["seated"])]
+        room, seated = room_pages[0]
         overflow = list(self.assignments.get("overflow", []))
 
         # Çıkış yolu
@@ -422,9 +457,18 @@ class SeatingView(ttk.Frame):
                     c.drawCentredString(cx, cy - gap + 4, lines[0])
                     c.drawCentredString(cx, cy - gap - 4, lines[1])
 
-        # SAYFA 1 — başlık + ızgara
-        grid_top_y = draw_header()
-        draw_grid(grid_top_y)
+        # Her derslik için bir sayfa — başlık + ızgara (çizim yardımcıları aşağıdaki değişkenleri okur)
+        for page_no, (room, seated) in enumerate(room_pages):
+            if page_no:
+                c.showPage()
+            rows = int(room.get("rows") or 1)
+            cols = int(room.get("cols") or 1)
+            spd = int(room.get("seats_per_desk") or 1)
+            desk_w = grid_w / max(cols, 1)
+            desk_h = grid_h / max(rows, 1)
+            seat_offs = seat_offsets(spd)
+            grid_top_y = draw_header()
+            draw_grid(grid_top_y)
 
         # Eğer taşan öğrenci varsa, liste sayfası
         if overflow:
@@ -436,8 +480,9 @@ class SeatingView(ttk.Frame):
             c.setFont("Helvetica", 10)
             c.drawString(left, y, f"Ders: {exam.get('course_code', '')} — {exam.get('course_name', '')}")
             y -= 0.5 * cm
+            room_codes = " + ".join(str(r.get('code', '')) for r, _ in room_pages)
             c.drawString(left, y,
-                         f"Derslik: {room.get('code', '')}  •  Düzen: {rows}×{cols}×{spd}  •  Tarih-Saat: {exam.get('exam_dt_txt', '')}")
+                         f"Derslik: {room_codes}  •  Tarih-Saat: {exam.get('exam_dt_txt', '')}")
             y -= 0.8 * cm
 
             # tablo başlığı
@@ -0,0 +1,26 @@
+# tests/conftest.py
+# Uygulama src/ altından çalışır (core.*, ui.*); testler de aynı kökten içe aktarır.
+# Her test data/app.db yerine geçici bir veritabanı kullanır.
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core import db  # noqa: E402
+
+
+def open_db(path):
+    """path'te şemayı kurar (migration'lar) ve havuzu oraya yönlendirir."""
+    db.configure_pool(path)
+    db.init_db()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "test.db"
+    open_db(path)
+    yield path
+    db.close_pool()
@@ -0,0 +1,63 @@
+# tests/test_conflicts.py — öğrenci çakışma raporu (conflict_report) ile öğrenci başına kaba kuvvet
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+from core.scheduler.conflicts import conflict_report
+
+T0 = datetime(2025, 1, 15, 9, 0)
+
+
+def _brute(enrollments, interval_of):
+    """Her öğrencinin her ders çifti için aralık kesişimi: {frozenset(a, b): ortak}, {öğrenci: çakışma}."""
+    courses = {}
+    for sid, cid in set(enrollments):
+        if cid in interval_of:
+            courses.setdefault(sid, set()).add(cid)
+    per_pair, per_student = Counter(), Counter()
+    for sid, cids in courses.items():
+        cids = sorted(cids)
+        for i, a in enumerate(cids):
+            for b in cids[i + 1:]:
+                (s1, e1), (s2, e2) = interval_of[a], interval_of[b]
+                if s1 < e2 and s2 < e1:
+                    per_pair[frozenset((a, b))] += 1
+                    per_student[sid] += 1
+    return dict(per_pair), dict(per_student)
+
+
+def _instance(rnd):
+    n_courses = rnd.randrange(2, 25)
+    interval_of = {}
+    for cid in range(n_courses):
+        if rnd.random() < 0.9:          # bazı derslerin sınavı yok
+            s = T0 + timedelta(minutes=rnd.randrange(0, 600, 30))
+            interval_of[cid] = (s, s + timedelta(minutes=rnd.choice((45, 60, 75, 120))))
+    enrollments = [(rnd.randrange(60), rnd.randrange(n_courses)) for _ in range(rnd.randrange(200))]
+    return enrollments, interval_of
+
+
+def test_conflict_report_matches_brute_force():
+    rnd = random.Random(11)
+    for _ in range(100):
+        enrollments, interval_of = _instance(rnd)
+        rep = conflict_report(enrollments, interval_of)
+        per_pair, per_student = _brute(enrollments, interval_of)
+
+        assert {frozenset(p): n for p, n in rep["per_pair"].items()} == per_pair
+        assert rep["per_student"] == per_student
+        assert len(rep["details"]) == sum(per_pair.values()) == sum(rep["per_slot"].values())
+        for sid, a, b in rep["details"]:
+            assert interval_of[a][0] <= interval_of[b][0]   # önce başlayan ders önde
+
+
+def test_per_slot_groups_by_earlier_exam():
+    a = (T0, T0 + timedelta(minutes=120))
+    b = (T0 + timedelta(minutes=60), T0 + timedelta(minutes=135))
+    c = (T0 + timedelta(minutes=120), T0 + timedelta(minutes=195))   # a bittiğinde başlar: çakışmaz
+    rep = conflict_report([(1, "A"), (1, "B"), (1, "C"), (2, "A"), (2, "C")],
+                          {"A": a, "B": b, "C": c}, slot_of={"A": "s1", "B": "s2", "C": "s3"})
+    assert rep["per_pair"] == {("A", "B"): 1, ("B", "C"): 1}
+    assert rep["per_slot"] == {"s1": 1, "s2": 1}
+    assert rep["per_student"] == {1: 2}
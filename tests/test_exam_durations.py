@@ -0,0 +1,80 @@
+# tests/test_exam_durations.py — sınav süresi varsayılanı ve eski 120 dk kayıtların düzeltilmesi
+
+import sqlite3
+
+from core import db, migrations, models
+from core.migrations import _fix_legacy_durations
+from core.scheduler import load_conflict_report, load_move_preview
+from core.scheduler.planner import DEFAULT_CONSTRAINTS
+
+
+def _setup(con):
+    cids = [con.execute("INSERT INTO courses(dept_id, code, name, class_year) VALUES (1, ?, ?, 1)",
+                        (code, code)).lastrowid for code in ("A", "B", "C")]
+    sid = con.execute("INSERT INTO students(dept_id, number, full_name, class_year) "
+                      "VALUES (1, '1', 'Öğrenci', 1)").lastrowid
+    con.executemany("INSERT INTO enrollments(student_id, course_id) VALUES (?, ?)", [(sid, c) for c in cids])
+    return cids
+
+
+def test_legacy_grid_rows_backfilled(db_path):
+    with db.get_conn() as con:
+        a, b, c = _setup(con)
+        # eski şema varsayılanıyla (120 dk) yazılmış seri öncesi satırlar
+        con.executemany("INSERT INTO exams(course_id, exam_start, duration_min) VALUES (?, ?, 120)",
+                        [(a, "2025-01-15 15:30"), (b, "2025-01-15 17:00"), (c, "2025-01-16 10:10")])
+        assert len(load_conflict_report(con, 1)["rows"]) == 1   # 15:30–17:30 ile 17:00 sahte örtüşme
+
+        _fix_legacy_durations(con)
+        durations = dict(con.execute("SELECT course_id, duration_min FROM exams"))
+        assert durations == {a: 75, b: 75, c: 120}   # ızgara dışı elle girilmiş süre korunur
+        assert load_conflict_report(con, 1)["rows"] == []
+        # değişen satırlar eski süreleriyle kayıtlı (bilerek 120 verilmiş olanlar görülebilsin)
+        backfill = dict(con.execute("SELECT e.course_id, b.old_duration FROM exam_duration_backfill b "
+                                    "JOIN exams e ON e.id = b.exam_id"))
+        assert backfill == {a: 120, b: 120}
+
+
+def test_schema_default_duration_rebuilt(tmp_path, monkeypatch):
+    # 12. sürümde kalmış, exams.duration_min varsayılanı 120 olan veritabanı
+    path = tmp_path / "old.db"
+    con = sqlite3.connect(path)
+    con.execute("PRAGMA foreign_keys = ON")
+    monkeypatch.setattr(models, "EXAMS_SQL", models.EXAMS_SQL.replace("DEFAULT 75", "DEFAULT 120"))
+    for version, _desc, step in migrations.MIGRATIONS[:12]:
+        step(con)
+        con.execute(f"PRAGMA user_version = {version}")
+    monkeypatch.undo()
+    a, b, _ = _setup(con)
+    rid = con.execute("INSERT INTO classrooms(dept_id, code, name, capacity, rows, cols, seats_per_desk) "
+                      "VALUES (1, 'D1', 'D1', 40, 5, 4, 2)").lastrowid
+    gone = con.execute("INSERT INTO exams(course_id, exam_start) VALUES (?, '2025-01-15 09:00')", (b,)).lastrowid
+    con.execute("DELETE FROM exams WHERE id=?", (gone,))
+    eid = con.execute("INSERT INTO exams(course_id, exam_start, room_id) VALUES (?, '2025-01-15 10:10:00', ?)",
+                      (a, rid)).lastrowid
+    con.execute("INSERT INTO exam_rooms(exam_id, room_id, seats) VALUES (?, ?, 1)", (eid, rid))
+    con.commit()
+
+    assert migrations.migrate(con) == [13]
+    assert con.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+    assert con.execute("PRAGMA foreign_key_check").fetchall() == []
+    assert con.execute("SELECT duration_min, exam_start FROM exams WHERE id=?", (eid,)).fetchone() == \
+        (120, "2025-01-15 10:10")                                  # mevcut satırlar aynen
+    assert con.execute("SELECT exam_id FROM exam_rooms").fetchall() == [(eid,)]
+    new = con.execute("INSERT INTO exams(course_id, exam_start) VALUES (?, '2025-01-16 09:00:00')", (b,)).lastrowid
+    assert new > gone                                                 # silinmiş id tekrar verilmez
+    assert con.execute("SELECT duration_min, exam_start, start_min IS NOT NULL FROM exams WHERE id=?",
+                       (new,)).fetchone() == (75, "2025-01-16 09:00", 1)   # tetikleyiciler yeniden kuruldu
+    con.execute("DELETE FROM exams WHERE id=?", (eid,))
+    assert con.execute("SELECT COUNT(*) FROM exam_rooms").fetchone()[0] == 0   # CASCADE hâlâ exams'a bağlı
+    con.close()
+
+
+def test_new_exam_preview_uses_planner_duration(db_path):
+    with db.get_conn() as con:
+        a, b, _ = _setup(con)
+        con.execute("INSERT INTO exams(course_id, exam_start, duration_min) VALUES (?, '2025-01-15 17:00', 75)", (b,))
+        preview = load_move_preview(con, a, None, 0, DEFAULT_CONSTRAINTS["default_duration"])
+        assert preview.duration == 75
+        start = con.execute("SELECT start_min FROM exams WHERE course_id=?", (b,)).fetchone()[0]
+        assert preview.evaluate(start - 90)["students"] == 0     # 15:30 + 75 dk, 17:00'ye değmez
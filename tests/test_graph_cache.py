@@ -0,0 +1,69 @@
+# tests/test_graph_cache.py — çakışma grafı önbelleğinin geçersiz kılınması (graph_cache)
+
+from conftest import open_db
+from core import db
+from core.importers import import_student_enrollments
+from core.scheduler import graph_cache
+from core.scheduler.graph_cache import cached_conflict_graph
+
+
+def _fill(enrollments):
+    """3 ders + 1 öğrenci; enrollments: [(öğrenci sırası, ders sırası)] → (cids, [(sid, cid)])."""
+    with db.get_conn() as con:
+        cids = []
+        for i in range(1, 4):
+            cur = con.execute("INSERT INTO courses(dept_id, code, name, class_year) VALUES (1, ?, ?, 1)",
+                              (f"C{i}", f"Ders {i}"))
+            cids.append(cur.lastrowid)
+        sid = con.execute("INSERT INTO students(dept_id, number, full_name, class_year) "
+                          "VALUES (1, '1', 'Öğrenci', 1)").lastrowid
+        rows = [(sid, cids[c - 1]) for _, c in enrollments]
+        con.executemany("INSERT INTO enrollments(student_id, course_id) VALUES (?, ?)", rows)
+    return cids, rows
+
+
+def _graph(cids, rows, cache_dir):
+    with db.get_conn() as con:
+        return cached_conflict_graph(con, 1, cids, rows, cache_dir=cache_dir)
+
+
+def test_hit_then_invalidated_by_enrollment_change(db_path, tmp_path):
+    graph_cache.clear_memory()
+    cids, rows = _fill([(1, 1), (1, 2)])
+    _, weights = _graph(cids, rows, tmp_path / "cache")
+    assert weights == {(cids[0], cids[1]): 1}
+
+    hits = graph_cache.stats["hits"]
+    assert _graph(cids, rows, tmp_path / "cache")[1] == weights
+    assert graph_cache.stats["hits"] == hits + 1
+
+    # toplu içe aktarım satır tetikleyicisi olmadan sürümü bir kez artırır
+    with db.get_conn() as con:
+        version = graph_cache.data_version(con)
+        import_student_enrollments(con, 1, [], [("1", "C3")])
+        assert graph_cache.data_version(con) == version + 1
+    rows = rows + [(rows[0][0], cids[2])]
+    _, weights = _graph(cids, rows, tmp_path / "cache")
+    assert (cids[1], cids[2]) in weights
+
+
+def test_recreated_database_does_not_reuse_old_graph(tmp_path):
+    # aynı yolda yeniden kurulan DB: sayaç aynı değere gelse de eski graf dönmemeli
+    path, cache = tmp_path / "app.db", tmp_path / "cache"
+    for keep_memory in (True, False):
+        graph_cache.clear_memory()
+        if path.exists():
+            db.close_pool()
+            path.unlink()
+        open_db(path)
+        cids, rows = _fill([(1, 1), (1, 2)])
+        assert _graph(cids, rows, cache)[1] == {(cids[0], cids[1]): 1}
+
+        db.close_pool()
+        path.unlink()
+        if not keep_memory:
+            graph_cache.clear_memory()   # yalnız disk katmanı
+        open_db(path)
+        cids, rows = _fill([(1, 2), (1, 3)])
+        assert _graph(cids, rows, cache)[1] == {(cids[1], cids[2]): 1}
+    db.close_pool()
@@ -0,0 +1,57 @@
+# tests/test_intervals.py — süreli çakışma: tarama çizgisi ve onarımın çakışan ders seçimi
+
+import random
+from datetime import datetime, timedelta
+
+from core.scheduler.intervals import exam_interval, overlapping_pairs, room_overlaps
+from core.scheduler.repair import conflicting_courses
+
+T0 = datetime(2025, 1, 15, 9, 0)
+
+
+def _at(minutes):
+    return T0 + timedelta(minutes=minutes)
+
+
+def _brute(items):
+    out = set()
+    for i, (a, s1, e1) in enumerate(items):
+        for b, s2, e2 in items[i + 1:]:
+            if s1 < e2 and s2 < e1:
+                out.add(frozenset((a, b)))
+    return out
+
+
+def test_overlapping_pairs_matches_brute_force():
+    rnd = random.Random(7)
+    for _ in range(50):
+        items = []
+        for k in range(rnd.randrange(2, 40)):
+            s = rnd.randrange(0, 600, 15)
+            items.append((k, _at(s), _at(s + rnd.choice((30, 60, 75, 90, 120)))))
+        pairs = overlapping_pairs(items)
+        assert len(pairs) == len(set(map(frozenset, pairs)))           # her çift bir kez
+        assert set(map(frozenset, pairs)) == _brute(items)
+        start = {k: s for k, s, _ in items}
+        assert all(start[a] <= start[b] for a, b in pairs)             # a önce (ya da aynı anda) başlar
+
+
+def test_intervals_are_half_open():
+    # 09:00–10:15 biter bitmez 10:15 başlayan: çakışma yok; 10:14: var
+    a = ("A", *exam_interval(_at(0), 75))
+    assert overlapping_pairs([a, ("B", *exam_interval(_at(75), 75))]) == []
+    assert overlapping_pairs([a, ("C", *exam_interval(_at(74), 75))]) == [("A", "C")]
+
+
+def test_room_overlaps_per_room():
+    usages = [("x", 1, _at(0), _at(120)), ("y", 1, _at(60), _at(135)), ("z", 2, _at(60), _at(135))]
+    assert room_overlaps(usages) == [(1, "x", "y")]
+
+
+def test_conflicting_courses_sees_partial_overlap():
+    # 1 ve 2 ortak öğrencili; farklı slotlarda ama 120 dk süreyle örtüşüyor
+    enrollments = [(10, 1), (10, 2), (11, 2), (12, 3)]
+    existing = {1: _at(0), 2: _at(90), 3: _at(0)}
+    sizes = {1: 1, 2: 2, 3: 1}
+    assert conflicting_courses(enrollments, existing, sizes, duration_min=75) == set()
+    assert conflicting_courses(enrollments, existing, sizes, duration_min=75, durations={1: 120}) == {1}
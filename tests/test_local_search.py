@@ -0,0 +1,49 @@
+# tests/test_local_search.py — yerel aramanın artımlı ceza farkları ile tam hesap (soft_penalty)
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.scheduler.graph import build_conflict_graph
+from core.scheduler.local_search import improve_plan, soft_penalty
+
+
+def _instance(seed, n_courses=40, n_students=60, per=3):
+    """Rastgele kayıtlar + sert kısıtlara uyan başlangıç yerleşimi (komşular ayrı slotta)."""
+    rnd = random.Random(seed)
+    enrollments = {(s, rnd.randrange(n_courses)) for s in range(n_students) for _ in range(per)}
+    neighbors, weights = build_conflict_graph(sorted(enrollments), range(n_courses))
+    day = datetime(2025, 1, 13, 9, 0)
+    slots = [day + timedelta(days=d, minutes=m) for d in range(5) for m in (0, 120, 270, 390)]
+    course_year = {cid: 1 + cid % 4 for cid in range(n_courses) if cid % 7}   # bazılarının yılı yok
+
+    placements = {}
+    for cid in sorted(neighbors, key=lambda c: -len(neighbors[c])):
+        used = {placements[nb] for nb in neighbors[cid] if nb in placements}
+        free = [ts for ts in slots if ts not in used]
+        placements[cid] = rnd.choice(free)
+    return placements, neighbors, weights, course_year, slots
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("constraints", [{}, {"cooldown_min": 180}, {"single_exam_at_a_time": True}])
+def test_tracked_penalty_matches_full_recomputation(seed, constraints):
+    placements, neighbors, weights, course_year, slots = _instance(seed)
+    if constraints.get("single_exam_at_a_time"):
+        placements = dict(list(placements.items())[:len(slots) // 2])
+        placements = {cid: slots[k] for k, cid in enumerate(placements)}
+
+    result, stats = improve_plan(placements, neighbors, weights, course_year, slots, constraints,
+                                 time_budget=0, seed=seed, max_iterations=4000)
+
+    full = soft_penalty(result, neighbors, weights, course_year, slots)["total"]
+    assert stats["accepted"] > 0
+    assert stats["penalty_after"] == full
+    assert stats["penalty_tracked"] == pytest.approx(full)
+    assert full <= stats["penalty_before"] + 1e-9
+    # sert kısıtlar: ortak öğrencili dersler aynı slotta değil
+    assert result.keys() == placements.keys()
+    assert all(result[a] != result[b] for a in result for b in neighbors[a] if b in result)
+    if constraints.get("single_exam_at_a_time"):
+        assert len(set(result.values())) == len(result)
@@ -0,0 +1,24 @@
+# tests/test_multistart.py — çok başlangıçlı planlamanın tekrarlanabilirliği
+
+import random
+from datetime import datetime, timedelta
+
+from core.scheduler.multistart import plan_multistart
+
+
+def _instance(n_courses=30, n_students=200, per=4, seed=3):
+    rnd = random.Random(seed)
+    courses = [(cid, f"C{cid}", 1 + cid % 4) for cid in range(1, n_courses + 1)]
+    enrollments = sorted({(s, rnd.randrange(1, n_courses + 1)) for s in range(n_students) for _ in range(per)})
+    day = datetime(2025, 1, 13, 9, 0)
+    slots = [day + timedelta(days=d, hours=h) for d in range(5) for h in (0, 2, 4, 6)]
+    return courses, enrollments, slots
+
+
+def test_iteration_budget_is_reproducible_across_workers():
+    courses, enrollments, slots = _instance()
+    c = {"improve_iterations": 3000, "improve_seconds": 0}
+    runs = [plan_multistart(courses, enrollments, slots, c, runs=3, base_seed=5, workers=w) for w in (1, 2, 1)]
+    placements = [r["placements"] for r in runs]
+    assert placements[0] == placements[1] == placements[2]
+    assert len({r["metrics"]["multistart"]["best_seed"] for r in runs}) == 1
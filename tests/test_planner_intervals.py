@@ -0,0 +1,86 @@
+# tests/test_planner_intervals.py — planlayıcının süreli (aralık) yerleşimi: default_duration slot aralığından
+# uzun olsa da ortak öğrencili dersler örtüşmez ve arası cooldown'dan kısa kalmaz
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.scheduler.conflicts import conflict_report
+from core.scheduler.graph import build_conflict_graph
+from core.scheduler.intervals import exam_interval, room_overlaps, too_close
+from core.scheduler.planner import plan_exams, plan_metrics
+from core.scheduler.slots import generate_slots
+
+SLOTS = generate_slots({"date_start": datetime(2025, 1, 13), "date_end": datetime(2025, 1, 17)})
+
+
+def _instance(seed=5, n_courses=40, n_students=120, per=3):
+    rnd = random.Random(seed)
+    courses = [(cid, f"C{cid}", 1 + cid % 4) for cid in range(1, n_courses + 1)]
+    enrollments = sorted({(s, rnd.randrange(1, n_courses + 1)) for s in range(n_students) for _ in range(per)})
+    return courses, enrollments
+
+
+def _close_pairs(placements, neighbors, duration, cooldown):
+    """Kaba kuvvet: too_close olan komşu çiftleri."""
+    gap = timedelta(minutes=cooldown)
+    out = set()
+    for a, ta in placements.items():
+        for b in neighbors.get(a, ()):
+            if a < b and b in placements and too_close(*exam_interval(ta, duration),
+                                                       *exam_interval(placements[b], duration), gap):
+                out.add((a, b))
+    return out
+
+
+@pytest.mark.parametrize("strategy", ["greedy", "dsatur"])
+@pytest.mark.parametrize("duration,cooldown", [(75, 0), (120, 0), (150, 0), (120, 30)])
+@pytest.mark.parametrize("improve", [None, 2000])
+def test_neighbours_never_overlap(strategy, duration, cooldown, improve):
+    courses, enrollments = _instance()
+    c = {"strategy": strategy, "default_duration": duration, "cooldown_min": cooldown, "seed": 1,
+         "improve_iterations": improve}
+    res = plan_exams(courses, enrollments, SLOTS, c)
+    neighbors, _ = build_conflict_graph(enrollments)
+
+    assert res["metrics"]["forced"] == 0 and not res["unplaced"]
+    placements = res["placements"]
+    assert _close_pairs(placements, neighbors, duration, cooldown) == set()
+    assert res["metrics"]["conflicts"] == res["metrics"]["cooldown_violations"] == 0
+    report = conflict_report(enrollments, {cid: exam_interval(ts, duration) for cid, ts in placements.items()})
+    assert report["per_pair"] == {}
+    if duration > 90:
+        # 15:30 + 120 > 17:00: aynı gün ikisi birden komşuya verilmez
+        assert not any(placements[a].date() == placements[b].date()
+                       and {placements[a].time().hour, placements[b].time().hour} == {15, 17}
+                       for a, b in ((a, b) for a in placements for b in neighbors.get(a, ()) if a < b))
+
+
+@pytest.mark.parametrize("strategy", ["greedy", "dsatur"])
+def test_single_exam_and_rooms_respect_overlapping_slots(strategy):
+    courses, enrollments = _instance(n_courses=20)
+    rooms = [(1, "A", 60), (2, "B", 40)]
+    c = {"strategy": strategy, "default_duration": 120, "single_exam_at_a_time": True}
+    placements = plan_exams(courses, enrollments, SLOTS, c)["placements"]
+    spans = sorted(exam_interval(ts, 120) for ts in placements.values())
+    assert all(e1 <= s2 for (_, e1), (s2, _) in zip(spans, spans[1:]))
+
+    c = {"strategy": strategy, "default_duration": 120}
+    res = plan_exams(courses, enrollments, SLOTS, c, rooms=rooms)
+    uses = [(cid, rid, *exam_interval(res["placements"][cid], 120))
+            for cid, parts in res["rooms"].items() for rid, _ in parts]
+    assert res["rooms"] and room_overlaps(uses) == []
+
+
+def test_plan_metrics_matches_brute_force():
+    rnd = random.Random(2)
+    courses, enrollments = _instance()
+    neighbors, _ = build_conflict_graph(enrollments)
+    for _ in range(20):
+        placements = {cid: rnd.choice(SLOTS[:12]) for cid, _, _ in courses}
+        duration, cooldown = rnd.choice((75, 120, 150)), rnd.choice((0, 15, 45))
+        m = plan_metrics(placements, neighbors, cooldown, duration)
+        assert m["conflicts"] == len(_close_pairs(placements, neighbors, duration, 0))
+        assert m["cooldown_violations"] == (len(_close_pairs(placements, neighbors, duration, cooldown))
+                                            if cooldown else 0)
@@ -0,0 +1,52 @@
+# tests/test_preview.py — düzenleme önizlemesi ile planlayıcının aynı cooldown/örtüşme tanımını kullanması
+
+import random
+from datetime import datetime, timedelta
+
+from core.scheduler.cooldown import CooldownIndex
+from core.scheduler.intervals import slots_near
+from core.scheduler.preview import MovePreview
+
+T0 = datetime(2025, 1, 13, 9, 0)
+
+
+def _at(minutes):
+    return T0 + timedelta(minutes=minutes)
+
+
+def test_preview_agrees_with_cooldown_index_and_planner():
+    rnd = random.Random(4)
+    for _ in range(200):
+        cooldown = rnd.choice((0, 15, 30, 60))
+        duration = rnd.choice((60, 75, 120))
+        exams = []
+        for k in range(rnd.randrange(1, 6)):
+            s = rnd.randrange(0, 600, 15)
+            exams.append((s, s + rnd.choice((45, 75, 120, 180)), f"N{k}", 1))
+
+        preview = MovePreview(exams, {}, duration, cooldown)
+        # düzenlenen ders (0) tüm komşularına bağlı; her komşu kendi süresiyle yerleşmiş
+        neighbors = {0: {k + 1 for k in range(len(exams))}}
+        neighbors.update({k + 1: {0} for k in range(len(exams))})
+        overlap, near = CooldownIndex(neighbors, 0, duration), CooldownIndex(neighbors, cooldown, duration)
+        for k, (s, e, _, _) in enumerate(exams):
+            overlap.place(k + 1, _at(s), e - s)
+            near.place(k + 1, _at(s), e - s)
+        slots = [_at(m) for m in range(0, 720, 15)]
+
+        for i, ts in enumerate(slots):
+            r = preview.evaluate(int((ts - T0).total_seconds() // 60))
+            assert (r["students"] > 0) == (not overlap.fits(0, ts))
+            assert (r["students"] + r["cooldown"] > 0) == (not near.fits(0, ts))
+            closed = any(i in slots_near(slots, _at(s), _at(e), duration, cooldown) for s, e, _, _ in exams)
+            assert closed == (not near.fits(0, ts))
+
+
+def test_cooldown_is_measured_from_end_to_start():
+    # 09:00–10:15 sınavından sonra 15 dk bekleme: 10:30 uygun, 10:29 değil
+    preview = MovePreview([(0, 75, "A", 3)], {}, 75, 15)
+    assert preview.evaluate(90)["cooldown"] == 0
+    assert preview.evaluate(89)["cooldown_courses"] == [("A", 3)]
+    idx = CooldownIndex({1: {2}, 2: {1}}, 15, 75)
+    idx.place(2, T0)
+    assert idx.fits(1, _at(90)) and not idx.fits(1, _at(89))
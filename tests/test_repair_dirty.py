@@ -0,0 +1,46 @@
+# tests/test_repair_dirty.py — içe aktarmayla kaydı değişen derslerin "Planı Onar"da yeniden yerleşmesi
+
+from core import db
+from core.importers import import_student_enrollments
+from core.scheduler import load_dirty_courses, plan_department, repair_department
+
+STUDENTS = [("1", "Öğrenci 1", 1), ("2", "Öğrenci 2", 1)]
+
+
+def _courses(n=4):
+    with db.get_conn() as con:
+        return [con.execute("INSERT INTO courses(dept_id, code, name, class_year) VALUES (1, ?, ?, 1)",
+                            (f"C{i}", f"Ders {i}")).lastrowid for i in range(1, n + 1)]
+
+
+def _import(enrollments):
+    with db.get_conn() as con:
+        import_student_enrollments(con, 1, STUDENTS, enrollments)
+        return load_dirty_courses(con, 1)
+
+
+def test_import_marks_only_courses_with_new_enrollments(db_path):
+    cids = _courses()
+    assert _import([("1", "C1"), ("2", "C2")]) == {cids[0], cids[1]}
+
+    plan_department(1, {"seed": 0})
+    with db.get_conn() as con:
+        assert load_dirty_courses(con, 1) == set()   # tam plan tüm sınavları yazar
+
+    # aynı dosya yeniden: yeni kayıt yok, işaret yok
+    assert _import([("1", "C1"), ("2", "C2")]) == set()
+    # öğrenci 1 artık C3'ü de alıyor → yalnız C3
+    assert _import([("1", "C1"), ("1", "C3")]) == {cids[2]}
+
+
+def test_repair_replaces_dirty_courses_and_clears_them(db_path):
+    cids = _courses()
+    _import([("1", "C1"), ("1", "C2"), ("2", "C3")])
+    plan_department(1, {"seed": 0})
+
+    dirty = _import([("2", "C4")])
+    assert dirty == {cids[3]}
+    result = repair_department(1, {"seed": 0}, dirty=dirty)
+    assert result["metrics"]["repair"]["dirty"] == 1
+    with db.get_conn() as con:
+        assert load_dirty_courses(con, 1) == set()
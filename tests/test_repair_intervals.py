@@ -0,0 +1,63 @@
+# tests/test_repair_intervals.py — onarım sabit sınavların gerçek aralıklarına (ızgara dışı / uzun) göre yerleştirir
+# ve kendi işaretleyeceği bir çakışma üretmez
+
+from datetime import datetime
+
+import pytest
+
+from core.scheduler.repair import conflicting_courses, repair_plan
+from core.scheduler.slots import generate_slots
+
+SLOTS = generate_slots({"date_start": datetime(2025, 1, 13), "date_end": datetime(2025, 1, 14)})
+DAY1 = datetime(2025, 1, 13)
+
+
+def _at(h, m=0):
+    return DAY1.replace(hour=h, minute=m)
+
+
+def _after_repair(courses, enrollments, existing, durations, constraints):
+    res = repair_plan(courses, enrollments, SLOTS, existing, constraints, durations=durations)
+    plan = dict(existing)
+    plan.update(res["changed"])
+    sizes = {cid: 1 for cid, _, _ in courses}
+    again = conflicting_courses(enrollments, plan, sizes, constraints.get("default_duration"), durations)
+    return res, plan, again
+
+
+@pytest.mark.parametrize("strategy", ["greedy", "dsatur"])
+def test_new_course_avoids_long_and_off_grid_pinned_exams(strategy):
+    # 1: elle 300 dk yapılmış 09:00 sınavı (14:00'e kadar); 2: ızgara dışı 15:45 sınavı
+    courses = [(1, "A", 1), (2, "B", 2), (3, "C", 3)]
+    enrollments = [(10, 1), (10, 3), (11, 2), (11, 3)]
+    existing = {1: _at(9), 2: _at(15, 45)}
+    durations = {1: 300, 2: 75}
+    c = {"strategy": strategy, "cooldown_min": 0}
+    res, plan, again = _after_repair(courses, enrollments, existing, durations, c)
+
+    assert again == set()
+    # 09:00–13:30 A'nın 300 dk'sıyla, 15:30 B'nin 15:45'iyle örtüşür; 17:00 B'nin bitişi (yarı açık aralık)
+    assert plan[3] == _at(17)
+    assert plan[1] == existing[1] and plan[2] == existing[2]
+
+
+@pytest.mark.parametrize("strategy", ["greedy", "dsatur"])
+def test_moved_course_keeps_its_own_duration(strategy):
+    # 1 (300 dk, 09:00) ile 2 (11:00) çakışıyor; hangisi taşınırsa taşınsın yeni yeri kendi süresiyle temiz olmalı
+    courses = [(1, "A", 1), (2, "B", 1), (3, "C", 2)]
+    enrollments = [(10, 1), (10, 2), (11, 1), (11, 3), (12, 2), (12, 3)]
+    existing = {1: _at(9), 2: _at(11), 3: _at(17)}
+    durations = {1: 300, 2: 75, 3: 75}
+    res, plan, again = _after_repair(courses, enrollments, existing, durations, {"strategy": strategy})
+
+    assert res["metrics"]["repair"]["conflicting"] == 1
+    assert res["changed"] and again == set()
+
+
+def test_forced_placement_is_not_written():
+    # tek günlük ızgarada her slotu kapatan uzun sabit sınav: greedy zorlamak yerine yerleştirmez
+    slots = generate_slots({"date_start": DAY1, "date_end": DAY1})
+    courses = [(1, "A", 1), (2, "B", 1)]
+    enrollments = [(10, 1), (10, 2)]
+    res = repair_plan(courses, enrollments, slots, {1: _at(8)}, {"strategy": "greedy"}, durations={1: 720})
+    assert res["changed"] == {} and res["unplaced"] == [2]
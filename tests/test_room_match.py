@@ -0,0 +1,39 @@
+# tests/test_room_match.py — optimal derslik eşlemesi bölünmesi gereken sınavlarda greedy'den kötü olmaz
+
+import random
+
+import pytest
+
+pytest.importorskip("scipy")
+
+from core.scheduler.room_match import assign_rooms_optimal
+from core.scheduler.rooms import assign_rooms
+
+ROOMS = [(1, "D100", 100), (2, "D50", 50), (3, "D20a", 20), (4, "D20b", 20)]
+
+
+def test_split_exam_keeps_the_rooms_it_needs():
+    # 150 kişilik sınav yalnız 100+50'ye sığar; 40 kişilik sınav en az israfla 50'ye gitmek ister
+    # ama 20+20'ye bölünebilir: greedy ikisini de yerleştirir, optimal de yerleştirmeli
+    exams = [(1, "s", 150), (2, "s", 40)]
+    g_assigned, g_failed = assign_rooms(exams, ROOMS)
+    assigned, failed = assign_rooms_optimal(exams, ROOMS, workers=1)
+    assert g_failed == [] and failed == []
+    assert sorted(rid for rid, _ in assigned[1]) == [1, 2]
+    assert sorted(rid for rid, _ in assigned[2]) == [3, 4]
+
+
+@pytest.mark.parametrize("split", [True, False])
+def test_never_leaves_more_exams_than_greedy(split):
+    rnd = random.Random(3)
+    for _ in range(300):
+        rooms = [(rid, f"D{rid}", rnd.choice((20, 30, 40, 50, 80, 100))) for rid in range(1, rnd.randrange(2, 7))]
+        exams = [(eid, "s", rnd.randrange(5, 200)) for eid in range(1, rnd.randrange(1, 6))]
+        _, g_failed = assign_rooms(exams, rooms, split=split)
+        assigned, failed = assign_rooms_optimal(exams, rooms, split=split, workers=1)
+        assert len(failed) <= len(g_failed)
+        used = [rid for parts in assigned.values() for rid, _ in parts]
+        assert len(used) == len(set(used))
+        cap = {r[0]: r[2] for r in rooms}
+        assert all(seats <= cap[rid] for parts in assigned.values() for rid, seats in parts)
+        assert all(sum(s for _, s in assigned[eid]) == need for eid, _, need in exams if eid in assigned)
@@ -0,0 +1,64 @@
+# tests/test_stream_import.py — akış modunda parça parça içe aktarım (core.excel.stream)
+
+import pandas as pd
+
+from core import db
+from core.excel.stream import import_spooled, stream_student_import
+from core.excel.validate import validate_students
+from core.importers import import_student_enrollments
+
+COLMAP = {"Numara": "Numara", "Ad Soyad": "Ad Soyad", "Sınıf(Yıl)": "Sınıf", "Dersler(virgülle kodlar)": "Dersler"}
+
+
+def _workbook(path):
+    rows = [{"Numara": 1000 + i, "Ad Soyad": f"Öğrenci {i}", "Sınıf": 1 + i % 4,
+             "Dersler": "A1, B2" if i % 2 else "B2; C3, X9"} for i in range(11)]
+    rows[3]["Numara"] = None          # satır 5: numara boş
+    rows[8]["Sınıf"] = "yok"          # satır 10: sınıf hatalı
+    pd.DataFrame(rows).to_excel(path, index=False)
+    return path
+
+
+def _setup_courses():
+    with db.get_conn() as con:
+        con.executemany("INSERT INTO courses(dept_id, code, name, class_year) VALUES (1, ?, ?, 1)",
+                        [(c, c) for c in ("A1", "B2", "C3")])
+
+
+def _snapshot():
+    with db.get_conn() as con:
+        return (con.execute("SELECT number, full_name, class_year FROM students ORDER BY number").fetchall(),
+                con.execute("""SELECT s.number, c.code FROM enrollments e JOIN students s ON s.id = e.student_id
+                               JOIN courses c ON c.id = e.course_id ORDER BY 1, 2""").fetchall())
+
+
+def test_stream_matches_dataframe_path(tmp_path):
+    xlsx = _workbook(tmp_path / "ogrenci.xlsx")
+    results = []
+    for mode in ("dataframe", "stream", "spool"):
+        db.configure_pool(tmp_path / f"{mode}.db")
+        db.init_db()
+        _setup_courses()
+        if mode == "dataframe":
+            students, enrollments, errors = validate_students(pd.read_excel(xlsx), COLMAP)
+            with db.get_conn() as con:
+                ok, not_found, missing = import_student_enrollments(
+                    con, 1, students[["number", "full_name", "class_year"]].itertuples(index=False, name=None),
+                    enrollments[["number", "code"]].itertuples(index=False, name=None))
+            rep = {"ok": ok, "warn": 11 - len(students) + not_found, "missing": missing}
+        elif mode == "stream":
+            rep = stream_student_import(str(xlsx), COLMAP, 1, chunk_rows=3)
+            assert rep["error_lines"] == ["satır 5: Numara boş", "satır 10: Sınıf 1–8 arasında olmalı"]
+        else:
+            spool = tmp_path / "batch.pickle"
+            dry = stream_student_import(str(xlsx), COLMAP, chunk_rows=3, spool=str(spool))
+            assert _snapshot() == ([], [])                     # Dry-Run DB'ye yazmaz
+            assert (dry["ok"], dry["warn"], dry["errors"]) == (9, 2, 2)
+            rep = import_spooled(str(spool), 1)
+        results.append(((rep["ok"], rep["warn"], rep["missing"]), _snapshot()))
+        db.close_pool()
+
+    assert results[0] == results[1] == results[2]
+    (ok, warn, missing), (students, enrollments) = results[0]
+    assert (ok, warn, missing) == (9, 2, {"X9"})
+    assert len(students) == 9 and ("1000", "C3") in enrollments